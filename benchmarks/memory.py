@@ -0,0 +1,58 @@
+"""
+Compares the memory usage of many parsed records before and after compact_record(),
+i.e. with pydantic Ref/Lit models and with slotted CompactRef/CompactLit as values.
+
+```
+python benchmarks/memory.py tests/conftest-files/xml-string.xml --copies 1000
+```
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from edmlib import EDM_Parser
+from edmlib.edm.compact import compact_record
+
+
+def measure(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="an edm record (rdf/xml)")
+    parser.add_argument("--copies", type=int, default=1000)
+    args = parser.parse_args()
+
+    with open(args.path, "rb") as file:
+        content = file.read()
+
+    # every record is parsed on its own, as when reading a provider set
+    full = measure(
+        lambda: [EDM_Parser.from_string(content).parse() for _ in range(args.copies)]
+    )
+    compacted = measure(
+        lambda: [
+            compact_record(EDM_Parser.from_string(content).parse())
+            for _ in range(args.copies)
+        ]
+    )
+    print(f"{args.copies} records")
+    print(
+        f"Ref/Lit:               {full / 2**20:8.1f} MiB, {full / args.copies / 1024:6.1f} KiB/record"
+    )
+    print(
+        f"CompactRef/CompactLit: {compacted / 2**20:8.1f} MiB, {compacted / args.copies / 1024:6.1f} KiB/record"
+    )
+
+
+if __name__ == "__main__":
+    main()
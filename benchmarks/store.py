@@ -0,0 +1,63 @@
+"""
+Compares load and parse time and the graph memory of EDM_Parser with rdflib's default Memory store and with
+the EDMParserStore.
+
+```
+python benchmarks/store.py tests/conftest-files/xml-string.xml --repeat 200
+```
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Tuple
+
+from rdflib import Graph
+
+from edmlib import EDM_Parser
+
+
+def measure_memory(content: bytes, store: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    graph = Graph(store=store).parse(data=content, format="xml")
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    return current
+
+
+def measure_time(content: bytes, store: str, repeat: int) -> Tuple[float, float]:
+    """
+    Returns the seconds per record to load the graph and to load and parse it.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        Graph(store=store).parse(data=content, format="xml")
+    load = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeat):
+        EDM_Parser.from_string(content, store=store).parse()  # type: ignore
+    return load / repeat, (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="an edm record (rdf/xml)")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    with open(args.path, "rb") as file:
+        content = file.read()
+    for store in ("default", "EDMParserStore"):
+        memory = measure_memory(content, store)
+        load, parse = measure_time(content, store, args.repeat)
+        print(
+            f"{store:15} graph: {memory / 2**10:8.1f} KiB, load: {load * 1000:6.2f} ms/record, "
+            f"parse: {parse * 1000:6.2f} ms/record"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,3 +18,4 @@ from .edm import (
     Lit,
 )
 from .parser import EDM_Parser
+from .jsonld_parser import EDM_JSONLD_Parser
@@ -0,0 +1,5 @@
+import sys
+
+from edmlib.cli import main
+
+sys.exit(main())
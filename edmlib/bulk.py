@@ -0,0 +1,608 @@
+"""
+Bulk operations over whole feeds of edm records.
+
+validate_feed() validates an iterable of sources one record at a time and streams one compact
+jsonl line per record to the output, while keeping only aggregate counts in memory.
+
+export_records() serializes an iterable of records in a pool of worker processes and writes them
+to NDJSON shards or to one file per record:
+
+```
+summary = export_records(records, "out/", format="framed-json-ld", workers=8)
+```
+"""
+
+import json
+import sys
+import time
+from functools import partial
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+from rdflib import Graph
+from typing_extensions import Self
+
+from edmlib.edm import EDM_Record, ORE_Aggregation
+from edmlib.edm.fingerprint import (
+    FingerprintManifest,
+    raw_fingerprint,
+    record_fingerprint,
+)
+from edmlib.edm.record import get_edm_framer
+from edmlib.edm.validation.issues import EDM_ValidationIssue
+from edmlib.jsonld_parser import EDM_JSONLD_Parser
+from edmlib.parser import EDM_Parser
+from edmlib.partition import GraphPartitioner
+from edmlib.sources import guess_format, open_stream
+
+Source = Union[str, Path, bytes, Tuple[str, bytes], EDM_Record]
+"""
+A single input for the bulk functions: a file path, the raw content of a record, a
+(name, content) tuple, e.g. for a member of an archive, or an already instantiated EDM_Record.
+"""
+
+
+class ValidationSummary(BaseModel):
+    """
+    Running aggregate of a bulk validation. Memory usage does not grow with the number of records,
+    only with the number of distinct error codes.
+    """
+
+    total: int = 0
+    valid: int = 0
+    invalid: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    error_counts: Dict[str, int] = {}
+
+    def add(self, status: str, codes: List[str], seconds: float) -> None:
+        self.total += 1
+        self.seconds += seconds
+        match status:
+            case "valid":
+                self.valid += 1
+            case "invalid":
+                self.invalid += 1
+            case _:
+                self.failed += 1
+        for code, count in Counter(codes).items():
+            self.error_counts[code] = self.error_counts.get(code, 0) + count
+
+
+def get_source_name(source: Source) -> Optional[str]:
+    """
+    Returns a printable name for a source, if it has one.
+    """
+    if isinstance(source, (str, Path)):
+        return str(source)
+    if isinstance(source, tuple):
+        return source[0]
+    return None
+
+
+def read_source(source: Source) -> Tuple[Optional[str], bytes]:
+    """
+    Returns the name and the raw content of a path, bytes or (name, content) source.
+    Compressed files are decompressed.
+    """
+    if isinstance(source, tuple):
+        return source
+    if isinstance(source, bytes):
+        return None, source
+    with open_stream(str(source)) as file:
+        return str(source), file.read()
+
+
+def load_record(content: bytes, format: str = "xml") -> EDM_Record:
+    """
+    Parses the content of a single record. Format is either the name of an rdflib parser plugin,
+    e.g. "xml", "json-ld", "nt" or "turtle", or "json" for the pydantic json dump of an EDM_Record.
+    """
+    if format == "json":
+        return EDM_Record.model_validate_json(content)
+    if format == "json-ld":
+        return EDM_JSONLD_Parser.from_string(content).parse()
+    return EDM_Parser.from_string(content, format=format).parse()  # type: ignore
+
+
+def dump_record(record: EDM_Record, format: str = "xml") -> str:
+    """
+    Serializes a record to a single string. "json", "json-ld" and "framed-json-ld" are written on a
+    single line and "nt" as one line per triple, so that the output of many records can be
+    concatenated into one line-oriented file. "turtle" and "xml" span multiple lines; turtle
+    outputs can still be concatenated into one valid document. split_source() splits such files
+    into single records again.
+    """
+    match format:
+        case "xml":
+            return record.serialize()
+        case "json":
+            return record.model_dump_json(exclude_none=True)
+        case "json-ld":
+            graph = record.get_rdf_graph(relative=True)
+            data = json.loads(graph.serialize(format="json-ld", auto_compact=True))
+            return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        case "framed-json-ld":
+            data = record.get_framed_json_ld()
+            return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        case _:
+            return record.serialize(format=format)
+
+
+def is_json_line(line: bytes) -> bool:
+    try:
+        return isinstance(json.loads(line), dict)
+    except ValueError:
+        return False
+
+
+def split_source(
+    name: str, content: bytes, format: str
+) -> Iterator[Tuple[str, bytes, str]]:
+    """
+    Splits the content of a file with several records into (name, content, format) tuples, one per
+    record. JSON files whose first line is a complete JSON object, e.g. '.jsonl' files or the
+    shards written by export_records(), are split into lines, named '{name}:{line number}'.
+    N-Triples and Turtle files with more than one aggregation are split with GraphPartitioner into
+    n-triples records, named '{name}:{record number}'. Other content is yielded as it is.
+    """
+    if format in ("json", "json-ld"):
+        lines = content.splitlines()
+        if len(lines) > 1 and is_json_line(lines[0]):
+            for number, line in enumerate(lines, start=1):
+                if line.strip():
+                    yield f"{name}:{number}", line, format
+            return
+    elif format in ("nt", "turtle") and content.count(b"Aggregation") > 1:
+        # the class name (or an id) occurs at least once per aggregation, so files with a single
+        # aggregation are mostly recognized without parsing them
+        graph = Graph().parse(data=content, format=format)
+        partitioner = GraphPartitioner(graph)
+        if len(partitioner) > 1:
+            for number, (_, view) in enumerate(partitioner.iter_graphs(), start=1):
+                yield f"{name}:{number}", view.serialize(format="nt").encode(), "nt"
+            return
+    yield name, content, format
+
+
+def get_parser(source: Source, format: Optional[str] = None) -> EDM_Parser:
+    """
+    Returns an EDM_Parser for any of the supported source types. If no format is given,
+    it is guessed from the name of the source.
+    """
+    if isinstance(source, EDM_Record):
+        return EDM_Parser(source.get_rdf_graph())
+    if isinstance(source, (str, Path)):
+        path = str(source)
+        if format is None:
+            format = guess_format(path)
+            if format == "json":
+                # only the start of the file is needed to tell json-ld from a pydantic dump
+                with open_stream(path) as file:
+                    format = guess_format(path, file.read(4096))
+        if format != "json":
+            # compressed files are decompressed while the rdf parser reads them
+            return EDM_Parser.from_file(path, format=format)
+    name, content = read_source(source)
+    format = format or guess_format(name or "", content)
+    if format == "json":
+        return EDM_Parser(EDM_Record.model_validate_json(content).get_rdf_graph())
+    return EDM_Parser.from_string(content, format=format)  # type: ignore
+
+
+def validate_source(source: Source, format: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Validates a single source and returns its report line as a dict with the keys
+    id, source, status ("valid", "invalid" or "failed"), errors and ms.
+    Sources that can't be read or parsed as rdf are reported with status "failed".
+    """
+    start = time.perf_counter()
+    record_id: Optional[str] = None
+    try:
+        parser = get_parser(source, format)
+        issues: List[EDM_ValidationIssue] = parser.validate()
+        aggregations = parser.get_many_ref(ORE_Aggregation)
+        if len(aggregations) == 1:
+            record_id = str(aggregations[0])
+        codes = [issue.code() for issue in issues]
+        status = "invalid" if issues else "valid"
+    except Exception as e:
+        codes = [f"failed:{e.__class__.__name__}"]
+        status = "failed"
+    return {
+        "id": record_id,
+        "source": get_source_name(source),
+        "status": status,
+        "errors": codes,
+        "ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+def validate_feed(
+    sources: Iterable[Source],
+    output: Union[str, Path, IO[str]],
+    format: Optional[str] = None,
+) -> ValidationSummary:
+    """
+    Validates all sources one by one and streams one compact json line per record to output
+    (a path or a text stream). Returns the aggregated ValidationSummary.
+    If no format is given, it is guessed for each source from its name.
+
+    Example line:
+    {"id":"http://uri.test/edm123#Aggregation","source":"rec_1.xml","status":"invalid","errors":["rights:ORE_Aggregation.edm_rights"],"ms":3.2}
+    """
+    summary = ValidationSummary()
+    if isinstance(output, (str, Path)):
+        with open(output, "w", encoding="utf-8") as fp:
+            return validate_feed(sources, fp, format=format)
+
+    for source in sources:
+        line = validate_source(source, format=format)
+        output.write(json.dumps(line, separators=(",", ":"), ensure_ascii=False))
+        output.write("\n")
+        summary.add(line["status"], line["errors"], line["ms"] / 1000)
+    return summary
+
+
+class ChangedRecord(NamedTuple):
+    name: Optional[str]
+    record: EDM_Record
+    raw: str
+    fingerprint: str
+
+
+def iter_changed(
+    sources: Iterable[Source],
+    manifest: FingerprintManifest,
+    format: Optional[str] = None,
+) -> Iterator[ChangedRecord]:
+    """
+    Yields only the new or changed records of the given path, bytes or (name, content) sources.
+
+    Records whose raw bytes are unchanged are skipped before parsing; records that only changed in
+    their serialization (e.g. element order or whitespace) are skipped after parsing, by comparing
+    their record fingerprint with the manifest.
+    The manifest is not updated for yielded records: call manifest.update(...) with the yielded
+    fingerprints once a record has been processed successfully.
+    """
+    for source in sources:
+        name, content = read_source(source)
+        raw = raw_fingerprint(content)
+        if manifest.has_raw(raw):
+            continue
+        record = load_record(
+            content, format=format or guess_format(name or "", content)
+        )
+        fingerprint = record_fingerprint(record)
+        record_id = record.aggregation.id.value
+        if manifest.is_unchanged(record_id, fingerprint):
+            # remember the new raw fingerprint, so that the next run skips it before parsing
+            manifest.update(record_id, fingerprint, raw=raw)
+            continue
+        yield ChangedRecord(name, record, raw, fingerprint)
+
+
+class ShardedWriter:
+    """
+    Writes serialized records to numbered shard files within a directory.
+
+    Line-oriented output is appended to 'part-00000{extension}', 'part-00001{extension}', ... with
+    at most shard_size records each. With per_record=True every record is written to its own file
+    'record-00000000{extension}', grouped into 'part-00000' subdirectories if shard_size is set.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        extension: str,
+        shard_size: Optional[int] = None,
+        per_record: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.extension = extension
+        self.shard_size = shard_size
+        self.per_record = per_record
+        self.count = 0
+        self.shard: Optional[int] = None
+        self.file: Optional[IO[str]] = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, content: str) -> Path:
+        """
+        Writes the content of a single record and returns the path of the file it was written to.
+        """
+        shard = self.count // self.shard_size if self.shard_size else 0
+        if self.per_record:
+            directory = self.directory
+            if self.shard_size:
+                directory = directory / f"part-{shard:05d}"
+                directory.mkdir(exist_ok=True)
+            path = directory / f"record-{self.count:08d}{self.extension}"
+            path.write_text(content, encoding="utf-8")
+        else:
+            if shard != self.shard:
+                self.close()
+                self.shard = shard
+                self.file = open(
+                    self.directory / f"part-{shard:05d}{self.extension}",
+                    "w",
+                    encoding="utf-8",
+                )
+            path = Path(self.file.name)  # type: ignore
+            self.file.write(content.rstrip("\n"))  # type: ignore
+            self.file.write("\n")  # type: ignore
+        self.count += 1
+        return path
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def imap_bounded(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    initializer: Optional[Callable[[], None]] = None,
+    on_error: Optional[Callable[[Any, Exception], Any]] = None,
+) -> Iterator[Any]:
+    """
+    Like map(fn, items), but runs fn in a pool of worker processes if workers > 1.
+    Results are yielded in input order. In contrast to ProcessPoolExecutor.map, items are consumed
+    lazily, with at most max_in_flight (default: 4 * workers) items submitted at a time.
+    fn must be picklable, i.e. a module level function. initializer is called once in each worker
+    process (or once in this process, if workers <= 1) before the first item.
+
+    If on_error is given, an item that fails, in fn or on its way to a worker (e.g. because it
+    cannot be pickled), yields on_error(item, exception) instead of raising. If a worker process
+    dies, the pool is broken: all items in flight fail and the rest go to a new pool.
+    """
+    if workers <= 1:
+        if initializer:
+            initializer()
+        for item in items:
+            if on_error is None:
+                yield fn(item)
+                continue
+            try:
+                result = fn(item)
+            except Exception as e:
+                result = on_error(item, e)
+            yield result
+        return
+
+    max_in_flight = max_in_flight or 4 * workers
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+    pending: Deque[Tuple[Any, Future[Any], ProcessPoolExecutor]] = deque()
+
+    def replace_pool() -> None:
+        nonlocal pool
+        pool.shutdown(wait=False, cancel_futures=True)
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+
+    def submit(item: Any) -> None:
+        try:
+            future = pool.submit(fn, item)
+        except BrokenProcessPool:
+            if on_error is None:
+                raise
+            replace_pool()
+            future = pool.submit(fn, item)
+        pending.append((item, future, pool))
+
+    def next_result() -> Any:
+        item, future, owner = pending.popleft()
+        try:
+            return future.result()
+        except Exception as e:
+            if on_error is None:
+                raise
+            if isinstance(e, BrokenProcessPool) and owner is pool:
+                replace_pool()
+            return on_error(item, e)
+
+    try:
+        for item in items:
+            submit(item)
+            if len(pending) >= max_in_flight:
+                yield next_result()
+        while pending:
+            yield next_result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+class Progress:
+    """
+    Prints the number of processed records and the throughput to a stream (stderr by default)
+    at most once per interval.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        interval: float = 1.0,
+        enabled: bool = True,
+    ) -> None:
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.enabled = enabled
+        self.count = 0
+        self.start = time.perf_counter()
+        self.last = self.start
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.start
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def update(self, n: int = 1) -> None:
+        self.count += n
+        now = time.perf_counter()
+        if self.enabled and now - self.last >= self.interval:
+            self.last = now
+            self.stream.write(f"\r{self.count} records, {self.rate:.1f} records/s")
+            self.stream.flush()
+
+    def close(self) -> None:
+        if self.enabled:
+            elapsed = time.perf_counter() - self.start
+            self.stream.write(
+                f"\r{self.count} records in {elapsed:.1f}s, {self.rate:.1f} records/s\n"
+            )
+            self.stream.flush()
+
+
+LINE_FORMATS = ("json", "json-ld", "framed-json-ld", "nt")
+"""
+Formats of dump_record() that are written on a single line (or as n-triples lines), so that many
+records can be written to one NDJSON file. Records in other formats are written to their own file.
+"""
+
+EXPORT_EXTENSIONS = {
+    "xml": ".xml",
+    "json": ".jsonl",
+    "json-ld": ".jsonld",
+    "framed-json-ld": ".jsonld",
+    "nt": ".nt",
+    "turtle": ".ttl",
+}
+
+
+class ExportSummary(BaseModel):
+    """
+    Counts of a bulk export. Failed records are counted by exception class.
+    """
+
+    total: int = 0
+    exported: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    error_counts: Dict[str, int] = {}
+
+
+def warm_export_caches(format: str) -> None:
+    """
+    Prepares the caches needed for a format once per worker process. A failure, e.g. an
+    unreachable remote context, is not raised here but reported for each record.
+    """
+    if format == "framed-json-ld":
+        try:
+            get_edm_framer().prepare()
+        except Exception:
+            pass
+
+
+def get_export_id(record: EDM_Record) -> Optional[str]:
+    try:
+        return record.aggregation.id.value
+    except Exception:
+        return None
+
+
+def export_record(record: EDM_Record, format: str) -> Dict[str, Any]:
+    """
+    Serializes a single record with dump_record(). Errors are returned instead of raised.
+    """
+    try:
+        return {
+            "id": get_export_id(record),
+            "content": dump_record(record, format=format),
+        }
+    except Exception as e:
+        return export_error(record, e)
+
+
+def export_error(record: EDM_Record, error: Exception) -> Dict[str, Any]:
+    """
+    The result of a record that failed, in export_record() or on its way to a worker process.
+    """
+    return {
+        "id": get_export_id(record),
+        "error": error.__class__.__name__,
+        "message": str(error),
+    }
+
+
+def export_records(
+    records: Iterable[EDM_Record],
+    output: Union[str, Path],
+    format: str = "framed-json-ld",
+    workers: int = 1,
+    per_record: bool = False,
+    shard_size: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    progress: Optional[Progress] = None,
+    errors: Optional[IO[str]] = None,
+) -> ExportSummary:
+    """
+    Serializes records in a pool of worker processes and writes them to a ShardedWriter in the
+    output directory, in input order: as NDJSON shards for the LINE_FORMATS, or one file per record
+    if per_record is set or the format is multi-line (e.g. "xml"). Records are consumed lazily and
+    at most max_in_flight records are in the pool at a time, so memory usage does not grow with
+    the number of records.
+
+    Records that fail to serialize are skipped and reported as one json line each to errors
+    (if given), e.g. {"index":12,"id":"http://uri.test/edm123#Aggregation","error":"KeyError",...}.
+    """
+    start = time.perf_counter()
+    summary = ExportSummary()
+    writer = ShardedWriter(
+        output,
+        EXPORT_EXTENSIONS.get(format, f".{format}"),
+        shard_size=shard_size,
+        per_record=per_record or format not in LINE_FORMATS,
+    )
+    results = imap_bounded(
+        partial(export_record, format=format),
+        records,
+        workers=workers,
+        max_in_flight=max_in_flight,
+        initializer=partial(warm_export_caches, format),
+        on_error=export_error,
+    )
+    with writer:
+        for index, result in enumerate(results):
+            summary.total += 1
+            if "error" in result:
+                summary.failed += 1
+                code = result["error"]
+                summary.error_counts[code] = summary.error_counts.get(code, 0) + 1
+                if errors is not None:
+                    line = {"index": index, **result}
+                    errors.write(
+                        json.dumps(line, separators=(",", ":"), ensure_ascii=False)
+                    )
+                    errors.write("\n")
+            else:
+                writer.write(result["content"])
+                summary.exported += 1
+            if progress:
+                progress.update()
+    summary.seconds = time.perf_counter() - start
+    return summary
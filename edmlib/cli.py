@@ -0,0 +1,265 @@
+"""
+Command line interface for bulk validation, conversion and statistics of edm records.
+
+```
+edmlib validate records/ harvest.tar.gz --workers 4 --output report.jsonl
+edmlib convert "records/**/*.xml" --to ntriples --output out/ --shard-size 10000
+edmlib stats harvest.zip
+cat record.xml | edmlib validate -
+```
+
+Inputs can be files, directories (searched recursively), glob patterns, tar/zip archives
+or '-' for a single record on stdin.
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from edmlib.bulk import (
+    Progress,
+    ShardedWriter,
+    ValidationSummary,
+    dump_record,
+    imap_bounded,
+    load_record,
+    split_source,
+    validate_source,
+)
+from edmlib.sources import guess_format, iter_sources
+
+FORMATS = {
+    "xml": "xml",
+    "jsonld": "json-ld",
+    "ntriples": "nt",
+    "turtle": "turtle",
+    "json": "json",
+}
+"""
+Maps the format names of the command line to the format names of edmlib.bulk.
+"""
+
+EXTENSIONS = {
+    "xml": ".xml",
+    "jsonld": ".jsonld",
+    "ntriples": ".nt",
+    "turtle": ".ttl",
+    "json": ".jsonl",
+}
+
+Task = Tuple[str, bytes, str, Optional[str]]
+"""
+(name, content, input format, output format) – the unit of work sent to the worker processes.
+"""
+
+
+def run_validate(task: Task) -> Dict[str, Any]:
+    name, content, in_format, _ = task
+    return validate_source((name, content), format=in_format)
+
+
+def run_convert(task: Task) -> Dict[str, Any]:
+    name, content, in_format, out_format = task
+    try:
+        record = load_record(content, format=in_format)
+        return {"source": name, "content": dump_record(record, format=out_format)}  # type: ignore
+    except Exception as e:
+        return {"source": name, "error": f"{e.__class__.__name__}: {e}"}
+
+
+def run_stats(task: Task) -> Dict[str, Any]:
+    name, content, in_format, _ = task
+    try:
+        record = load_record(content, format=in_format)
+    except Exception as e:
+        return {"source": name, "error": e.__class__.__name__}
+    aggregation = record.aggregation
+    return {
+        "source": name,
+        "edm_type": record.provided_cho.edm_type.value,
+        "data_provider": aggregation.edm_dataProvider.value,
+        "rights": aggregation.edm_rights.value,
+        "classes": Counter(instance.label for instance in record.iter_instances()),
+    }
+
+
+def iter_tasks(
+    inputs: Sequence[str], in_format: Optional[str], out_format: Optional[str]
+) -> Iterator[Task]:
+    for name, content in iter_sources(inputs):
+        fmt = FORMATS[in_format] if in_format else guess_format(name, content)
+        # shards, e.g. of a previous convert, hold many records
+        for record_name, record_content, record_format in split_source(
+            name, content, fmt
+        ):
+            yield record_name, record_content, record_format, out_format
+
+
+def get_writer(args: argparse.Namespace, extension: str) -> Optional[ShardedWriter]:
+    if args.shard_size:
+        return ShardedWriter(args.output, extension, shard_size=args.shard_size)
+    return None
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    summary = ValidationSummary()
+    progress = Progress(enabled=not args.quiet)
+    writer = get_writer(args, ".jsonl")
+    output = None
+    if not writer:
+        output = (
+            sys.stdout
+            if args.output == "-"
+            else open(args.output, "w", encoding="utf-8")
+        )
+
+    tasks = iter_tasks(args.inputs, args.from_format, None)
+    try:
+        for line in imap_bounded(run_validate, tasks, workers=args.workers):
+            content = json.dumps(line, separators=(",", ":"), ensure_ascii=False)
+            if writer:
+                writer.write(content)
+            else:
+                output.write(content + "\n")  # type: ignore
+            summary.add(line["status"], line["errors"], line["ms"] / 1000)
+            progress.update()
+    finally:
+        progress.close()
+        if writer:
+            writer.close()
+        elif output is not sys.stdout:
+            output.close()  # type: ignore
+
+    if not args.quiet:
+        sys.stderr.write(summary.model_dump_json(indent=2) + "\n")
+    return 0 if summary.total == summary.valid else 1
+
+
+def cmd_convert(args: argparse.Namespace) -> int:
+    out_format = FORMATS[args.to]
+    writer = ShardedWriter(
+        args.output,
+        EXTENSIONS[args.to],
+        shard_size=args.shard_size,
+        per_record=args.to == "xml",
+    )
+    progress = Progress(enabled=not args.quiet)
+    failed = 0
+    tasks = iter_tasks(args.inputs, args.from_format, out_format)
+    try:
+        for result in imap_bounded(run_convert, tasks, workers=args.workers):
+            if "error" in result:
+                failed += 1
+                sys.stderr.write(f"\n{result['source']}: {result['error']}\n")
+            else:
+                writer.write(result["content"])
+            progress.update()
+    finally:
+        progress.close()
+        writer.close()
+    return 0 if not failed else 1
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    progress = Progress(enabled=not args.quiet)
+    stats: Dict[str, Any] = {
+        "records": 0,
+        "failed": 0,
+        "edm_type": Counter(),
+        "data_provider": Counter(),
+        "rights": Counter(),
+        "classes": Counter(),
+    }
+    tasks = iter_tasks(args.inputs, args.from_format, None)
+    for result in imap_bounded(run_stats, tasks, workers=args.workers):
+        stats["records"] += 1
+        progress.update()
+        if "error" in result:
+            stats["failed"] += 1
+            continue
+        for key in ["edm_type", "data_provider", "rights"]:
+            stats[key][result[key]] += 1
+        stats["classes"].update(result["classes"])
+    progress.close()
+    json.dump(stats, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 0
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="edmlib",
+        description="Bulk validation, conversion and statistics for edm records.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "inputs",
+        nargs="+",
+        help="files, directories, glob patterns, tar/zip archives or '-' for stdin",
+    )
+    common.add_argument(
+        "--from",
+        dest="from_format",
+        choices=list(FORMATS),
+        default=None,
+        help="input format (default: guessed from the file extension)",
+    )
+    common.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+    common.add_argument(
+        "--quiet", action="store_true", help="no progress and summary on stderr"
+    )
+
+    validate = subparsers.add_parser(
+        "validate", parents=[common], help="validate records and write a jsonl report"
+    )
+    validate.add_argument(
+        "--output",
+        "-o",
+        default="-",
+        help="report file, '-' for stdout, or a directory if --shard-size is given",
+    )
+    validate.add_argument(
+        "--shard-size", type=int, default=None, help="report lines per shard file"
+    )
+    validate.set_defaults(func=cmd_validate)
+
+    convert = subparsers.add_parser(
+        "convert", parents=[common], help="convert records to another format"
+    )
+    convert.add_argument(
+        "--to", choices=list(FORMATS), required=True, help="output format"
+    )
+    convert.add_argument("--output", "-o", required=True, help="output directory")
+    convert.add_argument(
+        "--shard-size", type=int, default=None, help="records per shard"
+    )
+    convert.set_defaults(func=cmd_convert)
+
+    stats = subparsers.add_parser(
+        "stats", parents=[common], help="print aggregate statistics as json"
+    )
+    stats.set_defaults(func=cmd_stats)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = get_argument_parser()
+    args = parser.parse_args(argv)
+    if args.command == "validate" and args.shard_size and args.output == "-":
+        parser.error("--shard-size requires --output to be a directory")
+    try:
+        return args.func(args)
+    except OSError as e:
+        sys.stderr.write(f"edmlib: {e}\n")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
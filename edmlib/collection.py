@@ -0,0 +1,188 @@
+"""
+In-memory collection of records with hash indexes on commonly queried fields.
+
+```
+collection = RecordCollection(records)
+collection.count(data_provider="Albertina", edm_type="IMAGE")
+collection.facets("rights", data_provider="Albertina")
+for record in collection.filter(edm_type=["IMAGE", "TEXT"], year=1506):
+    ...
+```
+
+Criteria on different fields are combined with AND, multiple values for the same field with OR.
+"""
+
+import re
+from collections import Counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from edmlib.edm import EDM_Record
+
+YEAR_PATTERN = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+
+
+def get_values(value: Any) -> List[str]:
+    """
+    Returns the string values of a single Ref/Lit, a list of them or None.
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [el.value for el in value]
+    return [value.value]
+
+
+def get_years(record: EDM_Record) -> List[str]:
+    """
+    Returns all four-digit years found in dc_date, dcterms_created and dcterms_issued of the providedCHO.
+    """
+    cho = record.provided_cho
+    years: List[str] = []
+    for value in (
+        get_values(cho.dc_date)
+        + get_values(cho.dcterms_created)
+        + get_values(cho.dcterms_issued)
+    ):
+        years.extend(YEAR_PATTERN.findall(value))
+    return years
+
+
+INDEXES: Dict[str, Callable[[EDM_Record], Iterable[str]]] = {
+    "aggregation_id": lambda record: [record.aggregation.id.value],
+    "cho_id": lambda record: [record.provided_cho.id.value],
+    "data_provider": lambda record: get_values(record.aggregation.edm_dataProvider),
+    "edm_type": lambda record: get_values(record.provided_cho.edm_type),
+    "rights": lambda record: get_values(record.aggregation.edm_rights),
+    "language": lambda record: get_values(record.provided_cho.dc_language),
+    "year": get_years,
+}
+"""
+The default indexes of a RecordCollection: maps index names to functions that return the
+indexed values of a record.
+"""
+
+Criterion = Union[str, int, Iterable[Union[str, int]]]
+
+
+class RecordCollection:
+    """
+    Holds records by their aggregation id and keeps one hash index (value -> ids) per entry of
+    indexes. Adding a record with an id that is already contained replaces the old record.
+    Filtered records are returned in insertion order.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[EDM_Record] = (),
+        indexes: Optional[Dict[str, Callable[[EDM_Record], Iterable[str]]]] = None,
+    ) -> None:
+        self.index_functions = dict(indexes if indexes is not None else INDEXES)
+        self.records: Dict[str, EDM_Record] = {}
+        self.order: Dict[str, int] = {}
+        self.indexed_values: Dict[str, Dict[str, Set[str]]] = {}
+        self.counter = 0
+        self.indexes: Dict[str, Dict[str, Set[str]]] = {
+            name: {} for name in self.index_functions
+        }
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.records
+
+    def __iter__(self) -> Iterator[EDM_Record]:
+        return iter(self.records.values())
+
+    def get(self, record_id: str) -> Optional[EDM_Record]:
+        return self.records.get(record_id)
+
+    def add(self, record: EDM_Record) -> None:
+        record_id = record.aggregation.id.value
+        if record_id in self.records:
+            self.remove(record_id)
+        self.records[record_id] = record
+        self.order[record_id] = self.counter
+        self.counter += 1
+        # keep the indexed values, so that entries are removed correctly even if the record was modified
+        values = self.indexed_values[record_id] = {
+            name: set(function(record))
+            for name, function in self.index_functions.items()
+        }
+        for name, index_values in values.items():
+            index = self.indexes[name]
+            for value in index_values:
+                index.setdefault(value, set()).add(record_id)
+
+    def remove(self, record_id: str) -> EDM_Record:
+        """
+        Removes a record and its index entries. Raises a KeyError if it is not contained.
+        """
+        record = self.records.pop(record_id)
+        del self.order[record_id]
+        for name, index_values in self.indexed_values.pop(record_id).items():
+            index = self.indexes[name]
+            for value in index_values:
+                ids = index[value]
+                ids.discard(record_id)
+                if not ids:
+                    del index[value]
+        return record
+
+    def find_ids(self, **criteria: Criterion) -> Set[str]:
+        """
+        Returns the ids of all records matching the criteria, e.g. find_ids(edm_type="IMAGE").
+        Raises a KeyError for criteria without an index.
+        """
+        if not criteria:
+            return set(self.records)
+        candidates: List[Set[str]] = []
+        for name, criterion in criteria.items():
+            index = self.indexes[name]
+            values = (
+                [criterion] if isinstance(criterion, (str, int)) else list(criterion)
+            )
+            if len(values) == 1:
+                ids = index.get(str(values[0]), set())
+            else:
+                ids = set().union(*(index.get(str(value), set()) for value in values))
+            if not ids:
+                return set()
+            candidates.append(ids)
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+
+    def filter(self, **criteria: Criterion) -> Iterator[EDM_Record]:
+        for record_id in sorted(self.find_ids(**criteria), key=self.order.__getitem__):
+            yield self.records[record_id]
+
+    def count(self, **criteria: Criterion) -> int:
+        return len(self.find_ids(**criteria))
+
+    def facets(self, name: str, **criteria: Criterion) -> Counter:
+        """
+        Counts the matching records per value of the index 'name', e.g.
+        facets("edm_type", data_provider="Albertina") -> Counter({"IMAGE": 120, "TEXT": 3}).
+        """
+        ids = self.find_ids(**criteria)
+        index = self.indexes[name]
+        if len(ids) == len(self.records):
+            return Counter({value: len(matches) for value, matches in index.items()})
+        counts: Counter = Counter()
+        for value, matches in index.items():
+            count = len(matches & ids)
+            if count:
+                counts[value] = count
+        return counts
@@ -3,9 +3,14 @@ from rdflib import Literal, URIRef
 
 
 from .enums import EDM_Namespace, XSD_Types
-from .record import EDM_Record
+from .record import EDM_Record, add_records_to_graph
 from .value_types import MixedValuesList, Lit, Ref
 from .validation.uri import is_valid_uri
+from .validation.issues import EDM_ValidationIssue, ISSUE_KIND
+from .validation.integrity import ReferentialIntegrityReport, check_referential_integrity
+from .diff import EDM_Changeset, diff_records
+from .codec import decode_record, encode_record
+from .compact import CompactLit, CompactRef, compact
 
 from .classes import (
     CC_License,
@@ -40,4 +45,16 @@ __all__ = [
     "Lit",
     "Ref",
     "is_valid_uri",
+    "ReferentialIntegrityReport",
+    "check_referential_integrity",
+    "EDM_ValidationIssue",
+    "ISSUE_KIND",
+    "EDM_Changeset",
+    "diff_records",
+    "encode_record",
+    "decode_record",
+    "CompactRef",
+    "CompactLit",
+    "compact",
+    "add_records_to_graph",
 ]
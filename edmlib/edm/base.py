@@ -1,10 +1,13 @@
-from typing import Any, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 from rdflib import RDF, URIRef
-from edmlib.edm.value_types import Ref
+from edmlib.edm.value_types import AnyRef
 from pydantic import BaseModel
 
 from .enums import EDM_Namespace
 
+# Class- and property-URIRefs per edm-class, see EDM_BaseClass.get_rdf_terms().
+_rdf_terms: Dict[type, Tuple[URIRef, List[Tuple[str, URIRef]]]] = {}
+
 
 class EDM_BaseClass(BaseModel):
     """
@@ -16,7 +19,7 @@ class EDM_BaseClass(BaseModel):
 
     # model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    id: Ref
+    id: AnyRef
 
     @classmethod
     def get_class_ref(cls):
@@ -29,6 +32,39 @@ class EDM_BaseClass(BaseModel):
         else:
             raise Exception(f"Could not convert {cls.__name__} to URIRef.")
 
+    @classmethod
+    def get_rdf_terms(cls) -> Tuple[URIRef, List[Tuple[str, URIRef]]]:
+        """
+        Returns the class-URIRef and the (field name, property-URIRef) pairs of all fields except id.
+        They are computed only once per class.
+        """
+        terms = _rdf_terms.get(cls)
+        if terms is None:
+            properties = [
+                (name, URIRef(EDM_Namespace.get_from_name(name, return_full_uri=True)))
+                for name in cls.model_fields
+                if name != "id"
+            ]
+            terms = _rdf_terms[cls] = (cls.get_class_ref(), properties)
+        return terms
+
+    def iter_rdf_triples(self) -> Iterator[Tuple[Any, Any, Any]]:
+        """
+        Yields the same triples as get_triples(), but with the precomputed terms of get_rdf_terms().
+        """
+        subject = URIRef(self.id.value)
+        class_ref, properties = self.get_rdf_terms()
+        yield subject, RDF.type, class_ref
+        for name, prop in properties:
+            value = getattr(self, name)
+            if not value:
+                continue
+            if isinstance(value, list):
+                for val in value:
+                    yield subject, prop, val.to_rdflib()
+            else:
+                yield subject, prop, value.to_rdflib()
+
     @property
     def label(self):
         label = self.__class__.__name__
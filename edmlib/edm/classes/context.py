@@ -1,6 +1,6 @@
 from typing import Any, List, Optional, Union, Self  # type: ignore
 from pydantic import model_validator
-from ..value_types import MixedValuesList, Lit, Ref
+from ..value_types import AnyLit, AnyRef, MixedValuesList
 from ..base import EDM_BaseClass
 
 
@@ -13,7 +13,7 @@ class SKOS_Concept(EDM_BaseClass):
 
     """
 
-    skos_prefLabel: Optional[List[Lit]] = None
+    skos_prefLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     recommended
@@ -36,7 +36,7 @@ class SKOS_Concept(EDM_BaseClass):
 	B and Metadata Tier C
     """
 
-    skos_altLabel: Optional[List[Lit]] = None
+    skos_altLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     recommended
@@ -55,7 +55,7 @@ class SKOS_Concept(EDM_BaseClass):
 	d property for this class.
     """
 
-    skos_broader: Optional[List[Ref]] = None
+    skos_broader: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -74,7 +74,7 @@ class SKOS_Concept(EDM_BaseClass):
 	er B and Metadata Tier C
     """
 
-    skos_narrower: Optional[List[Ref]] = None
+    skos_narrower: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -92,7 +92,7 @@ class SKOS_Concept(EDM_BaseClass):
 	y Metadata Tier B and Metadata Tier C
     """
 
-    skos_related: Optional[List[Ref]] = None
+    skos_related: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -110,7 +110,7 @@ class SKOS_Concept(EDM_BaseClass):
 	tadata Tier B and Metadata Tier C
     """
 
-    skos_broadMatch: Optional[List[Ref]] = None
+    skos_broadMatch: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -129,7 +129,7 @@ class SKOS_Concept(EDM_BaseClass):
 	atch.term/”/>`
     """
 
-    skos_narrowMatch: Optional[List[Ref]] = None
+    skos_narrowMatch: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -148,7 +148,7 @@ class SKOS_Concept(EDM_BaseClass):
 	atch.term/”/>`
     """
 
-    skos_relatedMatch: Optional[List[Ref]] = None
+    skos_relatedMatch: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -167,7 +167,7 @@ class SKOS_Concept(EDM_BaseClass):
 	atch.term/”/>`
     """
 
-    skos_exactMatch: Optional[List[Ref]] = None
+    skos_exactMatch: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -186,7 +186,7 @@ class SKOS_Concept(EDM_BaseClass):
 	, more specifically Metadata Tier B and Metadata Tier C
     """
 
-    skos_closeMatch: Optional[List[Ref]] = None
+    skos_closeMatch: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -205,7 +205,7 @@ class SKOS_Concept(EDM_BaseClass):
 	, more specifically Metadata Tier B and Metadata Tier C
     """
 
-    skos_note: Optional[List[Lit]] = None
+    skos_note: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -224,7 +224,7 @@ class SKOS_Concept(EDM_BaseClass):
 	irements, more specifically Metadata Tier B and Metadata Tier C.
     """
 
-    skos_notation: Optional[List[Lit]] = None
+    skos_notation: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -242,7 +242,7 @@ class SKOS_Concept(EDM_BaseClass):
 	http://www.w3.org/2001/XMLSchema#int”>123</skos:notation>`
     """
 
-    skos_inScheme: Optional[List[Ref]] = None
+    skos_inScheme: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -260,7 +260,7 @@ class SKOS_Concept(EDM_BaseClass):
 
     @model_validator(mode="after")
     def validate_skos_pref_label(self) -> Self:
-        pref_label: Optional[list[Lit]] = getattr(self, "skos_prefLabel")
+        pref_label: Optional[list[AnyLit]] = getattr(self, "skos_prefLabel")
         if pref_label and isinstance(pref_label, list) and len(pref_label) > 1:
             tag_set = {label.lang for label in pref_label if label.lang}
             assert (
@@ -278,7 +278,7 @@ class EDM_Agent(EDM_BaseClass):
 
     """
 
-    skos_prefLabel: Optional[List[Lit]] = None
+    skos_prefLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     recommended
@@ -301,7 +301,7 @@ class EDM_Agent(EDM_BaseClass):
 	C
     """
 
-    skos_altLabel: Optional[List[Lit]] = None
+    skos_altLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     recommended
@@ -319,7 +319,7 @@ class EDM_Agent(EDM_BaseClass):
 	Augte. Courtois aîné</skos:altLabel>`
     """
 
-    skos_note: Optional[List[Lit]] = None
+    skos_note: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -354,7 +354,7 @@ class EDM_Agent(EDM_BaseClass):
 	ISO 8601 starting with the year and with hyphens (YYYY-MM-DD).`<dc:date>1803</dc:date/>`
     """
 
-    dc_identifier: Optional[List[Lit]] = None
+    dc_identifier: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -371,7 +371,7 @@ class EDM_Agent(EDM_BaseClass):
 	er>`
     """
 
-    dcterms_hasPart: Optional[List[Ref]] = None
+    dcterms_hasPart: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -388,7 +388,7 @@ class EDM_Agent(EDM_BaseClass):
 	oration).`<dcterms:hasPart rdf:resource=“http://identifier/partOfCorporation/”>`
     """
 
-    dcterms_isPartOf: Optional[List[Ref]] = None
+    dcterms_isPartOf: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -405,7 +405,7 @@ class EDM_Agent(EDM_BaseClass):
 	ce=“http://identifier/parentCorporation/”>`
     """
 
-    edm_begin: Optional[Lit] = None
+    edm_begin: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -426,7 +426,7 @@ class EDM_Agent(EDM_BaseClass):
 	 more specifically Metadata Tier B and Metadata Tier C
     """
 
-    edm_end: Optional[Lit] = None
+    edm_end: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -445,7 +445,7 @@ class EDM_Agent(EDM_BaseClass):
 	 , more specifically Metadata Tier B and Metadata Tier C
     """
 
-    edm_hasMet: Optional[List[Ref]] = None
+    edm_hasMet: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -462,7 +462,7 @@ class EDM_Agent(EDM_BaseClass):
 	reference to a Place class`<edm:hasMet rdf:resource=“http://sws.geonames.org/6620265/”>`
     """
 
-    edm_isRelatedTo: Optional[List[Ref]] = None
+    edm_isRelatedTo: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -479,7 +479,7 @@ class EDM_Agent(EDM_BaseClass):
 	 in a generic sense.`<edm:isRelatedTo rdf:resource=“http://identifier/relatedAgent/”>`
     """
 
-    foaf_name: Optional[List[Lit]] = None
+    foaf_name: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -496,7 +496,7 @@ class EDM_Agent(EDM_BaseClass):
 	e>`
     """
 
-    rdagr2_biographicalInformation: Optional[List[Lit]] = None
+    rdagr2_biographicalInformation: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -514,7 +514,7 @@ class EDM_Agent(EDM_BaseClass):
 	ments in Paris in 1803</rdaGr2:biographicalInformation>`
     """
 
-    rdagr2_dateOfBirth: Optional[Lit] = None
+    rdagr2_dateOfBirth: Optional[AnyLit] = None
     """
     Mandate: 
     recommended
@@ -534,7 +534,7 @@ class EDM_Agent(EDM_BaseClass):
 	tadata Tier C
     """
 
-    rdagr2_dateOfDeath: Optional[Lit] = None
+    rdagr2_dateOfDeath: Optional[AnyLit] = None
     """
     Mandate: 
     recommended
@@ -554,7 +554,7 @@ class EDM_Agent(EDM_BaseClass):
 	r C
     """
 
-    rdagr2_dateOfEstablishment: Optional[Lit] = None
+    rdagr2_dateOfEstablishment: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -571,7 +571,7 @@ class EDM_Agent(EDM_BaseClass):
 	Establishment>1795</rdaGr2:dateOfEstablishment>`
     """
 
-    rdagr2_dateOfTermination: Optional[Lit] = None
+    rdagr2_dateOfTermination: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -588,7 +588,7 @@ class EDM_Agent(EDM_BaseClass):
 	fTermination>1895</rdaGr2:dateOfTermination>`
     """
 
-    rdagr2_gender: Optional[Lit] = None
+    rdagr2_gender: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -604,7 +604,7 @@ class EDM_Agent(EDM_BaseClass):
     The gender with which the agent identifies.`< rdaGr2:gender>Female</rdaGr2:gender>`
     """
 
-    rdagr2_placeOfBirth: Optional[Union[Lit, Ref]] = None
+    rdagr2_placeOfBirth: Optional[Union[AnyLit, AnyRef]] = None
     """
     Mandate: 
     optional
@@ -623,7 +623,7 @@ class EDM_Agent(EDM_BaseClass):
 	 A-C requirements , more specifically Metadata Tier B and Metadata Tier C
     """
 
-    rdagr2_placeOfDeath: Optional[Union[Lit, Ref]] = None
+    rdagr2_placeOfDeath: Optional[Union[AnyLit, AnyRef]] = None
     """
     Mandate: 
     optional
@@ -659,7 +659,7 @@ class EDM_Agent(EDM_BaseClass):
 	OrOccupation>Instrument Maker</rdaGr2:professionOrOccupation>`
     """
 
-    owl_sameAs: Optional[List[Ref]] = None
+    owl_sameAs: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -678,7 +678,7 @@ class EDM_Agent(EDM_BaseClass):
 
     @model_validator(mode="after")
     def validate_skos_pref_label(self) -> Self:
-        pref_label: Optional[list[Lit]] = getattr(self, "skos_prefLabel")
+        pref_label: Optional[list[AnyLit]] = getattr(self, "skos_prefLabel")
         if pref_label and isinstance(pref_label, list) and len(pref_label) > 1:
             tag_set = {label.lang for label in pref_label if label.lang}
             assert (
@@ -696,7 +696,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 
     """
 
-    skos_prefLabel: Optional[List[Lit]] = None
+    skos_prefLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     recommended
@@ -716,7 +716,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 	 Empire</skos:prefLabel>`This is a recommended property for this class.
     """
 
-    skos_altLabel: Optional[List[Lit]] = None
+    skos_altLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -733,7 +733,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 	'>Empire romain (27 avant J.-­‐C.-­‐476 après J.-­C.)</skos:altLabel >`
     """
 
-    skos_note: Optional[List[Lit]] = None
+    skos_note: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -752,7 +752,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 	e Mediterranean in Europe, Africa, and Asia.</skos:note>`
     """
 
-    dcterms_hasPart: Optional[List[Ref]] = None
+    dcterms_hasPart: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -768,7 +768,7 @@ class EDM_TimeSpan(EDM_BaseClass):
     Reference to a timespan which is part of the described timespan.
     """
 
-    dcterms_isPartOf: Optional[List[Ref]] = None
+    dcterms_isPartOf: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -784,7 +784,7 @@ class EDM_TimeSpan(EDM_BaseClass):
     Reference to a timespan of which the described timespan is a part.
     """
 
-    edm_begin: Optional[Lit] = None
+    edm_begin: Optional[AnyLit] = None
     """
     Mandate: 
     recommended
@@ -805,7 +805,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 	re specifically Metadata Tier B and Metadata Tier C
     """
 
-    edm_end: Optional[Lit] = None
+    edm_end: Optional[AnyLit] = None
     """
     Mandate: 
     recommended
@@ -825,7 +825,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 	data Tier C
     """
 
-    edm_isNextInSequence: Optional[List[Ref]] = None
+    edm_isNextInSequence: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -844,7 +844,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 	eded by the Roman Republic)
     """
 
-    owl_sameAs: Optional[List[Ref]] = None
+    owl_sameAs: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -862,7 +862,7 @@ class EDM_TimeSpan(EDM_BaseClass):
 
     @model_validator(mode="after")
     def validate_skos_pref_label(self) -> Self:
-        pref_label: Optional[list[Lit]] = getattr(self, "skos_prefLabel")
+        pref_label: Optional[list[AnyLit]] = getattr(self, "skos_prefLabel")
         if pref_label and isinstance(pref_label, list) and len(pref_label) > 1:
             tag_set = {label.lang for label in pref_label if label.lang}
             assert (
@@ -880,7 +880,7 @@ class CC_License(EDM_BaseClass):
 
     """
 
-    odrl_inheritFrom: Ref
+    odrl_inheritFrom: AnyRef
     """
     Mandate: 
     mandatory
@@ -925,7 +925,7 @@ class EDM_Place(EDM_BaseClass):
 
     """
 
-    wgs84_pos_lat: Optional[Lit] = None
+    wgs84_pos_lat: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -943,7 +943,7 @@ class EDM_Place(EDM_BaseClass):
 	 see Tier A-C requirements , more specifically Metadata Tier B and Metadata Tier C 
     """
 
-    wgs84_pos_long: Optional[Lit] = None
+    wgs84_pos_long: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -962,7 +962,7 @@ class EDM_Place(EDM_BaseClass):
 	 
     """
 
-    wgs84_pos_alt: Optional[Lit] = None
+    wgs84_pos_alt: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -979,7 +979,7 @@ class EDM_Place(EDM_BaseClass):
 	/wgs84_pos:alt>`
     """
 
-    skos_prefLabel: Optional[List[Lit]] = None
+    skos_prefLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -1000,7 +1000,7 @@ class EDM_Place(EDM_BaseClass):
 	lly Metadata Tier B and Metadata Tier C 
     """
 
-    skos_altLabel: Optional[List[Lit]] = None
+    skos_altLabel: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -1017,7 +1017,7 @@ class EDM_Place(EDM_BaseClass):
 	</skos:altLabel>`
     """
 
-    skos_note: Optional[List[Lit]] = None
+    skos_note: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -1033,7 +1033,7 @@ class EDM_Place(EDM_BaseClass):
     Information relating to the place.`<skos:note xml:lang="en">Pop. 21m</skos:note>`
     """
 
-    dcterms_hasPart: Optional[List[Ref]] = None
+    dcterms_hasPart: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1050,7 +1050,7 @@ class EDM_Place(EDM_BaseClass):
 	source=“http://sws.geonames.org/2643741/”/>` (City of London)
     """
 
-    dcterms_isPartOf: Optional[List[Ref]] = None
+    dcterms_isPartOf: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1067,7 +1067,7 @@ class EDM_Place(EDM_BaseClass):
 	e=“http://sws.geonames.org/2635167/”/>` (United Kingdom)
     """
 
-    edm_isNextInSequence: Optional[List[Ref]] = None
+    edm_isNextInSequence: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1085,7 +1085,7 @@ class EDM_Place(EDM_BaseClass):
 	e to ensure correct display in the portal.
     """
 
-    owl_sameAs: Optional[List[Ref]] = None
+    owl_sameAs: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1103,7 +1103,7 @@ class EDM_Place(EDM_BaseClass):
 
     @model_validator(mode="after")
     def validate_skos_pref_label(self) -> Self:
-        pref_label: Optional[list[Lit]] = getattr(self, "skos_prefLabel")
+        pref_label: Optional[list[AnyLit]] = getattr(self, "skos_prefLabel")
         if pref_label and isinstance(pref_label, list) and len(pref_label) > 1:
             tag_set = {label.lang for label in pref_label if label.lang}
             assert (
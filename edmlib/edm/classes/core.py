@@ -3,11 +3,23 @@ from typing import List, Optional, Union  # type: ignore
 # from rdflib import Literal, URIRef
 from typing_extensions import Self
 from pydantic import model_validator
-from edmlib.edm.value_types import MixedValuesList, Ref, Lit
+from edmlib.edm.value_types import AnyLit, AnyRef, MixedValuesList
 from edmlib.edm.base import EDM_BaseClass
+from edmlib.edm.compact import CompactRef
 from edmlib.edm.validation.edm_rights import assert_valid_statement, normalize_statement
 
 
+def normalize_rights(rights: AnyRef) -> AnyRef:
+    """
+    Normalizes the rights statement of a Ref in place. A CompactRef is immutable, so it is replaced.
+    """
+    value = normalize_statement(rights.value)
+    if isinstance(rights, CompactRef):
+        return rights if value == rights.value else CompactRef(value, rights.is_ref)
+    rights.value = value
+    return rights
+
+
 class ORE_Aggregation(EDM_BaseClass):
     """ORE Aggregation
 
@@ -19,7 +31,7 @@ class ORE_Aggregation(EDM_BaseClass):
 
     """
 
-    edm_aggregatedCHO: Ref
+    edm_aggregatedCHO: AnyRef
     """
     Mandate: 
     mandatory
@@ -37,7 +49,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	214”/>`
     """
 
-    edm_dataProvider: Union[Lit, Ref]
+    edm_dataProvider: Union[AnyLit, AnyRef]
     """
     Mandate: 
     mandatory
@@ -59,7 +71,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	rovider>`
     """
 
-    edm_provider: Union[Lit, Ref]
+    edm_provider: Union[AnyLit, AnyRef]
     """
     Mandate: 
     mandatory
@@ -81,7 +93,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	oCloud</edm:provider>`
     """
 
-    edm_rights: Ref
+    edm_rights: AnyRef
     """
     Mandate: 
     mandatory
@@ -125,7 +137,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	:resource="#statement_3000095353971"/>`
     """
 
-    edm_hasView: Optional[List[Ref]] = None
+    edm_hasView: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -148,7 +160,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	IN/AUDIO/0032195s.mp3"/>`
     """
 
-    edm_isShownAt: Optional[Ref] = None
+    edm_isShownAt: Optional[AnyRef] = None
     """
     Mandate: 
     mandatory
@@ -168,7 +180,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	http://www.mimo-­‐db.eu/UEDIN/214"/>`
     """
 
-    edm_isShownBy: Optional[Ref] = None
+    edm_isShownBy: Optional[AnyRef] = None
     """
     Mandate: 
     mandatory
@@ -188,7 +200,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	ShownBy rdf:resource="http://www.mimo‐db.eu/media/UEDIN/IMAGE/0032195c.jpg"/>`
     """
 
-    edm_object: Optional[Ref] = None
+    edm_object: Optional[AnyRef] = None
     """
     Mandate: 
     recommended
@@ -228,7 +240,7 @@ class ORE_Aggregation(EDM_BaseClass):
 	 rights apply to.
     """
 
-    edm_ugc: Optional[Lit] = None
+    edm_ugc: Optional[AnyLit] = None
     """
     Mandate: 
     optional
@@ -280,11 +292,15 @@ class ORE_Aggregation(EDM_BaseClass):
             self.edm_isShownBy
         ), f"Aggregation must have edm_isShownBy, got: {self.edm_isShownBy}."
 
+        return self
+
+    @model_validator(mode="after")
+    def validate_edm_rights(self) -> Self:
         assert self.edm_rights, "Missing edm-rights"
 
         assert self.edm_rights.value, "Missing value for edm-rights"
 
-        self.edm_rights.value = normalize_statement(self.edm_rights.value)
+        self.edm_rights = normalize_rights(self.edm_rights)
         assert_valid_statement(self.edm_rights.value)
 
         return self
@@ -301,7 +317,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 
     """
 
-    edm_type: Lit
+    edm_type: AnyLit
     """
     Mandate: 
     mandatory
@@ -442,7 +458,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	uirements . 
     """
 
-    dc_identifier: List[Lit]
+    dc_identifier: List[AnyLit]
     """
     Mandate: 
     recommended
@@ -458,7 +474,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
     An identifier of the original CHO. `<dc:identifier>RP-­T-­1952-­380</dc:identifier>`
     """
 
-    dc_language: Optional[List[Lit]] = None
+    dc_language: Optional[List[AnyLit]] = None
     """
     Mandate: 
     mandatory
@@ -577,7 +593,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	ments . 
     """
 
-    dc_title: Optional[List[Lit]] = None
+    dc_title: Optional[List[AnyLit]] = None
     """
     Mandate: 
     mandatory
@@ -619,7 +635,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	s on medata quality see Tier A-C requirements . 
     """
 
-    dcterms_alternative: Optional[List[Lit]] = None
+    dcterms_alternative: Optional[List[AnyLit]] = None
     """
     Mandate: 
     recommended
@@ -1009,7 +1025,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	ta quality see Tier A-C requirements . 
     """
 
-    dcterms_tableOfContents: Optional[List[Lit]] = None
+    dcterms_tableOfContents: Optional[List[AnyLit]] = None
     """
     Mandate: 
     optional
@@ -1051,7 +1067,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	ommendations on medata quality see Tier A-C requirements . 
     """
 
-    edm_currentLocation: Optional[Union[Lit, Ref]] = None
+    edm_currentLocation: Optional[Union[AnyLit, AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1077,7 +1093,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	 Tier A-C requirements . 
     """
 
-    edm_hasMet: Optional[List[Ref]] = None
+    edm_hasMet: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1116,7 +1132,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	tions. `<edm:hasType>Painting</edm:hasType>`
     """
 
-    edm_incorporates: Optional[List[Ref]] = None
+    edm_incorporates: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1134,7 +1150,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	`<edm:incorporates rdf:resource=“http://www.identifier/IncorporatedResource/“>`
     """
 
-    edm_isDerivativeOf: Optional[List[Ref]] = None
+    edm_isDerivativeOf: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1152,7 +1168,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	sDerivativeOf rdf:resource=“http://www.identifier/SourceResource/”>`
     """
 
-    edm_isNextInSequence: Optional[List[Ref]] = None
+    edm_isNextInSequence: Optional[List[AnyRef]] = None
     """
     Mandate: 
     recommended
@@ -1190,7 +1206,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	“http://www.eionet.europa.eu/gemet/concept?cp=4850/”>`
     """
 
-    edm_isRepresentationOf: Optional[Ref] = None
+    edm_isRepresentationOf: Optional[AnyRef] = None
     """
     Mandate: 
     optional
@@ -1208,7 +1224,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	. `<edm:isRepresentativeOf rdf:resource=“http://www.identifier/RepresentedResource/”>`
     """
 
-    edm_isSimilarTo: Optional[List[Ref]] = None
+    edm_isSimilarTo: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1225,7 +1241,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	arTo rdf:resource=“http://www.identifier/SimilarResource”/>`
     """
 
-    edm_isSuccessorOf: Optional[List[Ref]] = None
+    edm_isSuccessorOf: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1243,7 +1259,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	http://dbpedia.org/resource/The_Fellowship_of_the_Ring/”>`
     """
 
-    edm_realizes: Optional[List[Ref]] = None
+    edm_realizes: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1260,7 +1276,7 @@ class EDM_ProvidedCHO(EDM_BaseClass):
 	. E.g. a copy of the Gutenberg publication realizes the Bible.
     """
 
-    owl_sameAs: Optional[List[Ref]] = None
+    owl_sameAs: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1291,6 +1307,11 @@ class EDM_ProvidedCHO(EDM_BaseClass):
             assert (
                 self.dc_language
             ), f"ProvidedCHO must have dc_language if it is of edm_type 'TEXT', got {self.edm_type=}, {self.dc_language}."
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_edm_type(self) -> Self:
         assert (
             not self.edm_type.lang
         ), f"Property edm_type is not allowed to have a lang-tag"
@@ -1468,7 +1489,7 @@ class EDM_WebResource(EDM_BaseClass):
 	s:extent>`
     """
 
-    dcterms_hasPart: Optional[List[Ref]] = None
+    dcterms_hasPart: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1505,7 +1526,7 @@ class EDM_WebResource(EDM_BaseClass):
 	wikipedia/en/f/f3/Europeana_logo.png”/>`
     """
 
-    dcterms_isPartOf: Optional[List[Ref]] = None
+    dcterms_isPartOf: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1564,7 +1585,7 @@ class EDM_WebResource(EDM_BaseClass):
 	s`<dcterms:issued rdf:resource=“http://semium.org/time/2010”/>`
     """
 
-    edm_isNextInSequence: Optional[List[Ref]] = None
+    edm_isNextInSequence: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1583,7 +1604,7 @@ class EDM_WebResource(EDM_BaseClass):
 	operty to give the URI of the preceding resource in the sequence.
     """
 
-    edm_rights: Optional[Ref] = None
+    edm_rights: Optional[AnyRef] = None
     """
     Mandate: 
     recommended
@@ -1610,7 +1631,7 @@ class EDM_WebResource(EDM_BaseClass):
 	rights rdf:resource="#statement_3000095353971"/>`This is a recommended property.
     """
 
-    owl_sameAs: Optional[List[Ref]] = None
+    owl_sameAs: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1627,7 +1648,7 @@ class EDM_WebResource(EDM_BaseClass):
 	source=”urn:soundcloud:150424305>`
     """
 
-    svcs_has_service: Optional[List[Ref]] = None
+    svcs_has_service: Optional[List[AnyRef]] = None
     """
     Mandate: 
     optional
@@ -1655,7 +1676,7 @@ class EDM_WebResource(EDM_BaseClass):
             assert self.edm_rights
             assert self.edm_rights.value, "Missing value for edm-rights"
 
-            self.edm_rights.value = normalize_statement(self.edm_rights.value)
+            self.edm_rights = normalize_rights(self.edm_rights)
             assert_valid_statement(self.edm_rights.value)
 
         return self
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from ..base import EDM_BaseClass
-from ..value_types import Ref
+from ..value_types import AnyRef
 
 
 class SVCS_Service(EDM_BaseClass):
@@ -24,7 +24,7 @@ class SVCS_Service(EDM_BaseClass):
         `<dcterms:conformsTo rdf:resource="http://iiif.io/api/image"/>`
     """
 
-    dcterms_conformsTo: Optional[List[Ref]]
+    dcterms_conformsTo: Optional[List[AnyRef]]
     """
     Mandate: 
         Optional
@@ -39,7 +39,7 @@ class SVCS_Service(EDM_BaseClass):
         `<dcterms:conformsTo rdf:resource="http://iiif.io/api/image"/>`
     """
 
-    doap_implements: Optional[Ref]
+    doap_implements: Optional[AnyRef]
     """
     Mandate: 
         Optional
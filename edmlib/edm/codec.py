@@ -0,0 +1,276 @@
+"""
+Compact binary codec for EDM_Record, e.g. for caching parsed records between pipeline stages.
+
+Layout (all integers are unsigned LEB128 varints):
+- the magic bytes b"EDMC" and a format version byte
+- a per-record string table: count, then length and utf-8 bytes of each string
+- for each section of RECORD_SECTIONS: the number of instances, and for each instance the number
+  of set fields, followed by (field index, value) pairs. None fields are omitted.
+
+Values are tagged tuples: the low bits of the tag select the kind (Ref, plain Lit, Lit with lang,
+Lit with datatype), the high bits store Lit.normalize and Ref.is_ref. Lists are prefixed with the
+LIST tag and their length. Refs are split into namespace and local name, so that repeated namespace
+prefixes, lang tags and datatypes are stored only once per record.
+
+Decoding uses model_construct, i.e. the values are not validated or sanitized again.
+Field indexes refer to the field order of the edm-classes, so encoded data is only meant to be
+read by the same version of edmlib.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from .compact import CompactRef
+from .value_types import AnyLit, AnyRef, Lit, Ref
+
+if TYPE_CHECKING:
+    from .record import EDM_Record
+
+MAGIC = b"EDMC"
+VERSION = 1
+
+REF, LIT, LIT_LANG, LIT_DATATYPE = 0, 1, 2, 3
+LIST = 0x0F
+NORMALIZE_TRUE, NORMALIZE_NONE, NOT_REF = 0x10, 0x20, 0x40
+
+NORMALIZE_FLAGS = {False: 0, True: NORMALIZE_TRUE, None: NORMALIZE_NONE}
+
+
+class CodecError(ValueError):
+    """
+    Raised if data can't be decoded, e.g. because it is truncated or of another format version.
+    """
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _split_ref(value: str) -> Tuple[str, str]:
+    """
+    Splits an uri after its last '#' or '/', e.g. into 'http://www.europeana.eu/schemas/edm/' and 'IMAGE'.
+    """
+    pos = max(value.rfind("#"), value.rfind("/")) + 1
+    return value[:pos], value[pos:]
+
+
+_field_defaults: Dict[type, Dict[str, Any]] = {}
+
+
+def _construct(cls: Any, fields: Dict[str, Any]) -> Any:
+    """
+    Minimal, faster variant of BaseModel.model_construct: sets the given fields and the defaults
+    (all optional fields of the edm-classes default to None) without running any validation.
+    """
+    defaults = _field_defaults.get(cls)
+    if defaults is None:
+        defaults = _field_defaults[cls] = dict.fromkeys(cls.model_fields)
+    instance = cls.__new__(cls)
+    values = defaults.copy()
+    values.update(fields)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.body = bytearray()
+
+    def string(self, value: str) -> None:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        _write_varint(self.body, index)
+
+    def value(self, value: Union[AnyRef, AnyLit]) -> None:
+        if isinstance(value, (Ref, CompactRef)):
+            self.body.append(REF | (0 if value.is_ref else NOT_REF))
+            namespace, local = _split_ref(value.value)
+            self.string(namespace)
+            self.string(local)
+            return
+        flags = NORMALIZE_FLAGS[value.normalize]
+        if value.lang:
+            self.body.append(LIT_LANG | flags)
+            self.string(value.value)
+            self.string(value.lang)
+        elif value.datatype:
+            self.body.append(LIT_DATATYPE | flags)
+            self.string(value.value)
+            self.string(value.datatype)
+        else:
+            self.body.append(LIT | flags)
+            self.string(value.value)
+
+    def instance(self, instance: Any) -> None:
+        fields = [
+            (index, getattr(instance, name))
+            for index, name in enumerate(instance.__class__.model_fields)
+        ]
+        fields = [(index, value) for index, value in fields if value is not None]
+        _write_varint(self.body, len(fields))
+        for index, value in fields:
+            _write_varint(self.body, index)
+            if isinstance(value, list):
+                self.body.append(LIST)
+                _write_varint(self.body, len(value))
+                for el in value:
+                    self.value(el)
+            else:
+                self.value(value)
+
+    def finish(self) -> bytes:
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        _write_varint(out, len(self.strings))
+        for string in self.strings:
+            encoded = string.encode("utf-8")
+            _write_varint(out, len(encoded))
+            out += encoded
+        return bytes(out + self.body)
+
+
+class _Decoder:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+        self.strings: List[str] = []
+
+    def varint(self) -> int:
+        if self.pos < len(self.data) and self.data[self.pos] < 0x80:
+            self.pos += 1
+            return self.data[self.pos - 1]
+        result = shift = 0
+        while True:
+            try:
+                byte = self.data[self.pos]
+            except IndexError:
+                raise CodecError("Unexpected end of data.")
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def tag(self) -> int:
+        if self.pos >= len(self.data):
+            raise CodecError("Unexpected end of data.")
+        self.pos += 1
+        return self.data[self.pos - 1]
+
+    def string(self) -> str:
+        index = self.varint()
+        try:
+            return self.strings[index]
+        except IndexError:
+            raise CodecError(f"Invalid string index {index}.")
+
+    def header(self) -> None:
+        if self.data[:4] != MAGIC:
+            raise CodecError("Not an encoded EDM_Record.")
+        if self.data[4:5] != bytes([VERSION]):
+            raise CodecError(f"Unsupported format version: {self.data[4:5]!r}.")
+        self.pos = 5
+        for index in range(self.varint()):
+            length = self.varint()
+            end = self.pos + length
+            if end > len(self.data):
+                raise CodecError(f"Truncated string table at string {index}.")
+            try:
+                self.strings.append(self.data[self.pos : end].decode("utf-8"))
+            except UnicodeDecodeError:
+                raise CodecError(f"Invalid utf-8 in string {index}.")
+            self.pos = end
+
+    def value(self, tag: int) -> Union[Ref, Lit]:
+        kind = tag & 0x0F
+        if kind == REF:
+            value = self.string() + self.string()
+            return _construct(Ref, {"value": value, "is_ref": not tag & NOT_REF})
+        if kind not in (LIT, LIT_LANG, LIT_DATATYPE):
+            raise CodecError(f"Invalid value tag {tag}.")
+        normalize: Optional[bool] = bool(tag & NORMALIZE_TRUE)
+        if tag & NORMALIZE_NONE:
+            normalize = None
+        value = self.string()
+        lang = self.string() if kind == LIT_LANG else None
+        datatype = self.string() if kind == LIT_DATATYPE else None
+        return _construct(
+            Lit,
+            {
+                "value": value,
+                "lang": lang,
+                "datatype": datatype,
+                "normalize": normalize,
+            },
+        )
+
+    def instance(self, cls: Any) -> Any:
+        names = list(_field_defaults.get(cls) or cls.model_fields)
+        fields: Dict[str, Any] = {}
+        for _ in range(self.varint()):
+            index = self.varint()
+            if index >= len(names):
+                raise CodecError(f"Invalid field index {index} for {cls.__name__}.")
+            name = names[index]
+            tag = self.tag()
+            if tag == LIST:
+                fields[name] = [self.value(self.tag()) for _ in range(self.varint())]
+            else:
+                fields[name] = self.value(tag)
+        return _construct(cls, fields)
+
+
+def encode_record(record: "EDM_Record") -> bytes:
+    """
+    Encodes a record to the compact binary format.
+    """
+    from .record import RECORD_SECTIONS
+
+    encoder = _Encoder()
+    for section in RECORD_SECTIONS:
+        value = getattr(record, section)
+        if value is None:
+            _write_varint(encoder.body, 0)
+            continue
+        instances = value if isinstance(value, list) else [value]
+        _write_varint(encoder.body, len(instances) + 1)
+        for instance in instances:
+            encoder.instance(instance)
+    return encoder.finish()
+
+
+def decode_record(data: bytes) -> "EDM_Record":
+    """
+    Decodes a record that was encoded with encode_record(), without validating it again.
+    Raises a CodecError if the data is not a valid encoded record.
+    """
+    from .record import EDM_Record, RECORD_SECTIONS, REQUIRED_SECTIONS
+
+    decoder = _Decoder(data)
+    sections: Dict[str, Any] = {}
+    try:
+        decoder.header()
+        for section, cls in RECORD_SECTIONS.items():
+            count = decoder.varint()
+            if section in REQUIRED_SECTIONS and count != 2:
+                raise CodecError(f"Expected exactly one instance in {section}.")
+            if not count:
+                sections[section] = None
+                continue
+            instances = [decoder.instance(cls) for _ in range(count - 1)]
+            if section in REQUIRED_SECTIONS:
+                sections[section] = instances[0]
+            else:
+                sections[section] = instances
+    except IndexError:
+        raise CodecError("Unexpected end of data.")
+    if decoder.pos != len(data):
+        raise CodecError(f"{len(data) - decoder.pos} trailing bytes after the record.")
+    return _construct(EDM_Record, sections)
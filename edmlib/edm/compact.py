@@ -0,0 +1,222 @@
+"""
+Memory-compact, immutable counterparts of Ref and Lit for bulk in-memory workloads,
+e.g. holding the values of a whole provider set for deduplication.
+
+CompactRef and CompactLit use __slots__ instead of a pydantic model with its own __dict__ and
+fields set, and intern lang tags and datatypes, so that equal strings are stored once.
+They are hashable, convert losslessly from and to Ref and Lit, and equal the Ref or Lit they
+were created from. The edm-classes store them as they are, wherever they expect a Ref or a Lit,
+and dump them like the equivalent Ref or Lit, so a record with compact values has the same JSON
+dump, graph and fingerprint as the original record. compact_record() converts all values of a
+parsed record in place:
+
+```
+value = compact(Lit(value="Titel", lang="de"))
+cho = EDM_ProvidedCHO(id=..., dc_title=[value], ...)
+cho.dc_title[0] is value
+value == Lit(value="Titel", lang="de")
+
+record = compact_record(EDM_Parser.from_file("record.xml").parse())
+```
+"""
+
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+from rdflib import Literal, URIRef
+
+if TYPE_CHECKING:
+    from .record import EDM_Record
+    from .value_types import Lit, Ref
+
+
+def get_compact_schema(
+    cls: type, full: type, expand: Callable[[Any], Any], handler: GetCoreSchemaHandler
+) -> CoreSchema:
+    """
+    Python input is only accepted as an instance of cls and kept as it is, JSON input is
+    validated as the full type. Instances are serialized like the full type.
+    """
+    full_schema = handler.generate_schema(full)
+    return core_schema.json_or_python_schema(
+        json_schema=full_schema,
+        python_schema=core_schema.is_instance_schema(cls),
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            expand, return_schema=full_schema
+        ),
+    )
+
+
+class CompactRef:
+    __slots__ = ("value", "is_ref")
+
+    value: str
+    is_ref: bool
+
+    def __init__(self, value: str, is_ref: bool = True) -> None:
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "is_ref", is_ref)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __eq__(self, other: object) -> bool:
+        # Ref compares itself with a CompactRef, see Ref.__eq__
+        if not isinstance(other, CompactRef):
+            return NotImplemented
+        return self.value == other.value and self.is_ref == other.is_ref
+
+    def __hash__(self) -> int:
+        return hash((CompactRef, self.value))
+
+    def __repr__(self) -> str:
+        return f"CompactRef({self.value!r})"
+
+    def __reduce__(self) -> Any:
+        return CompactRef, (self.value, self.is_ref)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        from .value_types import Ref
+
+        return get_compact_schema(cls, Ref, cls.to_ref, handler)
+
+    @classmethod
+    def from_ref(cls, ref: "Ref") -> "CompactRef":
+        return cls(ref.value, ref.is_ref)
+
+    def to_ref(self) -> "Ref":
+        """
+        Returns the equivalent Ref. The value is not validated again.
+        """
+        from .value_types import Ref
+
+        return Ref.model_construct(value=self.value, is_ref=self.is_ref)
+
+    def to_rdflib(self) -> URIRef:
+        return URIRef(self.value)
+
+
+class CompactLit:
+    __slots__ = ("value", "lang", "datatype", "normalize")
+
+    value: str
+    lang: Optional[str]
+    datatype: Optional[str]
+    normalize: Optional[bool]
+
+    def __init__(
+        self,
+        value: str,
+        lang: Optional[str] = None,
+        datatype: Optional[str] = None,
+        normalize: Optional[bool] = False,
+    ) -> None:
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "lang", sys.intern(lang) if lang else lang)
+        object.__setattr__(
+            self, "datatype", sys.intern(datatype) if datatype else datatype
+        )
+        object.__setattr__(self, "normalize", normalize)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def _key(self) -> tuple:
+        return (self.value, self.lang, self.datatype, self.normalize)
+
+    def __eq__(self, other: object) -> bool:
+        # Lit compares itself with a CompactLit, see Lit.__eq__
+        if not isinstance(other, CompactLit):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash((CompactLit, self.value, self.lang, self.datatype))
+
+    def __repr__(self) -> str:
+        return f"CompactLit({self.value!r}, lang={self.lang!r}, datatype={self.datatype!r})"
+
+    def __reduce__(self) -> Any:
+        return CompactLit, self._key()
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        from .value_types import Lit
+
+        return get_compact_schema(cls, Lit, cls.to_lit, handler)
+
+    @classmethod
+    def from_lit(cls, lit: "Lit") -> "CompactLit":
+        return cls(lit.value, lit.lang, lit.datatype, lit.normalize)
+
+    def to_lit(self) -> "Lit":
+        """
+        Returns the equivalent Lit. The value is not validated again.
+        """
+        from .value_types import Lit
+
+        return Lit.model_construct(
+            value=self.value,
+            lang=self.lang,
+            datatype=self.datatype,
+            normalize=self.normalize,
+        )
+
+    def to_rdflib(self) -> Literal:
+        return Literal(
+            lexical_or_value=self.value,
+            lang=self.lang,
+            datatype=self.datatype,
+            normalize=self.normalize,
+        )
+
+
+def compact(
+    value: Union["Ref", "Lit", CompactRef, CompactLit],
+) -> Union[CompactRef, CompactLit]:
+    """
+    Converts a Ref or a Lit to its compact counterpart. Compact values are returned as they are.
+    """
+    from .value_types import Ref
+
+    if isinstance(value, (CompactRef, CompactLit)):
+        return value
+    if isinstance(value, Ref):
+        return CompactRef.from_ref(value)
+    return CompactLit.from_lit(value)
+
+
+def expand(value: Any) -> Any:
+    """
+    Converts a CompactRef or a CompactLit to a Ref or a Lit. Other values are returned as they are.
+    """
+    if isinstance(value, CompactRef):
+        return value.to_ref()
+    if isinstance(value, CompactLit):
+        return value.to_lit()
+    return value
+
+
+def compact_record(record: "EDM_Record") -> "EDM_Record":
+    """
+    Replaces the values of all instances of a record, including their ids, with their compact
+    counterparts. Frozen instances, i.e. the shared entities of an EntityPool, are skipped.
+    The record is modified in place and returned.
+    """
+    for instance in record.iter_instances():
+        if instance.model_config.get("frozen"):
+            continue
+        for name in instance.__class__.model_fields:
+            value = getattr(instance, name)
+            if isinstance(value, list):
+                setattr(instance, name, [compact(el) for el in value])
+            elif value is not None:
+                setattr(instance, name, compact(value))
+    return record
@@ -0,0 +1,287 @@
+"""
+Structural diff and patch between two versions of an EDM_Record.
+
+Instances are matched by their class and id, values are compared property by property as rdf terms.
+The resulting EDM_Changeset can be applied to the old record to get the new one, or be emitted as
+n-triples add/delete sets or as a SPARQL Update request for incremental updates of a triplestore.
+"""
+
+from types import UnionType
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+from rdflib import RDF, URIRef
+
+from .compact import expand
+from .enums import EDM_Namespace
+from .value_types import Lit, Ref
+
+if TYPE_CHECKING:
+    from .record import EDM_Record
+
+Triple = Tuple[Any, Any, Any]
+
+
+class EntityKey(BaseModel):
+    cls: str
+    id: str
+
+
+class PropertyChange(BaseModel):
+    """
+    The values that were added to and removed from a single property of an instance.
+    A changed single value is represented as one removed and one added value.
+    """
+
+    cls: str
+    id: str
+    property: str
+    added: List[Union[Lit, Ref]] = []
+    removed: List[Union[Lit, Ref]] = []
+
+
+class EDM_Changeset(BaseModel):
+    """
+    Compact changeset between two versions of a record, as returned by diff_records().
+
+    added_entities and removed_entities list the instances that only exist in the new or the old
+    record. The property values of those instances are contained in changes as well, so that the
+    changeset can be converted to rdf add/delete sets.
+    """
+
+    added_entities: List[EntityKey] = []
+    removed_entities: List[EntityKey] = []
+    changes: List[PropertyChange] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added_entities or self.removed_entities or self.changes)
+
+    def get_triples(self) -> Tuple[List[Triple], List[Triple]]:
+        """
+        Returns the changeset as rdflib triples: (added, removed).
+        """
+        added: List[Triple] = []
+        removed: List[Triple] = []
+        for target, entities in [
+            (added, self.added_entities),
+            (removed, self.removed_entities),
+        ]:
+            for entity in entities:
+                target.append(
+                    (
+                        URIRef(entity.id),
+                        RDF.type,
+                        URIRef(
+                            EDM_Namespace.get_from_name(
+                                entity.cls, return_full_uri=True
+                            )
+                        ),
+                    )
+                )
+        for change in self.changes:
+            subject = URIRef(change.id)
+            predicate = URIRef(
+                EDM_Namespace.get_from_name(change.property, return_full_uri=True)
+            )
+            added.extend(
+                (subject, predicate, value.to_rdflib()) for value in change.added
+            )
+            removed.extend(
+                (subject, predicate, value.to_rdflib()) for value in change.removed
+            )
+        return added, removed
+
+    def to_ntriples(self) -> Tuple[str, str]:
+        """
+        Returns the changeset as two n-triples documents: (added, removed).
+        """
+        added, removed = self.get_triples()
+        return _to_ntriples(added), _to_ntriples(removed)
+
+    def to_sparql_update(self, graph: Optional[str] = None) -> str:
+        """
+        Returns the changeset as a SPARQL Update request, which first deletes the removed and then
+        inserts the added triples. If graph is given, the changes are applied to that named graph.
+        """
+        added, removed = self.get_triples()
+        operations = []
+        for operation, triples in [("DELETE DATA", removed), ("INSERT DATA", added)]:
+            if not triples:
+                continue
+            body = _to_ntriples(triples)
+            if graph:
+                body = f"GRAPH {URIRef(graph).n3()} {{\n{body}}}\n"
+            operations.append(f"{operation} {{\n{body}}}")
+        return " ;\n".join(operations)
+
+    def apply(self, record: "EDM_Record") -> "EDM_Record":
+        """
+        Applies the changeset to a record and returns the patched record as a new, validated
+        EDM_Record. The given record is not modified.
+        Raises a ValueError if the changeset does not fit the record.
+        """
+        from .record import EDM_Record, RECORD_SECTIONS, REQUIRED_SECTIONS
+
+        classes = {
+            cls.__name__: (section, cls) for section, cls in RECORD_SECTIONS.items()
+        }
+        instances: Dict[Tuple[str, str], Dict[str, Any]] = {
+            (inst.label, inst.id.value): {
+                name: getattr(inst, name) for name in inst.__class__.model_fields
+            }
+            for inst in record.iter_instances()
+        }
+
+        removed_keys = {(entity.cls, entity.id) for entity in self.removed_entities}
+        for key in removed_keys:
+            if instances.pop(key, None) is None:
+                raise ValueError(
+                    f"Can't remove {key}, it does not exist in the record."
+                )
+        for entity in self.added_entities:
+            key = (entity.cls, entity.id)
+            if key in instances:
+                raise ValueError(f"Can't add {key}, it already exists in the record.")
+            instances[key] = {"id": Ref(value=entity.id)}
+
+        for change in self.changes:
+            key = (change.cls, change.id)
+            if key in removed_keys:
+                continue
+            if key not in instances:
+                raise ValueError(
+                    f"Can't change {key}, it does not exist in the record."
+                )
+            fields = instances[key]
+            current = fields.get(change.property)
+            values = (
+                current if isinstance(current, list) else [current] if current else []
+            )
+            removed_terms = {value.to_rdflib() for value in change.removed}
+            values = [
+                value for value in values if value.to_rdflib() not in removed_terms
+            ]
+            values += change.added
+            if _is_many(classes[change.cls][1], change.property):
+                fields[change.property] = values or None
+            elif len(values) > 1:
+                raise ValueError(
+                    f"Property {change.property} of {key} can only hold one value."
+                )
+            else:
+                fields[change.property] = values[0] if values else None
+
+        sections: Dict[str, Any] = {}
+        for (label, _), fields in instances.items():
+            section, cls = classes[label]
+            instance = cls(
+                **{
+                    name: _copy(value)
+                    for name, value in fields.items()
+                    if value is not None
+                }
+            )
+            if section in REQUIRED_SECTIONS:
+                sections[section] = instance
+            else:
+                sections.setdefault(section, []).append(instance)
+        return EDM_Record(**sections)
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_copy(el) for el in value]
+    # compact values are immutable and need no copy
+    return value.model_copy() if isinstance(value, BaseModel) else value
+
+
+def _to_ntriples(triples: List[Triple]) -> str:
+    return "".join(f"{s.n3()} {p.n3()} {o.n3()} .\n" for s, p, o in triples)
+
+
+def _is_list_annotation(annotation: Any) -> bool:
+    """
+    True for List[...] and for unions or Annotated types that contain a List[...].
+    """
+    origin = get_origin(annotation)
+    if origin is list:
+        return True
+    if origin is Annotated:
+        return _is_list_annotation(get_args(annotation)[0])
+    if origin in (Union, UnionType):
+        return any(_is_list_annotation(arg) for arg in get_args(annotation))
+    return False
+
+
+def _is_many(cls: Any, field_name: str) -> bool:
+    return _is_list_annotation(cls.model_fields[field_name].annotation)
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _diff_values(old: Any, new: Any) -> Tuple[List[Any], List[Any]]:
+    # changesets hold Ref and Lit models, also for records with compact values
+    old_values = [expand(value) for value in _as_list(old)]
+    new_values = [expand(value) for value in _as_list(new)]
+    old_terms = {value.to_rdflib() for value in old_values}
+    new_terms = {value.to_rdflib() for value in new_values}
+    added = [value for value in new_values if value.to_rdflib() not in old_terms]
+    removed = [value for value in old_values if value.to_rdflib() not in new_terms]
+    return added, removed
+
+
+def diff_records(old: "EDM_Record", new: "EDM_Record") -> EDM_Changeset:
+    """
+    Compares two versions of a record class by class and property by property.
+    Instances are matched by their class and id.
+    """
+    old_instances = {(inst.label, inst.id.value): inst for inst in old.iter_instances()}
+    new_instances = {(inst.label, inst.id.value): inst for inst in new.iter_instances()}
+    changeset = EDM_Changeset()
+
+    for key, inst in old_instances.items():
+        if key not in new_instances:
+            changeset.removed_entities.append(EntityKey(cls=key[0], id=key[1]))
+    for key, inst in new_instances.items():
+        if key not in old_instances:
+            changeset.added_entities.append(EntityKey(cls=key[0], id=key[1]))
+
+    for key in list(old_instances) + [
+        key for key in new_instances if key not in old_instances
+    ]:
+        old_inst = old_instances.get(key)
+        new_inst = new_instances.get(key)
+        for field_name in (old_inst or new_inst).__class__.model_fields:  # type: ignore
+            if field_name == "id":
+                continue
+            added, removed = _diff_values(
+                getattr(old_inst, field_name, None),
+                getattr(new_inst, field_name, None),
+            )
+            if added or removed:
+                changeset.changes.append(
+                    PropertyChange(
+                        cls=key[0],
+                        id=key[1],
+                        property=field_name,
+                        added=added,
+                        removed=removed,
+                    )
+                )
+    return changeset
@@ -0,0 +1,152 @@
+"""
+Content fingerprints for change detection between harvests.
+
+There are two levels of fingerprints:
+- raw_fingerprint(): a cheap hash over the raw bytes of a record, which can be checked before parsing.
+- record_fingerprint(): a stable hash over the sorted triples of a record, which does not change
+  with the serialization format, the order of elements or whitespace.
+
+FingerprintManifest maps record ids to both fingerprints, so that bulk pipelines can skip unchanged
+records before the expensive stages.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .base import EDM_BaseClass
+    from .record import EDM_Record
+
+
+def raw_fingerprint(content: bytes) -> str:
+    """
+    Returns a cheap hash of the raw bytes of a record.
+    """
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def triples_fingerprint(triples: Iterable[Tuple[Any, Any, Any]]) -> str:
+    """
+    Returns a stable sha256 hash over the sorted n-triples lines of the given rdflib triples.
+    """
+    lines = sorted(" ".join(term.n3() for term in triple) for triple in triples)
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def record_fingerprint(record: "EDM_Record") -> str:
+    """
+    Returns a stable sha256 hash over the sorted n-triples lines of all instances of the record.
+    """
+    return triples_fingerprint(
+        triple
+        for instance in record.iter_instances()
+        for triple in instance.get_triples()
+    )
+
+
+def instance_fingerprint(instance: "EDM_BaseClass") -> str:
+    """
+    Returns a stable sha256 hash over the triples of a single instance, e.g. a context-class entity.
+    """
+    return triples_fingerprint(instance.get_triples())
+
+
+class ManifestEntry(NamedTuple):
+    raw: Optional[str]
+    fingerprint: str
+
+
+class FingerprintManifest:
+    """
+    Maps record ids to their last seen raw fingerprint and record fingerprint.
+    The manifest is stored as a tab separated file with the columns id, raw, fingerprint.
+
+    Usage:
+    ```
+    manifest = FingerprintManifest("manifest.tsv")
+    if manifest.has_raw(raw_fingerprint(content)):
+        continue  # byte-for-byte unchanged, skip parsing
+    record = EDM_Parser.from_string(content).parse()
+    fingerprint = record_fingerprint(record)
+    if not manifest.is_unchanged(record.aggregation.id.value, fingerprint):
+        publish(record)
+    manifest.update(record.aggregation.id.value, fingerprint, raw=raw_fingerprint(content))
+    manifest.save()
+    ```
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, ManifestEntry] = {}
+        self.raw_index: Dict[str, str] = {}
+        if self.path and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def get(self, record_id: str) -> Optional[ManifestEntry]:
+        return self.entries.get(record_id)
+
+    def has_raw(self, raw: str) -> bool:
+        """
+        Checks if any record was last seen with exactly this raw fingerprint.
+        """
+        return raw in self.raw_index
+
+    def is_unchanged(self, record_id: str, fingerprint: str) -> bool:
+        entry = self.entries.get(record_id)
+        return entry is not None and entry.fingerprint == fingerprint
+
+    def update(
+        self, record_id: str, fingerprint: str, raw: Optional[str] = None
+    ) -> None:
+        self.remove(record_id)
+        self.entries[record_id] = ManifestEntry(raw, fingerprint)
+        if raw:
+            self.raw_index[raw] = record_id
+
+    def remove(self, record_id: str) -> None:
+        entry = self.entries.pop(record_id, None)
+        if entry and entry.raw and self.raw_index.get(entry.raw) == record_id:
+            del self.raw_index[entry.raw]
+
+    def load(self, path: Union[str, Path]) -> None:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                record_id, raw, fingerprint = line.rstrip("\n").split("\t")
+                self.update(record_id, fingerprint, raw=raw or None)
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Writes the manifest to path (default: the path it was loaded from). The file is
+        replaced atomically, so an interrupted run does not leave a broken manifest.
+        """
+        path = Path(path or self.path)  # type: ignore
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for record_id, entry in self.entries.items():
+                file.write(f"{record_id}\t{entry.raw or ''}\t{entry.fingerprint}\n")
+        os.replace(tmp_path, path)
@@ -0,0 +1,201 @@
+"""
+JSON-LD framing with a preprocessed frame.
+
+pyld.jsonld.frame() processes the @context of the frame and expands the frame on every call, and
+processes the context once more to compact the result. For a constant frame, such as the edm
+frame used by EDM_Record.get_framed_json_ld(), JsonLdFramer does this once and reuses the active
+context and the expanded frame for every document, so framing many records only expands, frames
+and compacts the records themselves.
+
+JsonLdFramer uses internals of pyld's JsonLdProcessor. With a pyld version that lacks them, it
+falls back to pyld.jsonld.frame(), which gives the same result without the preprocessing.
+
+```
+framer = get_framer(frame, {"embed": "@always"})
+framed = [framer.frame(document) for document in documents]
+```
+"""
+
+import copy
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from pyld import jsonld
+from pyld.jsonld import JsonLdProcessor, get_document_loader
+
+PYLD_INTERNALS = (
+    "_get_initial_context",
+    "_processing_mode",
+    "_expand_iri",
+    "_frame",
+    "_cleanup_preserve",
+    "_compact",
+    "_compact_iri",
+    "_cleanup_null",
+)
+"""
+The private methods of JsonLdProcessor that the preprocessing relies on.
+"""
+
+try:
+    from pyld.jsonld import ContextResolver, _resolved_context_cache
+except ImportError:
+    HAS_PYLD_INTERNALS = False
+else:
+    HAS_PYLD_INTERNALS = all(hasattr(JsonLdProcessor, name) for name in PYLD_INTERNALS)
+
+FramerKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+_framers: Dict[FramerKey, "JsonLdFramer"] = {}
+
+
+class JsonLdFramer:
+    """
+    Frames documents like pyld.jsonld.frame(document, frame, options), with the frame processed
+    on the first call. Options are the options of pyld.jsonld.frame(), without a documentLoader:
+    remote contexts are loaded with the document loader set in pyld, so the processed context
+    stays valid as long as the remote context does not change.
+    """
+
+    def __init__(self, frame: Dict[str, Any], options: Optional[Dict[str, Any]] = None):
+        self.frame_document = frame
+        self.options = dict(options or {})
+        self.options.setdefault("base", "")
+        self.options.setdefault("embed", "@once")
+        self.options.setdefault("explicit", False)
+        self.options.setdefault("omitDefault", False)
+        self.options.setdefault("requireAll", False)
+        self.options.setdefault("compactArrays", True)
+        self.options.setdefault("extractAllScripts", False)
+        self.options.setdefault("processingMode", "json-ld-1.1")
+        self.processor = JsonLdProcessor()
+        self._prepared: Optional[Tuple[Any, Any, Dict[str, Any]]] = None
+
+    def get_options(self) -> Dict[str, Any]:
+        # pyld writes its state into the options, so each call needs its own copy
+        options = dict(self.options)
+        options["bnodesToClear"] = []
+        options["documentLoader"] = get_document_loader()
+        options["contextResolver"] = ContextResolver(
+            _resolved_context_cache, options["documentLoader"]
+        )
+        return options
+
+    def prepare(self) -> Tuple[Any, Any, Dict[str, Any]]:
+        """
+        Returns the active context and the expanded frame, and the options that depend on them.
+        A failure, e.g. an unreachable remote context, is raised again on the next call.
+        """
+        if self._prepared is not None:
+            return self._prepared
+        processor = self.processor
+        options = self.get_options()
+        context = self.frame_document.get("@context", {})
+        active_ctx = processor.process_context(
+            processor._get_initial_context(options), context, options
+        )
+        is11 = processor._processing_mode(active_ctx, 1.1)
+        frame_options = {
+            "omitGraph": self.options.get("omitGraph", is11),
+            "pruneBlankNodeIdentifiers": self.options.get(
+                "pruneBlankNodeIdentifiers", is11
+            ),
+            "merged": "@graph"
+            not in [
+                processor._expand_iri(active_ctx, key) for key in self.frame_document
+            ],
+            "is11": is11,
+        }
+        expanded_frame = processor.expand(
+            self.frame_document,
+            {
+                **options,
+                **frame_options,
+                "isFrame": True,
+                "keepFreeFloatingNodes": True,
+            },
+        )
+        self._prepared = (active_ctx, expanded_frame, frame_options)
+        return self._prepared
+
+    def frame(self, document: Any) -> Any:
+        """
+        Frames a JSON-LD document. Expanded documents, e.g. the output of rdflib's json-ld
+        serializer without a context, need no context processing at all.
+        """
+        if not HAS_PYLD_INTERNALS:
+            return jsonld.frame(document, self.frame_document, self.options)
+        active_ctx, expanded_frame, frame_options = self.prepare()
+        processor = self.processor
+        options = {**self.get_options(), **frame_options}
+        expanded = processor.expand(document, options)
+        framed = processor._frame(expanded, expanded_frame, options)
+        options["link"] = {}
+        framed = processor._cleanup_preserve(framed, options)
+
+        options.update(graph=not options["omitGraph"], framing=True, link={})
+        result = self.compact(active_ctx, framed, options)
+        options["link"] = {}
+        return processor._cleanup_null(result, options)
+
+    def compact(self, active_ctx: Any, framed: Any, options: Dict[str, Any]) -> Any:
+        """
+        The compaction step of JsonLdProcessor.compact(), with the processed frame context.
+        """
+        processor = self.processor
+        compacted = processor._compact(active_ctx, None, framed, options)
+        if (
+            options["compactArrays"]
+            and not options["graph"]
+            and isinstance(compacted, list)
+        ):
+            if len(compacted) == 1:
+                compacted = compacted[0]
+            elif len(compacted) == 0:
+                compacted = {}
+        elif options["graph"]:
+            compacted = JsonLdProcessor.arrayify(compacted)
+
+        contexts = [
+            ctx
+            for ctx in JsonLdProcessor.arrayify(self.frame_document.get("@context", {}))
+            if not isinstance(ctx, dict) or len(ctx) > 0
+        ]
+        if isinstance(compacted, list):
+            graph = compacted
+            compacted = {}
+            if contexts:
+                compacted["@context"] = contexts[0] if len(contexts) == 1 else contexts
+            compacted[processor._compact_iri(active_ctx, "@graph")] = graph
+        elif isinstance(compacted, dict) and contexts:
+            compacted = {
+                "@context": contexts[0] if len(contexts) == 1 else contexts,
+                **compacted,
+            }
+        return compacted
+
+
+def get_framer_key(
+    frame: Dict[str, Any], options: Optional[Dict[str, Any]]
+) -> FramerKey:
+    """
+    Equal frames with equal options share a framer, independent of the order of their keys.
+    """
+    return (
+        json.dumps(frame, sort_keys=True),
+        tuple(
+            sorted((key, json.dumps(value)) for key, value in (options or {}).items())
+        ),
+    )
+
+
+def get_framer(
+    frame: Dict[str, Any], options: Optional[Dict[str, Any]] = None
+) -> JsonLdFramer:
+    """
+    Returns the framer for a frame and options, which is created once per process.
+    """
+    key = get_framer_key(frame, options)
+    if key not in _framers:
+        _framers[key] = JsonLdFramer(copy.deepcopy(frame), options)
+    return _framers[key]
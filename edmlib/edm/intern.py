@@ -0,0 +1,134 @@
+"""
+Bounded string interning for values that repeat across the records of a feed, e.g. data providers,
+rights statements, vocabulary schemes, language codes, lang tags and datatypes.
+
+An InternTable can be shared by all parsers of a batch, or per process via get_intern_table():
+
+```
+table = InternTable(max_size=10_000)
+for content in feed:
+    record = EDM_Parser.from_string(content, intern_table=table).parse()
+print(table.stats())
+```
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel
+
+from .value_types import Lit, Ref
+
+INTERNED_PROPERTIES = frozenset(
+    [
+        "edm_dataProvider",
+        "edm_provider",
+        "edm_intermediateProvider",
+        "edm_rights",
+        "dc_rights",
+        "edm_type",
+        "dc_type",
+        "dc_language",
+        "dc_format",
+        "dcterms_medium",
+        "dcterms_conformsTo",
+        "skos_inScheme",
+        "edm_ugc",
+    ]
+)
+"""
+Properties whose values typically repeat across the records of a feed. Values of all other
+properties (titles, descriptions, ids, ...) are mostly unique and are not interned.
+"""
+
+V = TypeVar("V", Ref, Lit)
+
+
+class InternStats(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    saved_bytes: int
+    """
+    Sum of the sizes of all strings that were replaced by an already stored equal string.
+    """
+
+
+class InternTable:
+    """
+    Maps strings to a single stored instance of each. The table holds at most max_size strings and
+    evicts the least recently used ones, so record specific values can't make it grow unbounded.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        self.strings: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, value: str) -> str:
+        """
+        Returns the stored instance of value, storing it first if it is not yet in the table.
+        """
+        value = str(value)
+        stored = self.strings.get(value)
+        if stored is not None:
+            self.strings.move_to_end(value)
+            self.hits += 1
+            if stored is not value:
+                self.saved_bytes += sys.getsizeof(value)
+            return stored
+        self.misses += 1
+        self.strings[value] = value
+        if len(self.strings) > self.max_size:
+            self.strings.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def intern_value(self, value: V, include_value: bool = True) -> V:
+        """
+        Interns the lang tag and datatype of a Lit and, if include_value is set,
+        the value of a Ref or Lit. The object is modified in place and returned.
+        """
+        if include_value:
+            value.value = self.intern(value.value)
+        if isinstance(value, Lit):
+            if value.lang:
+                value.lang = self.intern(value.lang)
+            if value.datatype:
+                value.datatype = self.intern(value.datatype)
+        return value
+
+    def clear(self) -> None:
+        self.strings.clear()
+
+    def stats(self) -> InternStats:
+        return InternStats(
+            size=len(self.strings),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            saved_bytes=self.saved_bytes,
+        )
+
+
+_process_table: Optional[InternTable] = None
+
+
+def get_intern_table(max_size: int = 10_000) -> InternTable:
+    """
+    Returns the intern table shared by the current process, creating it on first use.
+    """
+    global _process_table
+    if _process_table is None:
+        _process_table = InternTable(max_size=max_size)
+    return _process_table
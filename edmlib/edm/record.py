@@ -1,14 +1,26 @@
+import copy
 import json
 import os
-import re
-from typing import List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from pydantic import BaseModel, model_validator
 from pyld import jsonld
-from rdflib import Graph
+from rdflib import Graph, URIRef
 from typing_extensions import Self
 
 from edmlib.edm.jsonld_cached_documentloader import cached_requests_document_loader
+from .base import EDM_BaseClass
 from .classes import (
     CC_License,
     EDM_Agent,
@@ -21,9 +33,18 @@ from .classes import (
     SVCS_Service,
 )
 from .enums import EDM_Namespace
+from .fingerprint import record_fingerprint
+from .framing import JsonLdFramer, get_framer
+from .serialization_cache import disable_cache, enable_cache, get_cache
+from .relative import relativize
+from .diff import EDM_Changeset, diff_records
+from .validation.integrity import (
+    ReferentialIntegrityReport,
+    check_referential_integrity,
+)
 import requests
 
-__all__ = ["EDM_Record"]
+__all__ = ["EDM_Record", "add_records_to_graph"]
 
 
 jsonld.set_document_loader(cached_requests_document_loader())
@@ -34,6 +55,90 @@ edm_jsonld_frame_path = os.path.join(
 with open(edm_jsonld_frame_path) as frame_file:
     edm_jsonld_frame = json.load(frame_file)
 
+# an empty base keeps the relative identifiers of records as they are
+EDM_FRAME_OPTIONS = {"embed": "@always", "base": ""}
+
+
+def get_edm_framer() -> JsonLdFramer:
+    """
+    Returns the shared framer of EDM_Record.get_framed_json_ld(). Call its prepare() method to
+    process the frame and load its remote context ahead of time, e.g. in a worker process.
+    """
+    return get_framer(edm_jsonld_frame, EDM_FRAME_OPTIONS)
+
+
+# Maps the attribute names of EDM_Record to the edm-class they hold, in serialization order.
+RECORD_SECTIONS: Dict[str, Type[EDM_BaseClass]] = {
+    "provided_cho": EDM_ProvidedCHO,
+    "web_resource": EDM_WebResource,
+    "aggregation": ORE_Aggregation,
+    "skos_concept": SKOS_Concept,
+    "edm_agent": EDM_Agent,
+    "edm_time_span": EDM_TimeSpan,
+    "edm_place": EDM_Place,
+    "cc_license": CC_License,
+    "svcs_service": SVCS_Service,
+}
+
+# The sections that hold exactly one instance and are required in every record.
+REQUIRED_SECTIONS = ("provided_cho", "aggregation")
+
+NAMESPACE_BINDINGS: List[Tuple[str, URIRef]] = [
+    (prefix.lower(), URIRef(namespace))
+    for prefix, namespace in EDM_Namespace.get_namespace_tuples()
+]
+
+
+def bind_namespaces(graph: Graph) -> None:
+    """
+    Binds the prefixes of EDM_Namespace to the graph, unless the namespaces are bound already.
+    """
+    store = graph.store
+    for prefix, namespace in NAMESPACE_BINDINGS:
+        if store.prefix(namespace) is None:
+            graph.bind(prefix, namespace)
+
+
+def get_target_context(graph: Graph, context: Optional[Graph]) -> Graph:
+    if context is None:
+        # the default graph of a Dataset or ConjunctiveGraph, otherwise the graph itself
+        return getattr(graph, "default_context", graph)
+    if not graph.context_aware:
+        raise ValueError(
+            "A context can only be given for a Dataset or ConjunctiveGraph."
+        )
+    return context
+
+
+def add_records_to_graph(
+    records: Iterable["EDM_Record"],
+    graph: Graph,
+    context: Optional[Graph] = None,
+    relative: bool = False,
+) -> int:
+    """
+    Adds the triples of many records to an existing graph with a single Graph.addN call, e.g. to
+    bulk load records into one store. Namespaces are bound once. Returns the number of records.
+    With relative=True, identifiers that were parsed from relative references are restored to
+    these references, e.g. for serialization (see edmlib.edm.relative).
+    """
+    bind_namespaces(graph)
+    target = get_target_context(graph, context)
+    count = 0
+
+    def iter_quads() -> Iterator[Tuple[URIRef, URIRef, object, Graph]]:
+        nonlocal count
+        for record in records:
+            count += 1
+            for instance in record.iter_instances():
+                for subject, predicate, obj in instance.iter_rdf_triples():
+                    if relative:
+                        subject, obj = relativize(subject), relativize(obj)
+                    yield subject, predicate, obj, target
+
+    graph.addN(iter_quads())  # type: ignore
+    return count
+
 
 class EDM_Record(BaseModel):
     """
@@ -62,57 +167,105 @@ class EDM_Record(BaseModel):
     cc_license: List[CC_License] | None = None
     svcs_service: List[SVCS_Service] | None = None
 
-    def get_rdf_graph(self):
+    def iter_instances(self) -> Iterator[EDM_BaseClass]:
         """
-        Return whole record as as an RDF - rdflib.Graph object.
+        Yield every class instance contained in the record, starting with the providedCHO,
+        the webresources and the aggregation, followed by all context-class instances.
         """
-        graph = Graph()
-        namespaces = EDM_Namespace.get_namespace_tuples()
-        for tup in namespaces:
-            graph.bind(tup[0].lower(), tup[1])
-        # TODO: abstract the instance list into a callable hook
-        for instance in [
-            "provided_cho",
-            "web_resource",
-            "aggregation",
-            "skos_concept",
-            "edm_agent",
-            "edm_time_span",
-            "edm_place",
-            "cc_license",
-            "svcs_service",
-        ]:
+        for instance in RECORD_SECTIONS:
             attval = getattr(self, instance)
             if attval:
                 if isinstance(attval, list):
-                    for val in attval:  # type: ignore
-                        # print("val was list for", val, attval) # type: ignore
-                        triples = val.get_triples()  # type: ignore
-                        [graph.add(triple) for triple in triples]  # type: ignore
+                    yield from attval
                 else:
-                    # print("val was not a list for", attval)
-                    triples = attval.get_triples()
-                    [graph.add(triple) for triple in triples]
+                    yield attval
+
+    def get_rdf_graph(self, relative: bool = False):
+        """
+        Return whole record as as an RDF - rdflib.Graph object.
+        With relative=True, relative identifiers of the parsed document are kept as they were.
+        With the serialization cache enabled, the graph is shared and must not be modified.
+        """
+        return self.get_cached_output(
+            ("graph", relative), lambda: self.add_to_graph(Graph(), relative=relative)
+        )
+
+    def add_to_graph(
+        self, graph: Graph, context: Optional[Graph] = None, relative: bool = False
+    ) -> Graph:
+        """
+        Adds the triples of the record to an existing graph and returns it. For a Dataset or
+        ConjunctiveGraph, context is the named graph to add to (default: the default graph).
+        Use add_records_to_graph() to add many records at once.
+        """
+        add_records_to_graph([self], graph, context=context, relative=relative)
         return graph
 
     def serialize(self, format: str = "pretty-xml", max_depth: int = 1) -> str:
         """
         Serialize graph to rdf/xml with pretty-formatting.
         """
-        graph = self.get_rdf_graph()
-        return graph.serialize(format=format, max_depth=max_depth)
+        return self.get_cached_output(
+            ("serialize", format, max_depth),
+            lambda: self.get_rdf_graph(relative=True).serialize(
+                format=format, max_depth=max_depth
+            ),
+        )
 
     def get_framed_json_ld(self):
-        graph = self.get_rdf_graph()
-        json_str = graph.serialize(format="json-ld", auto_compact=True)
-        # TODO: this needs fixing, as there a relative uri replacements that can be broken by this
-        json_str = re.sub('file:///.+?(?P<uri>[^#/]+)"', r'#\g<uri>"', json_str)
-        json_data = json.loads(json_str)
-        return jsonld.frame(
-            json_data,
-            edm_jsonld_frame,
-            options={"embed": "@always"},
-        )
+        """
+        Return the record as JSON-LD, framed with the edm frame. The frame and its context are
+        processed once per process (see edmlib.edm.framing).
+        """
+
+        def frame() -> Dict:
+            graph = self.get_rdf_graph(relative=True)
+            # expanded json-ld without a context, so only the frame context is processed
+            json_data = json.loads(graph.serialize(format="json-ld"))
+            return get_edm_framer().frame(json_data)
+
+        # the cached document is copied, as callers may modify it
+        return copy.deepcopy(self.get_cached_output(("framed-json-ld",), frame))
+
+    def enable_serialization_cache(self) -> Self:
+        """
+        Caches the graph and the serialized outputs of the record until it is changed,
+        see edmlib.edm.serialization_cache.
+        """
+        enable_cache(self)
+        return self
+
+    def disable_serialization_cache(self) -> None:
+        disable_cache(self)
+
+    def get_cached_output(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Returns the cached output for key if the serialization cache is enabled and the record
+        has not changed since, otherwise the output of build().
+        """
+        cache = get_cache(self)
+        if cache is None:
+            return build()
+        return cache.get(self.model_dump_json(), key, build)
+
+    def get_fingerprint(self) -> str:
+        """
+        Stable hash over the sorted triples of the record, see edmlib.edm.fingerprint.
+        """
+        return record_fingerprint(self)
+
+    def check_referential_integrity(self) -> ReferentialIntegrityReport:
+        """
+        Optional check for dangling in-record references and unused context-class instances.
+        See edmlib.edm.validation.integrity.check_referential_integrity.
+        """
+        return check_referential_integrity(self)
+
+    def diff(self, other: "EDM_Record") -> EDM_Changeset:
+        """
+        Structural changeset from this record to other, see edmlib.edm.diff.
+        """
+        return diff_records(self, other)
 
     @model_validator(mode="after")
     def validate_provided_cho_identity(self) -> Self:
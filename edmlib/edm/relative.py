@@ -0,0 +1,64 @@
+"""
+Base IRI for records with relative identifiers, e.g. rdf:about="#CHO".
+
+IRIs in the RDF abstract syntax must be absolute, and Ref does not accept local identifiers. The
+parsers therefore resolve relative references against RELATIVE_BASE, a reserved IRI that can't
+clash with real identifiers. The resolved IRIs are Refs like any other, and relativize() restores
+the original relative reference when a record is serialized, at the level of single rdflib terms.
+Validation judges these IRIs by their original reference, so e.g. "/path" is still rejected.
+
+```
+resolve("#CHO")  # 'http://relative.invalid/base/record#CHO'
+relativize(URIRef(resolve("#CHO")))  # URIRef('#CHO')
+```
+"""
+
+from urllib.parse import urljoin, urlsplit
+
+from rdflib import URIRef
+from rdflib.term import Node
+
+RELATIVE_ROOT = "http://relative.invalid"
+RELATIVE_DIRECTORY = RELATIVE_ROOT + "/base/"
+RELATIVE_BASE = RELATIVE_DIRECTORY + "record"
+"""
+The base IRI of every parsed document. Fragments ("#CHO") resolve against the document, relative
+paths ("cho1") against its directory and absolute paths ("/cho1") against the root. Only references
+that leave the directory with "../" can't be restored exactly.
+"""
+
+
+def resolve(iri: str) -> str:
+    """
+    Resolves a relative reference against RELATIVE_BASE. Absolute IRIs are returned unchanged.
+    """
+    if urlsplit(iri).scheme:
+        return iri
+    return urljoin(RELATIVE_BASE, iri)
+
+
+def get_relative_reference(iri: str) -> str:
+    """
+    Returns the original relative reference of an IRI that was resolved against RELATIVE_BASE.
+    All other IRIs are returned unchanged.
+    """
+    if not iri.startswith(RELATIVE_ROOT):
+        return iri
+    if iri.startswith(RELATIVE_BASE):
+        rest = iri[len(RELATIVE_BASE) :]
+        if not rest or rest[0] in "#?":
+            return rest
+    if iri.startswith(RELATIVE_DIRECTORY):
+        return iri[len(RELATIVE_DIRECTORY) :]
+    if iri.startswith(RELATIVE_ROOT + "/"):
+        return iri[len(RELATIVE_ROOT) :]
+    return iri
+
+
+def relativize(term: Node) -> Node:
+    """
+    Applies get_relative_reference() to IRIs, other terms are returned unchanged.
+    """
+    if isinstance(term, URIRef) and term.startswith(RELATIVE_ROOT):
+        return URIRef(get_relative_reference(term))
+    return term
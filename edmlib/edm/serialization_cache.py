@@ -0,0 +1,70 @@
+"""
+Optional per-record cache of the rdflib graph and the serialized outputs of an EDM_Record.
+
+A cache is only valid for one state of the record. The state is the JSON dump of the record, which
+is compared on every access: any change to the record, an assignment to a nested field or an
+in-place change of a list, invalidates the cache, without hooks on the nested models. Dumping a
+record to JSON is about two orders of magnitude cheaper than building and serializing its graph.
+
+The caches are kept outside of the records, so that they are not part of model equality, copies
+or pickles, and are dropped when their record is garbage collected.
+
+```
+record.enable_serialization_cache()
+record.serialize()  # built
+record.serialize()  # cached
+record.provided_cho.dc_title.append(Lit(value="Titel"))
+record.serialize()  # built again
+```
+"""
+
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
+
+if TYPE_CHECKING:
+    from .record import EDM_Record
+
+
+class SerializationCache:
+    """
+    Outputs of a record by key, e.g. ("serialize", format, max_depth), for a single state.
+    """
+
+    def __init__(self) -> None:
+        self.state: Optional[str] = None
+        self.outputs: Dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, state: str, key: Hashable, build: Callable[[], Any]) -> Any:
+        if state != self.state:
+            self.state = state
+            self.outputs.clear()
+        if key in self.outputs:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.outputs[key] = build()
+        return self.outputs[key]
+
+
+_caches: Dict[int, SerializationCache] = {}
+
+
+def enable_cache(record: "EDM_Record") -> SerializationCache:
+    """
+    Enables the cache of a record and returns it. Enabling it again keeps the existing cache.
+    """
+    key = id(record)
+    if key not in _caches:
+        _caches[key] = SerializationCache()
+        weakref.finalize(record, _caches.pop, key, None)
+    return _caches[key]
+
+
+def disable_cache(record: "EDM_Record") -> None:
+    _caches.pop(id(record), None)
+
+
+def get_cache(record: "EDM_Record") -> Optional[SerializationCache]:
+    return _caches.get(id(record))
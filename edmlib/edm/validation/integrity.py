@@ -0,0 +1,164 @@
+"""
+Referential integrity checks for the references within a single record.
+
+These checks are not part of the model validation of EDM_Record, because references
+to external vocabularies (e.g. GND or Getty AAT) are perfectly valid edm. Run them on demand
+via check_referential_integrity().
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Set, Tuple
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+from ..compact import CompactRef
+from ..value_types import Ref
+
+if TYPE_CHECKING:
+    from ..record import EDM_Record
+
+# Maps the properties whose references must resolve within the same record to the class names
+# that they are expected to resolve to.
+REFERENCE_PROPERTIES: Dict[str, Tuple[str, ...]] = {
+    "edm_aggregatedCHO": ("EDM_ProvidedCHO",),
+    "svcs_has_service": ("SVCS_Service",),
+}
+
+# Maps the properties that link to web resources to their expected class names. EDM_WebResource
+# instances are optional and the links usually share the host of the record, so a link is only
+# reported if it resolves to an instance of another class within the record.
+LINK_PROPERTIES: Dict[str, Tuple[str, ...]] = {
+    "edm_isShownBy": ("EDM_WebResource",),
+    "edm_isShownAt": ("EDM_WebResource",),
+    "edm_hasView": ("EDM_WebResource",),
+    "edm_object": ("EDM_WebResource",),
+    "edm_isNextInSequence": ("EDM_WebResource",),
+}
+
+# Maps the properties that point to context-classes to their expected class names. These usually
+# refer to external vocabularies or rights statements, so a reference is only checked if it
+# resolves to an instance within the record, or if it has the host of the record's own ids.
+CONTEXT_REFERENCE_PROPERTIES: Dict[str, Tuple[str, ...]] = {
+    "dc_creator": ("EDM_Agent",),
+    "dc_subject": ("SKOS_Concept", "EDM_Agent", "EDM_Place", "EDM_TimeSpan"),
+    "dcterms_spatial": ("EDM_Place",),
+    "dcterms_temporal": ("EDM_TimeSpan",),
+    "edm_rights": ("CC_License",),
+}
+
+CONTEXT_CLASSES: Tuple[str, ...] = (
+    "EDM_Agent",
+    "EDM_Place",
+    "EDM_TimeSpan",
+    "SKOS_Concept",
+    "CC_License",
+    "SVCS_Service",
+)
+
+
+class DanglingReference(BaseModel):
+    """
+    A reference from a property of an instance that does not resolve to an instance
+    of one of the expected classes within the record.
+    """
+
+    cls: str
+    id: str
+    property: str
+    value: str
+    expected: List[str]
+
+
+class UnusedEntity(BaseModel):
+    """
+    A context-class instance that is not referenced from anywhere within the record.
+    """
+
+    cls: str
+    id: str
+
+
+class ReferentialIntegrityReport(BaseModel):
+    dangling: List[DanglingReference] = []
+    unused: List[UnusedEntity] = []
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.dangling and not self.unused
+
+
+def _iter_refs(value: Any):
+    if isinstance(value, (Ref, CompactRef)):
+        yield value
+    elif isinstance(value, list):
+        for el in value:  # type: ignore
+            if isinstance(el, (Ref, CompactRef)):
+                yield el
+
+
+def check_referential_integrity(
+    record: "EDM_Record",
+    properties: Mapping[str, Tuple[str, ...]] = REFERENCE_PROPERTIES,
+    context_properties: Mapping[str, Tuple[str, ...]] = CONTEXT_REFERENCE_PROPERTIES,
+    link_properties: Mapping[str, Tuple[str, ...]] = LINK_PROPERTIES,
+) -> ReferentialIntegrityReport:
+    """
+    Checks that the Refs of the given properties resolve to an instance of the expected class
+    within the same record and reports context-class instances that are never referenced.
+    Refs of the context_properties are only reported if they resolve to an instance of another
+    class, or if they have the same host as the providedCHO or the aggregation, i.e. look like
+    they belong to the record; references to external vocabularies are not reported.
+    Refs of the link_properties are only reported if they resolve to an instance of another class.
+
+    The ids of all instances are hashed once and all values are visited in a single pass,
+    so the check runs in linear time of the record size.
+    """
+    instances = list(record.iter_instances())
+    local_ids: Dict[str, str] = {inst.id.value: inst.label for inst in instances}
+    record_hosts = {
+        urlsplit(inst.id.value).netloc
+        for inst in (record.provided_cho, record.aggregation)
+    }
+
+    referenced: Set[str] = set()
+    dangling: List[DanglingReference] = []
+    for inst in instances:
+        for field_name in inst.__class__.model_fields:
+            if field_name == "id":
+                continue
+            expected = properties.get(field_name)
+            strict = expected is not None
+            by_host = False
+            if not strict:
+                expected = context_properties.get(field_name)
+                by_host = expected is not None
+            if not strict and not by_host:
+                expected = link_properties.get(field_name)
+            for ref in _iter_refs(getattr(inst, field_name)):
+                referenced.add(ref.value)
+                if not expected:
+                    continue
+                label = local_ids.get(ref.value)
+                if label in expected:
+                    continue
+                if (
+                    strict
+                    or label is not None
+                    or (by_host and urlsplit(ref.value).netloc in record_hosts)
+                ):
+                    dangling.append(
+                        DanglingReference(
+                            cls=inst.label,
+                            id=inst.id.value,
+                            property=field_name,
+                            value=ref.value,
+                            expected=list(expected),
+                        )
+                    )
+
+    unused = [
+        UnusedEntity(cls=inst.label, id=inst.id.value)
+        for inst in instances
+        if inst.label in CONTEXT_CLASSES and inst.id.value not in referenced
+    ]
+    return ReferentialIntegrityReport(dangling=dangling, unused=unused)
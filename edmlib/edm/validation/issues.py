@@ -0,0 +1,83 @@
+"""
+Typed validation issues, as collected by EDM_Parser.validate().
+
+Unlike the pydantic ValidationError, which is raised at the first failing assertion, a list
+of EDM_ValidationIssue objects describes every problem found in a record. Each issue is a
+pydantic model, so it can be dumped to json and streamed as jsonl via write_jsonl().
+"""
+
+from enum import StrEnum
+from typing import IO, Dict, Iterable, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class ISSUE_KIND(StrEnum):
+    """
+    Encapsulates the categories of validation issues.
+    """
+
+    STRUCTURE = "structure"
+    CARDINALITY = "cardinality"
+    MISSING = "missing"
+    VALUE_TYPE = "value_type"
+    URI = "uri"
+    LANGUAGE = "language"
+    RIGHTS = "rights"
+    CONDITIONAL = "conditional"
+
+    @classmethod
+    def list(cls) -> list[str]:
+        return [el.value for el in cls]
+
+
+# Maps the names of the model validators of the edm-classes to the issue kind and the property
+# they check, so that their assertions can be reported as typed issues.
+MODEL_VALIDATOR_ISSUES: Dict[str, Tuple[ISSUE_KIND, Optional[str]]] = {
+    "validate_conditional_attributes": (ISSUE_KIND.CONDITIONAL, None),
+    "validate_edm_rights": (ISSUE_KIND.RIGHTS, "edm_rights"),
+    "validate_web_resource": (ISSUE_KIND.RIGHTS, "edm_rights"),
+    "validate_dependent_edm": (ISSUE_KIND.CONDITIONAL, None),
+    "validate_edm_type": (ISSUE_KIND.LANGUAGE, "edm_type"),
+    "validate_skos_pref_label": (ISSUE_KIND.LANGUAGE, "skos_prefLabel"),
+    "validate_provided_cho_identity": (ISSUE_KIND.STRUCTURE, "edm_aggregatedCHO"),
+}
+
+
+class EDM_ValidationIssue(BaseModel):
+    """
+    A single validation problem within a record.
+
+    record: the id of the aggregation the issue belongs to (if it could be determined)
+    cls: the name of the edm-class, e.g. "ORE_Aggregation"
+    id: the id of the instance of the edm-class
+    property: the attribute name of the property, e.g. "edm_rights"
+    value: the offending value as a string
+    """
+
+    kind: ISSUE_KIND
+    message: str
+    record: Optional[str] = None
+    cls: Optional[str] = None
+    id: Optional[str] = None
+    property: Optional[str] = None
+    value: Optional[str] = None
+
+    def code(self) -> str:
+        """
+        A stable error code of the form "{kind}:{cls}.{property}", suited for aggregation.
+        """
+        return f"{self.kind.value}:{self.cls or '*'}.{self.property or '*'}"
+
+
+def write_jsonl(issues: Iterable[EDM_ValidationIssue], fp: IO[str]) -> int:
+    """
+    Writes one compact json object per issue to the given text stream.
+    Returns the number of written lines.
+    """
+    count = 0
+    for issue in issues:
+        fp.write(issue.model_dump_json(exclude_none=True))
+        fp.write("\n")
+        count += 1
+    return count
@@ -1,5 +1,6 @@
 from rdflib.term import _is_valid_uri
 from edmlib.edm.exceptions import InvalidRefException
+from edmlib.edm.relative import get_relative_reference
 import urllib.parse
 
 """
@@ -80,7 +81,8 @@ def uri_is_not_local(uri: str) -> bool:
 
 
 def uri_is_not_path(uri: str) -> bool:
-    return not uri.startswith("/")
+    # relative references are resolved against RELATIVE_BASE by the parsers
+    return not get_relative_reference(uri).startswith("/")
 
 
 def is_valid_uri(uri: str, strict: bool = False) -> bool:
@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field, StringConstraints, model_validator, field
 from typing import Optional
 from typing_extensions import Self
 from edmlib.edm.validation.uri import is_valid_uri, sanitize_url_quotation
+from edmlib.edm.compact import CompactLit, CompactRef
 from rdflib import URIRef, Literal
 
 
@@ -19,12 +20,20 @@ class Ref(BaseModel):
     value: Annotated[str, StringConstraints(min_length=1, strip_whitespace=True)]
     is_ref: bool = True
 
+    def __eq__(self, other: object) -> bool:
+        """
+        A Ref equals the CompactRef with the same value.
+        """
+        if isinstance(other, CompactRef):
+            return CompactRef.from_ref(self) == other
+        return super().__eq__(other)
+
     @field_validator("value")
     @classmethod
     def validate_value_as_uri(cls, value: str):
         value = value.strip()
         value = sanitize_url_quotation(value)
-        assert is_valid_uri(value)
+        assert is_valid_uri(value), f"Invalid uri: {value}"
         return value
 
     def to_rdflib(self):
@@ -47,6 +56,14 @@ class Lit(BaseModel):
     datatype: Optional[str] = None
     normalize: Optional[bool] = False
 
+    def __eq__(self, other: object) -> bool:
+        """
+        A Lit equals the CompactLit with the same value, lang tag, datatype and normalize flag.
+        """
+        if isinstance(other, CompactLit):
+            return CompactLit.from_lit(self) == other
+        return super().__eq__(other)
+
     @model_validator(mode="after")
     def validate_consistency(self) -> Self:
         """
@@ -76,4 +93,11 @@ class Lit(BaseModel):
         )
 
 
-MixedValuesList: TypeAlias = List[Union[Lit, Ref]] | List[Ref] | List[Lit]
+AnyRef: TypeAlias = Union[Ref, CompactRef]
+AnyLit: TypeAlias = Union[Lit, CompactLit]
+"""
+The field types of the edm-classes: a value is either a pydantic model or its compact counterpart,
+see edmlib.edm.compact.
+"""
+
+MixedValuesList: TypeAlias = List[Union[AnyLit, AnyRef]] | List[AnyRef] | List[AnyLit]
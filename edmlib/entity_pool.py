@@ -0,0 +1,220 @@
+"""
+Cross-record pool for context-class entities (agents, places, concepts, timespans, licenses, services).
+
+The same entity, e.g. a painter, is often contained in thousands of records of a provider.
+EntityPool.share() replaces the context entities of a record with one shared, frozen instance per
+id and content, so that equal entities are held in memory only once. The values of the shared
+instances are immutable CompactRef/CompactLit, see edmlib.edm.compact. write_ntriples() writes the
+triples of each shared entity only once for a whole batch of records.
+
+```
+pool = EntityPool()
+records = [pool.share(record) for record in records]
+with open("batch.nt", "w") as fp:
+    pool.write_ntriples(records, fp)
+```
+"""
+
+from collections import Counter
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict
+
+from edmlib.edm import EDM_Record
+from edmlib.edm.base import EDM_BaseClass
+from edmlib.edm.compact import compact
+from edmlib.edm.fingerprint import instance_fingerprint
+
+CONTEXT_SECTIONS = (
+    "skos_concept",
+    "edm_agent",
+    "edm_time_span",
+    "edm_place",
+    "cc_license",
+    "svcs_service",
+)
+"""
+The attributes of EDM_Record that hold context-class instances, which are shared by the pool.
+"""
+
+_frozen_classes: Dict[type, type] = {}
+
+
+def get_frozen_class(cls: Type[EDM_BaseClass]) -> Type[EDM_BaseClass]:
+    """
+    Returns a frozen subclass of an edm-class with the same name, so that labels and class refs
+    stay the same. Assigning to a field of an instance of it raises a pydantic ValidationError.
+    """
+    if cls not in _frozen_classes:
+        _frozen_classes[cls] = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "__doc__": cls.__doc__,
+                "__reduce__": _reduce_frozen,
+                "model_config": ConfigDict(**{**cls.model_config, "frozen": True}),
+            },
+        )
+    return _frozen_classes[cls]
+
+
+def _reduce_frozen(instance: EDM_BaseClass) -> Any:
+    # the frozen classes cannot be found by their name, so they are pickled by their edm-class
+    return _restore_frozen, (instance.__class__.__bases__[0], instance.__getstate__())
+
+
+def _restore_frozen(cls: Type[EDM_BaseClass], state: Dict[str, Any]) -> EDM_BaseClass:
+    frozen_cls = get_frozen_class(cls)
+    instance = frozen_cls.__new__(frozen_cls)
+    instance.__setstate__(state)
+    return instance
+
+
+class FrozenList(list):
+    """
+    The list values of a shared entity. They cannot be changed in place, like the frozen fields.
+    """
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{self.__class__.__name__} is immutable.")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __reduce__(self) -> Any:
+        return FrozenList, (list(self),)
+
+
+def copy_value(value: Any) -> Any:
+    # values are stored as compact copies, so that changes to the original entity do not affect
+    # the shared one and the values of the shared entity cannot be changed in place
+    if isinstance(value, list):
+        return FrozenList(compact(el) for el in value)
+    return value if value is None else compact(value)
+
+
+def is_frozen(instance: BaseModel) -> bool:
+    return bool(instance.model_config.get("frozen"))
+
+
+class PoolStats(BaseModel):
+    entities: int
+    hits: int
+    misses: int
+    conflicts: int
+    """
+    Number of ids that occur with more than one content, e.g. an agent with differing labels.
+    """
+
+
+class EntityPool:
+    """
+    Deduplicates context-class entities by class, id and content hash.
+    Entities with the same id but a different content are kept as separate variants.
+    """
+
+    def __init__(self) -> None:
+        self.entities: Dict[Tuple[str, str, str], EDM_BaseClass] = {}
+        self.variants: Dict[Tuple[str, str], Set[str]] = {}
+        self.usage: Counter = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def add(self, entity: EDM_BaseClass) -> EDM_BaseClass:
+        """
+        Returns the shared, frozen instance for an entity, adding a frozen copy first if no equal
+        entity is in the pool yet.
+        """
+        key = (entity.label, entity.id.value, instance_fingerprint(entity))
+        shared = self.entities.get(key)
+        if shared is None:
+            self.misses += 1
+            frozen_cls = get_frozen_class(entity.__class__)  # type: ignore
+            shared = frozen_cls.model_construct(
+                _fields_set=entity.model_fields_set,
+                **{
+                    name: copy_value(getattr(entity, name))
+                    for name in entity.__class__.model_fields
+                },
+            )
+            self.entities[key] = shared
+            self.variants.setdefault(key[:2], set()).add(key[2])
+        else:
+            self.hits += 1
+        self.usage[key] += 1
+        return shared
+
+    def share(self, record: EDM_Record) -> EDM_Record:
+        """
+        Replaces all context-class instances of the record with the shared instances of the pool.
+        The record is modified in place and returned.
+        """
+        for section in CONTEXT_SECTIONS:
+            entities = getattr(record, section)
+            if entities:
+                setattr(record, section, [self.add(entity) for entity in entities])
+        return record
+
+    def get(self, entity_id: str, label: Optional[str] = None) -> List[EDM_BaseClass]:
+        """
+        Returns all variants of the entity with the given id.
+        """
+        return [
+            entity
+            for key, entity in self.entities.items()
+            if key[1] == entity_id and (label is None or key[0] == label)
+        ]
+
+    def conflicts(self) -> List[Tuple[str, str]]:
+        """
+        Returns the (class, id) pairs of all entities that occur with more than one content.
+        """
+        return [key for key, hashes in self.variants.items() if len(hashes) > 1]
+
+    def shared_entities(self, min_usage: int = 2) -> Iterator[EDM_BaseClass]:
+        """
+        Yields all entities that were added at least min_usage times, most used first.
+        """
+        for key, count in self.usage.most_common():
+            if count < min_usage:
+                break
+            yield self.entities[key]
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            entities=len(self.entities),
+            hits=self.hits,
+            misses=self.misses,
+            conflicts=len(self.conflicts()),
+        )
+
+    def iter_triples(
+        self, records: Iterable[EDM_Record]
+    ) -> Iterator[Tuple[Any, Any, Any]]:
+        """
+        Yields the triples of all records. Frozen (i.e. shared) instances are only emitted once.
+        """
+        written: Set[int] = set()
+        for record in records:
+            for instance in record.iter_instances():
+                if is_frozen(instance):
+                    if id(instance) in written:
+                        continue
+                    written.add(id(instance))
+                yield from instance.get_triples()
+
+    def write_ntriples(self, records: Iterable[EDM_Record], fp: IO[str]) -> int:
+        """
+        Writes the triples of all records as n-triples to fp, with every shared entity written once.
+        Returns the number of written triples.
+        """
+        count = 0
+        for triple in self.iter_triples(records):
+            fp.write(" ".join(term.n3() for term in triple) + " .\n")
+            count += 1
+        return count
@@ -0,0 +1,280 @@
+"""
+Direct parser for JSON-LD records that are compacted or framed against the Kulturpool context.
+
+The compacted keys of the context are the local names of the edm properties, e.g. "title" for
+dc_title or "isShownBy" for edm_isShownBy. Only dc:rights/edm:rights and dc:type/edm:type are
+prefixed ("dcRights", "edmRights", "dcType", "edmType"). EDM_JSONLD_Parser maps these keys directly
+onto the fields of the edm-classes, without expanding the document to triples in an rdflib Graph
+and querying them back out.
+
+Documents with another context, or with keys, types or node shapes that are not recognized, are
+parsed with the generic rdflib path of EDM_Parser instead.
+
+```
+record = EDM_JSONLD_Parser.from_file("record.json").parse()
+```
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from rdflib import XSD, Graph
+
+from edmlib.edm import EDM_Record, Lit, Ref
+from edmlib.edm.base import EDM_BaseClass
+from edmlib.edm.enums import EDM_Namespace
+from edmlib.edm.record import RECORD_SECTIONS, REQUIRED_SECTIONS
+from edmlib.edm.relative import RELATIVE_BASE, resolve
+from edmlib.parser import EDM_Parser, get_added_values, validate_values
+
+KULTURPOOL_CONTEXT = "https://api.kulturpool.at/ns/v1/edm.json"
+
+KNOWN_CONTEXTS = (KULTURPOOL_CONTEXT,)
+"""
+Contexts whose compacted keys are understood by EDM_JSONLD_Parser.
+"""
+
+SPECIAL_KEYS = {
+    "svcs_has_service": "hasService",
+    "wgs84_pos_lat": "lat",
+    "wgs84_pos_long": "long",
+    "wgs84_pos_alt": "alt",
+}
+
+PREFIXED_NAMES = ("rights", "type")
+"""
+Local names that exist in more than one namespace and are therefore prefixed in the context.
+"""
+
+DEFAULT_TYPES = {
+    "aggregatedCHO": "EDM_ProvidedCHO",
+    "isShownBy": "EDM_WebResource",
+    "isShownAt": "EDM_WebResource",
+    "hasView": "EDM_WebResource",
+    "object": "EDM_WebResource",
+}
+"""
+Classes of embedded nodes without a type, as implied by the edm frame.
+"""
+
+ID_KEYS = ("id", "@id")
+TYPE_KEYS = ("type", "@type")
+
+
+class UnknownShape(Exception):
+    """
+    Raised internally if a document can't be mapped directly; the rdflib path is used instead.
+    """
+
+
+def get_compact_key(field_name: str) -> str:
+    """
+    Returns the key of an edm-class field in the Kulturpool context, e.g. 'dc_title' -> 'title'.
+    """
+    if field_name in SPECIAL_KEYS:
+        return SPECIAL_KEYS[field_name]
+    prefix, _, local = field_name.partition("_")
+    if local in PREFIXED_NAMES:
+        return prefix + local.capitalize()
+    return local
+
+
+def get_field_keys(cls: Type[EDM_BaseClass]) -> Dict[str, str]:
+    """
+    Maps the compacted keys and the full property IRIs to the field names of an edm-class.
+    """
+    keys: Dict[str, str] = {}
+    for field_name in cls.model_fields:
+        if field_name == "id":
+            continue
+        keys[get_compact_key(field_name)] = field_name
+        full_uri = EDM_Namespace.get_from_name(field_name, return_full_uri=True)
+        if full_uri:
+            keys[str(full_uri)] = field_name
+    return keys
+
+
+CLASSES: Dict[str, Type[EDM_BaseClass]] = {
+    cls.__name__: cls for cls in RECORD_SECTIONS.values()
+}
+TYPES: Dict[str, str] = {}
+for _cls in CLASSES.values():
+    TYPES[_cls.__name__.split("_")[1]] = _cls.__name__
+    TYPES[str(_cls.get_class_ref())] = _cls.__name__
+FIELD_KEYS = {name: get_field_keys(cls) for name, cls in CLASSES.items()}
+
+
+def accepts_only_refs(cls: Type[EDM_BaseClass], field_name: str) -> bool:
+    annotation = str(cls.model_fields[field_name].annotation)
+    return "Ref" in annotation and "Lit" not in annotation
+
+
+def expand_datatype(datatype: str) -> str:
+    if datatype.startswith("xsd:"):
+        return str(XSD[datatype[4:]])
+    return datatype
+
+
+def get_first(node: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        if key in node:
+            return node[key]
+    return None
+
+
+class EDM_JSONLD_Parser:
+    """
+    Parser for JSON-LD records compacted against the Kulturpool context. Returns an EDM_Record,
+    like EDM_Parser.parse(), and applies the same value validation and added values.
+    """
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "EDM_JSONLD_Parser":
+        with open(path, "rb") as file:
+            return cls.from_string(file.read())
+
+    @classmethod
+    def from_string(cls, content: Union[str, bytes]) -> "EDM_JSONLD_Parser":
+        return cls(json.loads(content))
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+        self.nodes: Dict[str, Tuple[str, Dict[str, List[Union[Ref, Lit]]]]] = {}
+
+    def is_known_context(self) -> bool:
+        if not isinstance(self.data, dict):
+            return False
+        context = self.data.get("@context")
+        contexts = context if isinstance(context, list) else [context]
+        return bool(contexts) and all(ctx in KNOWN_CONTEXTS for ctx in contexts)
+
+    def parse(self) -> EDM_Record:
+        """
+        Maps the document directly if its shape is recognized, otherwise parses it with rdflib.
+        """
+        try:
+            return self.parse_direct()
+        except UnknownShape:
+            return self.get_rdflib_parser().parse()
+
+    def get_rdflib_parser(self) -> EDM_Parser:
+        graph = Graph().parse(
+            data=json.dumps(self.data), format="json-ld", publicID=RELATIVE_BASE
+        )
+        return EDM_Parser(graph)
+
+    def parse_direct(self) -> EDM_Record:
+        """
+        Maps the document directly onto the edm-classes. Raises UnknownShape if that is not possible.
+        """
+        if not self.is_known_context():
+            raise UnknownShape("unknown context")
+        self.nodes = {}
+        graph = self.data.get("@graph")
+        for node in graph if isinstance(graph, list) else [self.data]:
+            if not isinstance(node, dict):
+                raise UnknownShape("unknown node")
+            self.read_node(node)
+
+        instances: Dict[str, List[Any]] = {section: [] for section in RECORD_SECTIONS}
+        sections = {cls.__name__: section for section, cls in RECORD_SECTIONS.items()}
+        for node_id, (label, values) in self.nodes.items():
+            cls = CLASSES[label]
+            fields: Dict[str, Any] = {}
+            for field_name, field_values in values.items():
+                value = validate_values(cls, field_name, field_values)
+                if value is not None:
+                    fields[field_name] = value
+            fields.update(get_added_values(cls))
+            instances[sections[label]].append(cls(id=Ref(value=node_id), **fields))
+
+        for section in REQUIRED_SECTIONS:
+            if len(instances[section]) != 1:
+                raise UnknownShape(f"expected exactly one {section}")
+        return EDM_Record(
+            **{
+                section: values[0] if section in REQUIRED_SECTIONS else values
+                for section, values in instances.items()
+            }
+        )
+
+    def read_node(self, node: Dict[str, Any], key: Optional[str] = None) -> Ref:
+        """
+        Registers a node with its properties and returns a Ref to it.
+        Nodes that only consist of an id are references to nodes described elsewhere.
+        """
+        node_id = get_first(node, ID_KEYS)
+        if not isinstance(node_id, str):
+            raise UnknownShape("node without id")
+        node_id = resolve(node_id)
+        properties = {
+            k: v
+            for k, v in node.items()
+            if k not in ID_KEYS + TYPE_KEYS + ("@context",)
+        }
+        node_type = get_first(node, TYPE_KEYS)
+        if not properties and node_type is None:
+            return Ref.model_construct(value=node_id)
+
+        if isinstance(node_type, list):
+            if len(node_type) != 1:
+                raise UnknownShape("node with multiple types")
+            node_type = node_type[0]
+        label = TYPES.get(node_type) if node_type else DEFAULT_TYPES.get(key or "")
+        if label is None:
+            raise UnknownShape(f"unknown type {node_type}")
+
+        known_label, values = self.nodes.setdefault(node_id, (label, {}))
+        if known_label != label:
+            raise UnknownShape("node with multiple types")
+        cls = CLASSES[label]
+        field_keys = FIELD_KEYS[label]
+        for prop, prop_values in properties.items():
+            field_name = field_keys.get(prop)
+            if field_name is None:
+                raise UnknownShape(f"unknown key {prop} for {label}")
+            only_refs = accepts_only_refs(cls, field_name)
+            target = values.setdefault(field_name, [])
+            for value in (
+                prop_values if isinstance(prop_values, list) else [prop_values]
+            ):
+                converted = self.read_value(value, prop, only_refs)
+                if converted is not None and converted not in target:
+                    target.append(converted)
+        return Ref.model_construct(value=node_id)
+
+    def read_value(
+        self, value: Any, key: str, only_refs: bool
+    ) -> Optional[Union[Ref, Lit]]:
+        if isinstance(value, dict):
+            if "@value" in value:
+                literal = value["@value"]
+                datatype = get_first(value, TYPE_KEYS)
+                return self.to_lit(
+                    literal,
+                    lang=value.get("@language"),
+                    datatype=expand_datatype(datatype) if datatype else None,
+                )
+            return self.read_node(value, key)
+        if isinstance(value, str):
+            if only_refs:
+                return Ref.model_construct(value=resolve(value))
+            return self.to_lit(value)
+        if isinstance(value, bool):
+            return self.to_lit("true" if value else "false", datatype=str(XSD.boolean))
+        if isinstance(value, int):
+            return self.to_lit(str(value), datatype=str(XSD.integer))
+        if isinstance(value, float):
+            return self.to_lit(str(value), datatype=str(XSD.double))
+        raise UnknownShape(f"unknown value for {key}")
+
+    def to_lit(
+        self, value: Any, lang: Optional[str] = None, datatype: Optional[str] = None
+    ) -> Optional[Lit]:
+        # empty values are skipped, as in EDM_Parser.get_values()
+        if not isinstance(value, str):
+            raise UnknownShape("non-string @value")
+        if value.strip() == "":
+            return None
+        return Lit.model_construct(value=value, lang=lang, datatype=datatype)
@@ -0,0 +1,81 @@
+"""
+Lazy view of a record, in which each section is extracted from the graph and validated on first access.
+
+```
+view = EDM_Parser.from_string(content).lazy()
+view.provided_cho.dc_title      # only the providedCHO is extracted
+view.aggregation.edm_isShownBy  # now also the aggregation
+record = view.to_record()       # all remaining sections
+```
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from edmlib.edm import (
+    CC_License,
+    EDM_Agent,
+    EDM_Place,
+    EDM_ProvidedCHO,
+    EDM_Record,
+    EDM_TimeSpan,
+    EDM_WebResource,
+    ORE_Aggregation,
+    SKOS_Concept,
+    SVCS_Service,
+)
+from edmlib.edm.record import RECORD_SECTIONS
+
+if TYPE_CHECKING:
+    from edmlib.parser import EDM_Parser
+
+
+class LazySection:
+    """
+    Descriptor that extracts the section of the same name from the parser on first access.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, view: Optional["LazyRecord"], owner: type) -> Any:
+        if view is None:
+            return self
+        return view.get_section(self.name)
+
+
+class LazyRecord:
+    """
+    Has the same section attributes as EDM_Record. Errors of a section are raised when it is
+    accessed, so sections that are never accessed are neither extracted nor validated.
+    """
+
+    provided_cho: EDM_ProvidedCHO = LazySection()  # type: ignore
+    aggregation: ORE_Aggregation = LazySection()  # type: ignore
+    web_resource: List[EDM_WebResource] = LazySection()  # type: ignore
+    skos_concept: List[SKOS_Concept] = LazySection()  # type: ignore
+    edm_agent: List[EDM_Agent] = LazySection()  # type: ignore
+    edm_time_span: List[EDM_TimeSpan] = LazySection()  # type: ignore
+    edm_place: List[EDM_Place] = LazySection()  # type: ignore
+    cc_license: List[CC_License] = LazySection()  # type: ignore
+    svcs_service: List[SVCS_Service] = LazySection()  # type: ignore
+
+    def __init__(self, parser: "EDM_Parser") -> None:
+        self.parser = parser
+        self.sections: Dict[str, Any] = {}
+
+    def get_section(self, section: str) -> Any:
+        if section not in self.sections:
+            self.sections[section] = self.parser.parse_section(section)
+        return self.sections[section]
+
+    @property
+    def parsed_sections(self) -> List[str]:
+        return list(self.sections)
+
+    def to_record(self) -> EDM_Record:
+        """
+        Extracts all remaining sections and returns the complete, validated EDM_Record.
+        """
+        return EDM_Record(
+            **{section: self.get_section(section) for section in RECORD_SECTIONS}
+        )
@@ -0,0 +1,302 @@
+"""
+Streaming reader for N-Triples dumps that contain many records, e.g. exports of a triplestore.
+
+The dump is parsed line by line and the triples are grouped by subject. Each record consists of an
+ore:Aggregation and all subjects that are reachable from it (except other aggregations and
+providedCHOs). A record is parsed with EDM_Parser as soon as this subgraph is complete, so the dump
+is never loaded into a single rdflib Graph.
+
+- sorted=True: the dump is sorted by subject, e.g. with `LC_ALL=C sort -u dump.nt`. All triples of a
+  subject are consecutive, and a referenced subject that has not been read yet, but sorts before
+  the current one, does not exist. Records are therefore yielded exactly when they are complete.
+- sorted=False: the order of the triples is arbitrary. Once the buffer exceeds max_subjects, the
+  records whose aggregation was read more than max_subjects / 2 subjects ago are yielded, the rest
+  at the end of the dump. A record is therefore complete if all of its subjects are read within a
+  window of max_subjects / 2 subjects around its aggregation.
+
+In both modes, subjects that were read more than max_subjects / 2 subjects ago and are not reachable
+from a pending record are then evicted from the buffer, so that memory usage stays bounded.
+
+```
+with NTriplesRecordReader.from_file("dump.nt.gz", sorted=True) as reader:
+    for record in reader:
+        ...
+```
+"""
+
+import heapq
+import io
+import re
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel
+from rdflib import RDF, BNode, Graph, URIRef
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+from rdflib.term import Node
+from typing_extensions import Self
+
+from edmlib.edm import EDM_ProvidedCHO, EDM_Record, ORE_Aggregation
+from edmlib.edm.enums import EDM_Namespace
+from edmlib.parser import EDM_Parser
+from edmlib.sources import open_stream
+
+Triple = Tuple[Node, Node, Node]
+
+AGGREGATION = ORE_Aggregation.get_class_ref()
+PROVIDED_CHO = EDM_ProvidedCHO.get_class_ref()
+AGGREGATED_CHO = URIRef(EDM_Namespace.EDM.value + "aggregatedCHO")
+
+_line_end = re.compile(r"[\r\n]+$")
+
+
+class BNodeLabels(dict):
+    """
+    Blank node context of the parser that also remembers the original label of each blank node,
+    which is needed to compare blank nodes with the sort order of the dump.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.labels: Dict[BNode, str] = {}
+
+    def __setitem__(self, label: str, bnode: BNode) -> None:
+        super().__setitem__(label, bnode)
+        self.labels[bnode] = label
+
+
+class _LastTriple:
+    __slots__ = ("triple_",)
+
+    def triple(self, s: Node, p: Node, o: Node) -> None:
+        self.triple_ = (s, p, o)
+
+
+class ReaderStats(BaseModel):
+    triples: int = 0
+    subjects: int = 0
+    records: int = 0
+    evicted: int = 0
+    """
+    Number of subjects that were dropped from the full buffer. Records that reference them
+    afterwards are incomplete.
+    """
+
+
+class NTriplesRecordReader:
+    """
+    Iterates over the records of an N-Triples stream (binary or text).
+    """
+
+    def __init__(
+        self,
+        stream: Union[IO[bytes], IO[str]],
+        sorted: bool = False,
+        max_subjects: int = 100_000,
+    ) -> None:
+        self.stream = stream
+        self.sorted = sorted
+        self.max_subjects = max_subjects
+        self.bnodes = BNodeLabels()
+        self.subjects: Dict[Node, List[Triple]] = {}
+        self.seen_at: Dict[Node, int] = {}
+        self.chos: Set[Node] = set()
+        self.pending: Dict[Node, int] = {}
+        """
+        Aggregations that were read but not yet yielded, in the order they were read.
+        """
+        self.waiting: List[Tuple[str, int, Node]] = []
+        self.limit = max_subjects
+        self.stats = ReaderStats()
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs: Any) -> "NTriplesRecordReader":
+        """
+        Opens a (possibly compressed) N-Triples file. The reader has to be closed, e.g. by using it
+        as a context manager.
+        """
+        return cls(open_stream(str(path)), **kwargs)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.stream.close()
+
+    def sort_key(self, node: Node) -> str:
+        """
+        Returns the n-triples token of a node, whose order is the sort order of the dump.
+        """
+        if isinstance(node, BNode):
+            return "_:" + self.bnodes.labels.get(node, str(node))
+        return f"<{node}>"
+
+    def iter_triples(self) -> Iterator[Triple]:
+        """
+        Parses the stream line by line. Blank node labels refer to the same node in the whole dump.
+        """
+        stream: IO[str] = (
+            self.stream  # type: ignore
+            if isinstance(self.stream, io.TextIOBase)
+            else io.TextIOWrapper(self.stream, encoding="utf-8")  # type: ignore
+        )
+        sink = _LastTriple()
+        parser = W3CNTriplesParser(sink=sink)  # type: ignore
+        for line in stream:
+            parser.line = _line_end.sub("", line)
+            if not parser.line.strip() or parser.line.lstrip().startswith("#"):
+                continue
+            parser.parseline(bnode_context=self.bnodes)
+            yield sink.triple_
+
+    def iter_subjects(self) -> Iterator[Tuple[Node, List[Triple]]]:
+        """
+        Yields the triples grouped by consecutive subjects.
+        """
+        subject: Optional[Node] = None
+        group: List[Triple] = []
+        for triple in self.iter_triples():
+            if triple[0] != subject:
+                if group:
+                    yield subject, group  # type: ignore
+                subject, group = triple[0], []
+            group.append(triple)
+        if group:
+            yield subject, group  # type: ignore
+
+    def __iter__(self) -> Iterator[EDM_Record]:
+        for _, graph in self.iter_graphs():
+            yield EDM_Parser(graph).parse()
+
+    def iter_graphs(self) -> Iterator[Tuple[Node, Graph]]:
+        """
+        Yields (aggregation, graph) tuples with the subgraph of each record, e.g. to handle records
+        that fail to parse individually.
+        """
+        previous: Optional[str] = None
+        for subject, triples in self.iter_subjects():
+            self.stats.triples += len(triples)
+            if self.sorted:
+                key = self.sort_key(subject)
+                if previous is not None and key <= previous:
+                    raise ValueError(
+                        f"The input is not sorted by subject: {key} after {previous}."
+                    )
+                previous = key
+            self.add(subject, triples)
+            if self.sorted:
+                yield from self.emit_complete(key)
+            if len(self.subjects) > self.limit:
+                yield from self.shrink()
+        for aggregation in list(self.pending):
+            yield aggregation, self.emit(aggregation)
+
+    def add(self, subject: Node, triples: List[Triple]) -> None:
+        if subject not in self.subjects:
+            self.stats.subjects += 1
+            self.seen_at[subject] = self.stats.subjects
+        self.subjects.setdefault(subject, []).extend(triples)
+        for _, predicate, obj in triples:
+            if predicate != RDF.type:
+                continue
+            if obj == AGGREGATION and subject not in self.pending:
+                self.pending[subject] = self.stats.subjects
+                if self.sorted:
+                    heapq.heappush(
+                        self.waiting,
+                        (self.sort_key(subject), self.stats.subjects, subject),
+                    )
+            elif obj == PROVIDED_CHO:
+                self.chos.add(subject)
+
+    def closure(self, aggregation: Node) -> Tuple[List[Node], List[Node]]:
+        """
+        Returns the subjects of the record of an aggregation that are in the buffer, and the
+        referenced nodes that are not (yet).
+        """
+        own_chos = {
+            obj
+            for _, predicate, obj in self.subjects.get(aggregation, [])
+            if predicate == AGGREGATED_CHO
+        }
+        found, missing = [aggregation], []
+        seen = {aggregation}
+        for subject in found:
+            for _, predicate, obj in self.subjects[subject]:
+                if (
+                    predicate == RDF.type
+                    or obj in seen
+                    or not isinstance(obj, (URIRef, BNode))
+                ):
+                    continue
+                seen.add(obj)
+                if obj in self.pending or (obj in self.chos and obj not in own_chos):
+                    continue
+                if obj in self.subjects:
+                    found.append(obj)
+                else:
+                    missing.append(obj)
+        return found, missing
+
+    def emit(self, aggregation: Node) -> Graph:
+        found, _ = self.closure(aggregation)
+        graph = Graph()
+        for subject in found:
+            for triple in self.subjects[subject]:
+                graph.add(triple)
+        del self.pending[aggregation]
+        # aggregations and their providedCHOs belong to a single record, other subjects may be
+        # shared with records that follow
+        for subject in found:
+            if subject == aggregation or subject in self.chos:
+                self.remove(subject)
+        self.stats.records += 1
+        return graph
+
+    def emit_complete(self, key: str) -> Iterator[Tuple[Node, Graph]]:
+        """
+        Yields the records whose missing nodes all sort before key, i.e. will not appear anymore.
+        """
+        while self.waiting and self.waiting[0][0] <= key:
+            _, order, aggregation = heapq.heappop(self.waiting)
+            if aggregation not in self.pending:
+                continue
+            _, missing = self.closure(aggregation)
+            later = [k for k in map(self.sort_key, missing) if k > key]
+            if later:
+                heapq.heappush(self.waiting, (min(later), order, aggregation))
+            else:
+                yield aggregation, self.emit(aggregation)
+
+    def remove(self, subject: Node) -> None:
+        del self.subjects[subject]
+        del self.seen_at[subject]
+        self.chos.discard(subject)
+
+    def shrink(self) -> Iterator[Tuple[Node, Graph]]:
+        """
+        Yields the pending records whose aggregation is older than max_subjects / 2 subjects (only
+        for unsorted input) and evicts all older subjects that no pending record refers to.
+        """
+        window = self.max_subjects // 2
+        oldest = self.stats.subjects - window
+        if not self.sorted:
+            for aggregation, seen_at in list(self.pending.items()):
+                if seen_at > oldest:
+                    break
+                yield aggregation, self.emit(aggregation)
+        keep: Set[Node] = set()
+        for aggregation in self.pending:
+            keep.update(self.closure(aggregation)[0])
+        for subject, seen_at in list(self.seen_at.items()):
+            if seen_at > oldest:
+                break
+            if subject not in keep:
+                self.remove(subject)
+                self.stats.evicted += 1
+        # shared subjects that are still referenced stay, so the next shrink happens after
+        # another window of new subjects at the earliest
+        self.limit = max(self.max_subjects, len(self.subjects) + window)
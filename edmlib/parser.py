@@ -16,9 +16,35 @@ from edmlib.edm import (
     Ref,
 )
 
-from typing import get_type_hints, List, Any, Dict, Self
+from typing import (
+    get_type_hints,
+    IO,
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Any,
+    Dict,
+    Optional,
+    Self,
+    Union,
+)
+from pydantic import ValidationError
+from rdflib.store import Store
 from rdflib.term import _castPythonToLiteral
 
+from edmlib.edm.intern import INTERNED_PROPERTIES, InternTable
+from edmlib.edm.record import RECORD_SECTIONS, REQUIRED_SECTIONS
+from edmlib.edm.relative import RELATIVE_BASE
+from edmlib.store import EDMParserStore  # noqa: F401, registers the store plugin
+from edmlib.edm.validation.issues import (
+    EDM_ValidationIssue,
+    ISSUE_KIND,
+    MODEL_VALIDATOR_ISSUES,
+)
+
+if TYPE_CHECKING:
+    from edmlib.lazy_record import LazyRecord
+
 
 def check_if_many(cls: object, attname: str) -> bool:
     """
@@ -109,25 +135,119 @@ def convert(lit_or_ref: URIRef | Literal) -> Ref | Lit:
     return to_literal(lit_or_ref)
 
 
+def get_added_values(cls_obj: object) -> Dict[str, Any]:
+    """
+    Values that are set by the parsers for a given obj_cls, regardless of the input.
+    """
+    if cls_obj is ORE_Aggregation:
+        return {"edm_provider": Lit(value="Kulturpool", lang="de")}
+    return {}
+
+
+def validate_values(cls_obj: object, att: str, values: List[Ref | Lit]) -> Any:
+    """
+    Validates the values of the property 'att' of an instance of cls_obj and checks the cardinality.
+    Returns a single value or a list of values, depending on the property, or None if there are no values.
+    """
+    if cls_obj == ORE_Aggregation and att == "edm_aggregatedCHO":
+        # ORE_Aggregation.edm_aggregatedCHO needs to have as its new
+        # value the validation function's result. This is because, at a
+        # later stage, it is validated against the EDM_ProvidedCHO.id in
+        # EDM_Record.validate_provided_cho_identity(). ProvidedCHO has
+        # its validation value assigned at instantiation and would
+        # therefore not match ORE_Aggregation.edm_aggregatedCHO.
+        #
+        # The validation function returns a Ref that might differ from
+        # the original value, because urls are sanitized via
+        # sanitize_url_quotation() in Ref.validate_value_as_uri().
+        values = [
+            value.__class__.model_validate(value.__class__(**value.model_dump()))
+            for value in values
+        ]
+    else:
+        for value in values:
+            value.__class__.model_validate(value.__class__(**value.model_dump()))
+    if not values:
+        return None
+    if not check_if_many(cls_obj, att):
+        assert (
+            len(values) == 1
+        ), f"Expected 1 value but got {len(values)}; {cls_obj=}; {att=}"
+        return values[0]
+    return values
+
+
+INTERNED_REFS = frozenset(cls_attribute_to_ref_new(att) for att in INTERNED_PROPERTIES)
+
+
 class EDM_Parser:
     """
     Parser for edm-xml records. Returns an edm_python.edm.EDM_Record object.
+
+    If an InternTable is given, repeated strings (lang tags, datatypes and the values of the
+    properties in edmlib.edm.intern.INTERNED_PROPERTIES) are stored only once across all
+    parsers that share the table.
+
+    The from_* constructors accept the rdflib store of the graph, e.g. "EDMParserStore"
+    (edmlib.store), which only indexes the lookups of the parser.
     """
 
     @classmethod
-    def from_file(cls, path: str, format: str = "xml") -> Self:
-        # TODO: add logic to add the placholder here and to remove it in serialization again
-        graph = Graph().parse(path, format=format, publicID="placeholder")
-        return cls(graph=graph)
+    def from_file(
+        cls,
+        path: str,
+        format: str = "xml",
+        intern_table: Optional[InternTable] = None,
+        store: Union[str, Store] = "default",
+    ) -> Self:
+        """
+        Parses a file. Files ending with .gz, .bz2, .xz or .zst are decompressed while reading.
+        """
+        from edmlib.sources import open_stream, split_compression
+
+        if split_compression(str(path))[1]:
+            with open_stream(str(path)) as stream:
+                return cls.from_stream(
+                    stream, format=format, intern_table=intern_table, store=store
+                )
+        graph = Graph(store=store).parse(path, format=format, publicID=RELATIVE_BASE)
+        return cls(graph=graph, intern_table=intern_table)
+
+    @classmethod
+    def from_stream(
+        cls,
+        stream: IO[bytes],
+        format: str = "xml",
+        intern_table: Optional[InternTable] = None,
+        store: Union[str, Store] = "default",
+    ) -> Self:
+        """
+        Parses a binary stream, e.g. an opened file or a member of an archive. The stream is read
+        in chunks by the rdf parser and not loaded into memory as a whole before.
+        """
+        graph = Graph(store=store).parse(
+            source=stream, format=format, publicID=RELATIVE_BASE
+        )
+        return cls(graph=graph, intern_table=intern_table)
 
     @classmethod
-    def from_string(cls, content: str, format: str = "xml") -> Self:
-        # TODO: add logic to add the placholder here and to remove it in serialization again
-        graph = Graph().parse(data=content, format=format, publicID="placeholder")
-        return cls(graph=graph)
+    def from_string(
+        cls,
+        content: str,
+        format: str = "xml",
+        intern_table: Optional[InternTable] = None,
+        store: Union[str, Store] = "default",
+    ) -> Self:
+        graph = Graph(store=store).parse(
+            data=content, format=format, publicID=RELATIVE_BASE
+        )
+        return cls(graph=graph, intern_table=intern_table)
 
-    def __init__(self, graph: Graph) -> None:
+    def __init__(
+        self, graph: Graph, intern_table: Optional[InternTable] = None
+    ) -> None:
         self.graph: Graph = graph
+        self.intern_table = intern_table
 
     def get_single_ref(self, obj_cls: object) -> URIRef:
         """
@@ -183,65 +303,49 @@ class EDM_Parser:
         )
         return [el[0] for el in webresources]
 
+    def get_values(self, instance: URIRef, ref: URIRef) -> List[Ref | Lit]:
+        """
+        Return all non-empty values of the property 'ref' of the given instance as Ref or Lit objects.
+        """
+        values = [
+            convert(el[2])  # type: ignore
+            for el in list(self.graph.triples((instance, ref, None)))
+        ]
+        values = [lit_or_ref for lit_or_ref in values if lit_or_ref.value.strip() != ""]
+        if self.intern_table is not None:
+            include_value = ref in INTERNED_REFS
+            for value in values:
+                self.intern_table.intern_value(value, include_value=include_value)
+        return values
+
     def get_instance_triples(self, instance: URIRef, cls_obj: object) -> Dict[str, Any]:
         attribs = get_attributes(cls_obj)
         temp: Dict[str, Any] = {}
         for att, ref in attribs.items():
-            values = [
-                convert(el[2])  # type: ignore
-                for el in list(self.graph.triples((instance, ref, None)))
-            ]
-            values = [
-                lit_or_ref for lit_or_ref in values if lit_or_ref.value.strip() != ""
-            ]
+            values = self.get_values(instance, ref)
 
-            if cls_obj == ORE_Aggregation and att == "edm_aggregatedCHO":
-                # ORE_Aggregation.edm_aggregatedCHO needs to have as its new
-                # value the validation function's result. This is because, at a
-                # later stage, it is validated against the EDM_ProvidedCHO.id in
-                # EDM_Record.validate_provided_cho_identity(). ProvidedCHO has
-                # its validation value assigned at instantiation and would
-                # therefore not match ORE_Aggregation.edm_aggregatedCHO.
-                #
-                # The validation function returns a Ref that might differ from
-                # the original value, because urls are sanitized via
-                # sanitize_url_quotation() in Ref.validate_value_as_uri().
-                values = [
-                    value.__class__.model_validate(
-                        value.__class__(**value.model_dump())
-                    )
-                    for value in values
-                ]
-            else:
-                for value in values:
-                    value.__class__.model_validate(
-                        value.__class__(**value.model_dump())
-                    )
-            if values:
-                many = check_if_many(cls_obj, att)
-                if not many:
-                    assert (
-                        len(values) == 1
-                    ), f"Expected 1 value but got {len(values)}; {cls_obj=}; {att=}"
-                    values = values[0]
+            values = validate_values(cls_obj, att, values)
+            if values is not None:
                 temp.update({att: values})
         return temp
 
+    def get_added_values(self, cls_obj: object) -> Dict[str, Any]:
+        """
+        Values that are set by the parser for a given obj_cls, regardless of the graph.
+        """
+        return get_added_values(cls_obj)
+
     def parse_single_class(self, cls_obj: object) -> Any:
-        add = {}
         match cls_obj.__name__:  # type: ignore
             case "EDM_ProvidedCHO":
                 inst = self.get_single_ref(cls_obj)
             case "ORE_Aggregation":
                 inst = self.get_aggregation()
-                add = {
-                    "edm_provider": Lit(value="Kulturpool", lang="de"),
-                }
             case _:  # type: ignore
                 pass
         triples = self.get_instance_triples(inst, cls_obj)  # type: ignore
 
-        triples.update(**add)
+        triples.update(**self.get_added_values(cls_obj))
         return cls_obj(id=Ref(value=str(inst)), **triples)  # type: ignore
 
     def parse_many_class(self, cls_obj: Any) -> List[Any]:
@@ -262,25 +366,218 @@ class EDM_Parser:
 
         return res
 
-    def parse(self) -> EDM_Record:
-        cho = self.parse_single_class(EDM_ProvidedCHO)
-        aggre = self.parse_single_class(ORE_Aggregation)
-        web_resources = self.parse_many_class(EDM_WebResource)
-        skos_concepts = self.parse_many_class(SKOS_Concept)
-        edm_time_spans = self.parse_many_class(EDM_TimeSpan)
-        edm_agents = self.parse_many_class(EDM_Agent)
-        edm_places = self.parse_many_class(EDM_Place)
-        cc_licenses = self.parse_many_class(CC_License)
-        svcs_services = self.parse_many_class(SVCS_Service)
+    def parse_section(self, section: str) -> Any:
+        """
+        Extracts and validates a single section of the record, i.e. one of the attribute names
+        of EDM_Record: the instance for 'provided_cho' and 'aggregation', a list of instances otherwise.
+        """
+        cls_obj = RECORD_SECTIONS[section]
+        if section in REQUIRED_SECTIONS:
+            return self.parse_single_class(cls_obj)
+        return self.parse_many_class(cls_obj)
 
+    def parse(self, include: Optional[Iterable[str]] = None) -> EDM_Record:
+        """
+        Parses the whole record. If include is given, only the listed sections (e.g. ["web_resource"])
+        are extracted besides the always required providedCHO and aggregation; all other sections are None.
+        """
+        sections = set(RECORD_SECTIONS if include is None else include)
+        unknown = sections - set(RECORD_SECTIONS)
+        assert not unknown, f"Unknown record sections: {unknown}"
+        sections.update(REQUIRED_SECTIONS)
         return EDM_Record(
-            provided_cho=cho,
-            aggregation=aggre,
-            web_resource=web_resources,
-            skos_concept=skos_concepts,
-            edm_time_span=edm_time_spans,
-            edm_agent=edm_agents,
-            edm_place=edm_places,
-            cc_license=cc_licenses,
-            svcs_service=svcs_services,
+            **{
+                section: self.parse_section(section)
+                for section in RECORD_SECTIONS
+                if section in sections
+            }
         )
+
+    def lazy(self) -> "LazyRecord":
+        """
+        Returns a view of the record in which each section is extracted and validated on first access.
+        """
+        from edmlib.lazy_record import LazyRecord
+
+        return LazyRecord(self)
+
+    # === collect-all-errors validation ===
+
+    def validate(self) -> List[EDM_ValidationIssue]:
+        """
+        Validates the graph without stopping at the first error.
+
+        In contrast to parse(), which raises at the first failing assertion, this method checks every
+        instance, property and value independently and returns all structure, cardinality, uri, rights,
+        language-tag and conditional-property violations as a list of EDM_ValidationIssue objects.
+        An empty list means that parse() will succeed.
+        """
+        issues: List[EDM_ValidationIssue] = []
+        instances: Dict[str, List[Any]] = {}
+        for cls_obj in [
+            EDM_ProvidedCHO,
+            ORE_Aggregation,
+            EDM_WebResource,
+            SKOS_Concept,
+            EDM_TimeSpan,
+            EDM_Agent,
+            EDM_Place,
+            CC_License,
+            SVCS_Service,
+        ]:
+            refs = self.get_many_ref(cls_obj)
+            if cls_obj in (EDM_ProvidedCHO, ORE_Aggregation) and len(refs) != 1:
+                issues.append(
+                    EDM_ValidationIssue(
+                        kind=ISSUE_KIND.STRUCTURE,
+                        message=f"Expected exactly one {cls_obj.__name__}, got {len(refs)}.",
+                        cls=cls_obj.__name__,
+                    )
+                )
+            instances[cls_obj.__name__] = [
+                self.collect_instance_issues(ref, cls_obj, issues) for ref in refs
+            ]
+
+        cho = instances["EDM_ProvidedCHO"]
+        aggregation = instances["ORE_Aggregation"]
+        if len(cho) == 1 and len(aggregation) == 1:
+            record = EDM_Record.model_construct(
+                provided_cho=cho[0], aggregation=aggregation[0]
+            )
+            self.collect_model_validator_issues(
+                record, "EDM_Record", str(aggregation[0].id.value), issues
+            )
+
+        record_id = str(aggregation[0].id.value) if len(aggregation) == 1 else None
+        for issue in issues:
+            issue.record = record_id
+        return issues
+
+    def collect_instance_issues(
+        self,
+        instance: URIRef,
+        cls_obj: Any,
+        issues: List[EDM_ValidationIssue],
+    ) -> Any:
+        """
+        Validates a single instance of obj_cls and appends all found issues to 'issues'.
+        Returns the instance, which is not validated if any issues were found.
+        """
+        label = cls_obj.__name__
+        instance_id = str(instance)
+
+        def add_issue(kind: ISSUE_KIND, message: str, prop: str, value: Any = None):
+            issues.append(
+                EDM_ValidationIssue(
+                    kind=kind,
+                    message=message,
+                    cls=label,
+                    id=instance_id,
+                    property=prop,
+                    value=None if value is None else str(value),
+                )
+            )
+
+        try:
+            Ref(value=instance_id)
+        except ValidationError as e:
+            add_issue(ISSUE_KIND.URI, e.errors()[0]["msg"], "id", instance_id)
+
+        fields: Dict[str, Any] = {}
+        for att, ref in get_attributes(cls_obj).items():
+            values: List[Ref | Lit] = []
+            for value in self.get_values(instance, ref):
+                try:
+                    values.append(
+                        value.__class__.model_validate(
+                            value.__class__(**value.model_dump())
+                        )
+                    )
+                except ValidationError as e:
+                    kind = (
+                        ISSUE_KIND.URI
+                        if isinstance(value, Ref)
+                        else ISSUE_KIND.LANGUAGE
+                    )
+                    add_issue(kind, e.errors()[0]["msg"], att, value.value)
+            if not values:
+                continue
+            if check_if_many(cls_obj, att):
+                fields[att] = values
+            else:
+                if len(values) > 1:
+                    add_issue(
+                        ISSUE_KIND.CARDINALITY,
+                        f"Expected 1 value but got {len(values)}.",
+                        att,
+                        ", ".join(value.value for value in values),
+                    )
+                fields[att] = values[0]
+        fields.update(self.get_added_values(cls_obj))
+
+        try:
+            return cls_obj(id=Ref.model_construct(value=instance_id), **fields)
+        except ValidationError as e:
+            reported = set()
+            for error in e.errors():
+                if not error["loc"] or error["loc"][0] in reported:
+                    continue
+                att = str(error["loc"][0])
+                reported.add(att)
+                fields.pop(att, None)
+                if error["type"] == "missing":
+                    add_issue(
+                        ISSUE_KIND.MISSING, f"Missing mandatory property {att}.", att
+                    )
+                else:
+                    value = getattr(error["input"], "value", error["input"])
+                    add_issue(ISSUE_KIND.VALUE_TYPE, error["msg"], att, value)
+
+        constructed = cls_obj.model_construct(
+            id=Ref.model_construct(value=instance_id), **fields
+        )
+        self.collect_model_validator_issues(constructed, label, instance_id, issues)
+        return constructed
+
+    def collect_model_validator_issues(
+        self,
+        obj: Any,
+        label: str,
+        instance_id: str,
+        issues: List[EDM_ValidationIssue],
+    ) -> None:
+        """
+        Runs each 'after' model-validator of obj individually and appends a typed issue for every
+        failing one. A validator that fails with an AttributeError because of an already reported
+        missing property of the same instance is skipped, any other failure is reported as an issue.
+        """
+        decorators = obj.__class__.__pydantic_decorators__.model_validators
+        for name, decorator in decorators.items():
+            if decorator.info.mode != "after":
+                continue
+            try:
+                decorator.func(obj)
+            except Exception as e:
+                if isinstance(e, AttributeError) and any(
+                    issue.cls == label and issue.id == instance_id for issue in issues
+                ):
+                    continue
+                kind, prop = MODEL_VALIDATOR_ISSUES.get(
+                    name, (ISSUE_KIND.CONDITIONAL, None)
+                )
+                message = (
+                    str(e)
+                    if isinstance(e, (AssertionError, ValueError))
+                    else f"{e.__class__.__name__}: {e}"
+                )
+                value: Optional[Any] = getattr(obj, prop, None) if prop else None
+                issues.append(
+                    EDM_ValidationIssue(
+                        kind=kind,
+                        message=message,
+                        cls=label,
+                        id=instance_id,
+                        property=prop,
+                        value=getattr(value, "value", None),
+                    )
+                )
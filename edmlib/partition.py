@@ -0,0 +1,213 @@
+"""
+Partitioning of a graph that holds many records into one subgraph per record.
+
+EDM_Parser expects exactly one ore:Aggregation and one edm:ProvidedCHO per graph. GraphPartitioner
+assigns to each aggregation all subjects that are reachable from it, other aggregations and
+providedCHOs excluded. The subgraph of a record is a read-only view on the original graph that
+only exposes the triples of these subjects, so no triples are copied.
+
+The strongly connected components of the subjects (context entities that refer to each other,
+e.g. via skos:broader) are found in one pass with Tarjan's algorithm. The subjects of a record are
+then collected by a traversal of the component graph from its aggregation, which visits each
+reachable component once, so the cost per record is linear in the size of the record.
+
+```
+partitioner = GraphPartitioner(Graph().parse("dump.nt"))
+for record in partitioner.iter_records():
+    ...
+```
+"""
+
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterator, List, Set, Tuple
+
+from rdflib import RDF, BNode, Graph, URIRef
+from rdflib.store import Store
+from rdflib.term import Node
+
+from edmlib.edm import EDM_ProvidedCHO, EDM_Record, ORE_Aggregation
+from edmlib.edm.enums import EDM_Namespace
+from edmlib.parser import EDM_Parser
+from edmlib.store import NamespaceBindings
+
+AGGREGATION = ORE_Aggregation.get_class_ref()
+PROVIDED_CHO = EDM_ProvidedCHO.get_class_ref()
+AGGREGATED_CHO = URIRef(EDM_Namespace.EDM.value + "aggregatedCHO")
+
+
+class SubjectView(NamespaceBindings, Store):
+    """
+    Read-only rdflib store that exposes only the triples of the given subjects of another graph.
+    Lookups are answered by the store of that graph, per subject, so that the cost of a query does
+    not depend on the size of the whole graph. Namespace bindings are kept per view, so that
+    serializing a view does not modify the graph.
+    """
+
+    def __init__(self, graph: Graph, subjects: FrozenSet[Node]) -> None:
+        super().__init__()
+        self.graph = graph
+        self.subjects = subjects
+
+    def triples(self, triple_pattern: Any, context: Any = None) -> Iterator[Any]:
+        subject, predicate, obj = triple_pattern
+        if subject is not None:
+            subjects = [subject] if subject in self.subjects else []
+        else:
+            subjects = self.subjects  # type: ignore
+        for subject in subjects:
+            for triple in self.graph.triples((subject, predicate, obj)):
+                yield triple, iter(())
+
+    def __len__(self, context: Any = None) -> int:
+        return sum(
+            1
+            for subject in self.subjects
+            for _ in self.graph.triples((subject, None, None))
+        )
+
+    def add(self, triple: Any, context: Any, quoted: bool = False) -> None:
+        raise TypeError("The subgraph of a record is read-only.")
+
+    def remove(self, triple: Any, context: Any = None) -> None:
+        raise TypeError("The subgraph of a record is read-only.")
+
+
+class GraphPartitioner:
+    """
+    Splits a graph with any number of records into per-record views.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self.aggregations: List[Node] = []
+        self.chos: Set[Node] = set()
+        self.edges: Dict[Node, List[Node]] = {}
+        for subject, predicate, obj in graph:
+            successors = self.edges.setdefault(subject, [])
+            if predicate == RDF.type:
+                if obj == AGGREGATION:
+                    self.aggregations.append(subject)
+                elif obj == PROVIDED_CHO:
+                    self.chos.add(subject)
+            elif isinstance(obj, (URIRef, BNode)):
+                successors.append(obj)
+        self.aggregations.sort()
+        self.roots = self.chos.union(self.aggregations)
+        self.component: Dict[Node, int] = {}
+        self.members: List[List[Node]] = []
+        self.successors: List[Set[int]] = []
+        self._find_components()
+
+    def __len__(self) -> int:
+        return len(self.aggregations)
+
+    def _successors(self, node: Node) -> Iterator[Node]:
+        for obj in self.edges[node]:
+            if obj in self.edges and obj not in self.roots and obj != node:
+                yield obj
+
+    def _find_components(self) -> None:
+        """
+        Iterative version of Tarjan's algorithm over all subjects except aggregations and
+        providedCHOs. Components are completed in reverse topological order, so the components of
+        all successors are known when a component is completed.
+        """
+        index: Dict[Node, int] = {}
+        lowlink: Dict[Node, int] = {}
+        stack: List[Node] = []
+        on_stack: Set[Node] = set()
+        for start in self.edges:
+            if start in index or start in self.roots:
+                continue
+            work = [(start, self._successors(start))]
+            index[start] = lowlink[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                node, successors = work[-1]
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, self._successors(successor)))
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        self._complete_component(node, stack, on_stack)
+
+    def _complete_component(
+        self, root: Node, stack: List[Node], on_stack: Set[Node]
+    ) -> None:
+        members = []
+        while True:
+            member = stack.pop()
+            on_stack.discard(member)
+            members.append(member)
+            if member == root:
+                break
+        number = len(self.members)
+        for member in members:
+            self.component[member] = number
+        successors: Set[int] = set()
+        for member in members:
+            for successor in self._successors(member):
+                successors.add(self.component[successor])
+        successors.discard(number)
+        self.members.append(members)
+        self.successors.append(successors)
+
+    def get_subjects(self, aggregation: Node) -> FrozenSet[Node]:
+        """
+        Returns the subjects of the record of an aggregation.
+        """
+        subjects: Set[Node] = {aggregation}
+        roots = [aggregation]
+        for cho in self.graph.objects(aggregation, AGGREGATED_CHO):
+            if cho in self.edges:
+                subjects.add(cho)
+                roots.append(cho)
+        visited: Set[int] = set()
+        work = [
+            self.component[successor]
+            for root in roots
+            for successor in self._successors(root)
+        ]
+        while work:
+            number = work.pop()
+            if number in visited:
+                continue
+            visited.add(number)
+            subjects.update(self.members[number])
+            work.extend(self.successors[number] - visited)
+        return frozenset(subjects)
+
+    def get_graph(self, aggregation: Node) -> Graph:
+        """
+        Returns the subgraph of the record of an aggregation as a read-only view.
+        """
+        return Graph(store=SubjectView(self.graph, self.get_subjects(aggregation)))
+
+    def iter_graphs(self) -> Iterator[Tuple[Node, Graph]]:
+        for aggregation in self.aggregations:
+            yield aggregation, self.get_graph(aggregation)
+
+    def iter_records(self) -> Iterator[EDM_Record]:
+        for _, graph in self.iter_graphs():
+            yield EDM_Parser(graph).parse()
+
+    def usage(self) -> Counter:
+        """
+        Counts the number of records that each subject belongs to. Subjects that belong to more
+        than one record are the context entities shared by these records.
+        """
+        counter: Counter = Counter()
+        for aggregation in self.aggregations:
+            counter.update(self.get_subjects(aggregation))
+        return counter
@@ -0,0 +1,142 @@
+"""
+owl:sameAs equivalence index for reconciling entities across records and providers.
+
+All instances with an owl_sameAs property (providedCHOs, web resources, agents, places, timespans)
+are merged with their sameAs targets in a union-find structure. Each group of equivalent ids has a
+canonical id, the lexicographically smallest one, which is stable regardless of the order in which
+records are added.
+
+```
+index = SameAsIndex()
+index.add_records(records)
+index.canonical("http://d-nb.info/gnd/11869703X")
+index.aliases("http://d-nb.info/gnd/11869703X")
+index.save("sameas.tsv")
+```
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Union
+
+from edmlib.edm import EDM_Record
+
+
+class SameAsIndex:
+    """
+    Union-find with path compression and union by size. Each root keeps the list of members and
+    the canonical id of its group, so lookups of the canonical id and of all aliases are O(1)
+    amortized, and merging n ids costs O(n log n) in total.
+    """
+
+    def __init__(self) -> None:
+        self.parent: Dict[str, str] = {}
+        self.members: Dict[str, List[str]] = {}
+        self.canonical_ids: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self.parent
+
+    def find(self, entity_id: str) -> str:
+        """
+        Returns the root of the group of entity_id, adding it as its own group if it is unknown.
+        """
+        parent = self.parent.get(entity_id)
+        if parent is None:
+            self.parent[entity_id] = entity_id
+            self.members[entity_id] = [entity_id]
+            self.canonical_ids[entity_id] = entity_id
+            return entity_id
+        root = entity_id
+        while parent != root:
+            root = parent
+            parent = self.parent[root]
+        # path compression
+        while entity_id != root:
+            self.parent[entity_id], entity_id = root, self.parent[entity_id]
+        return root
+
+    def union(self, first: str, second: str) -> str:
+        """
+        Merges the groups of both ids and returns the root of the merged group.
+        """
+        first_root, second_root = self.find(first), self.find(second)
+        if first_root == second_root:
+            return first_root
+        if len(self.members[first_root]) < len(self.members[second_root]):
+            first_root, second_root = second_root, first_root
+        self.parent[second_root] = first_root
+        self.members[first_root].extend(self.members.pop(second_root))
+        self.canonical_ids[first_root] = min(
+            self.canonical_ids[first_root], self.canonical_ids.pop(second_root)
+        )
+        return first_root
+
+    def add_record(self, record: EDM_Record) -> None:
+        for instance in record.iter_instances():
+            same_as = getattr(instance, "owl_sameAs", None)
+            if not same_as:
+                continue
+            for ref in same_as:
+                self.union(instance.id.value, ref.value)
+
+    def add_records(self, records: Iterable[EDM_Record]) -> None:
+        for record in records:
+            self.add_record(record)
+
+    def canonical(self, entity_id: str) -> str:
+        """
+        Returns the canonical id of the group of entity_id, or entity_id itself if it is unknown.
+        """
+        if entity_id not in self.parent:
+            return entity_id
+        return self.canonical_ids[self.find(entity_id)]
+
+    def aliases(self, entity_id: str) -> List[str]:
+        """
+        Returns all ids that are equivalent to entity_id, including entity_id itself.
+        The returned list is the one held by the index and must not be modified.
+        """
+        if entity_id not in self.parent:
+            return [entity_id]
+        return self.members[self.find(entity_id)]
+
+    def is_same(self, first: str, second: str) -> bool:
+        return first == second or (
+            first in self.parent
+            and second in self.parent
+            and self.find(first) == self.find(second)
+        )
+
+    def groups(self) -> Iterator[List[str]]:
+        """
+        Yields all groups with more than one id, each sorted with the canonical id first.
+        """
+        for members in self.members.values():
+            if len(members) > 1:
+                yield sorted(members)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Writes one tab separated line per group with more than one id, canonical id first.
+        The file is replaced atomically.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for group in self.groups():
+                file.write("\t".join(group) + "\n")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SameAsIndex":
+        index = cls()
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                canonical, *aliases = line.rstrip("\n").split("\t")
+                for alias in aliases:
+                    index.union(canonical, alias)
+        return index
@@ -0,0 +1,216 @@
+"""
+Helpers to enumerate edm records from files, directories, glob patterns, tar/zip archives and stdin.
+
+Compressed files (.gz, .bz2, .xz, .zst) and archives (.tar with any of these compressions, .zip) are
+read as streams: records are decompressed chunk by chunk while they are parsed, without temporary files.
+
+iter_streams() yields (name, stream) tuples that can be passed to EDM_Parser.from_stream(),
+iter_sources() yields (name, content) tuples, which can directly be used as sources for the
+functions in edmlib.bulk.
+"""
+
+import bz2
+import glob
+import gzip
+import lzma
+import os
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from edmlib.edm import EDM_Record
+from edmlib.parser import EDM_Parser
+
+FORMAT_EXTENSIONS = {
+    ".xml": "xml",
+    ".rdf": "xml",
+    ".jsonld": "json-ld",
+    ".nt": "nt",
+    ".ttl": "turtle",
+    ".json": "json",
+    ".jsonl": "json",
+    ".ndjson": "json",
+}
+"""
+Maps file extensions to the formats understood by edmlib.bulk.load_record, i.e. rdflib parser
+plugin names and "json" for the pydantic json dump of an EDM_Record. '.jsonl' and '.ndjson' files
+hold one record per line; edmlib.bulk.split_source() splits them and other multi-record files,
+e.g. the shards written by ShardedWriter, into single records.
+"""
+
+ARCHIVE_EXTENSIONS = (".tar", ".tgz", ".tbz2", ".txz", ".zip")
+
+STDIN = "-"
+
+
+def open_zstd(file: Union[str, IO[bytes]]) -> IO[bytes]:
+    """
+    Returns a decompressing stream for a zstandard compressed file. Zstandard is not part of the
+    standard library before python 3.14, so either that or the 'zstandard' package is required.
+    """
+    try:
+        from compression import zstd  # type: ignore
+
+        return zstd.open(file, "rb")  # type: ignore
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "Reading .zst files requires python >= 3.14 or the 'zstandard' package."
+        )
+    return zstandard.open(file, "rb")  # type: ignore
+
+
+COMPRESSION_EXTENSIONS: Dict[str, Callable[[Union[str, IO[bytes]]], IO[bytes]]] = {
+    ".gz": lambda file: gzip.open(file, "rb"),  # type: ignore
+    ".bz2": lambda file: bz2.open(file, "rb"),  # type: ignore
+    ".xz": lambda file: lzma.open(file, "rb"),  # type: ignore
+    ".zst": open_zstd,
+}
+"""
+Maps the extensions of compressed files to functions that open a path or wrap a binary
+stream into a decompressing stream.
+"""
+
+
+def split_compression(name: str) -> Tuple[str, Optional[str]]:
+    """
+    Splits the compression extension off a file name, e.g. 'rec.xml.gz' -> ('rec.xml', '.gz').
+    """
+    suffix = Path(name).suffix.lower()
+    if suffix in COMPRESSION_EXTENSIONS:
+        return name[: -len(suffix)], suffix
+    return name, None
+
+
+def guess_format(
+    name: str, content: Optional[bytes] = None, default: str = "xml"
+) -> str:
+    """
+    Guesses the format of a record from its file extension, ignoring compression extensions.
+    Files ending with '.json' are treated as json-ld if their content declares a '@context',
+    otherwise as the pydantic json dump of an EDM_Record.
+    """
+    suffix = Path(split_compression(name)[0]).suffix.lower()
+    fmt = FORMAT_EXTENSIONS.get(suffix, default)
+    if fmt == "json" and content is not None and b'"@context"' in content[:4096]:
+        return "json-ld"
+    return fmt
+
+
+def is_archive(path: str) -> bool:
+    name = split_compression(path)[0].lower()
+    return name.endswith(ARCHIVE_EXTENSIONS) or path.lower().endswith(
+        ARCHIVE_EXTENSIONS
+    )
+
+
+def is_record_file(path: str) -> bool:
+    name = split_compression(path)[0]
+    return Path(name).suffix.lower() in FORMAT_EXTENSIONS or is_archive(path)
+
+
+def open_stream(path: str, fileobj: Optional[IO[bytes]] = None) -> IO[bytes]:
+    """
+    Opens a file (or wraps an already opened binary stream of that file) for reading
+    and transparently decompresses it, if its name ends with a compression extension.
+    """
+    compression = split_compression(path)[1]
+    if compression:
+        return COMPRESSION_EXTENSIONS[compression](fileobj or path)
+    return fileobj or open(path, "rb")
+
+
+def iter_archive(path: str) -> Iterator[Tuple[str, IO[bytes]]]:
+    """
+    Yields all record files within a tar or zip archive as (name, stream) tuples.
+    Names are prefixed with the path of the archive, e.g. 'harvest.zip:records/rec_1.xml'.
+
+    Tar archives are read in streaming mode, so each stream must be consumed before
+    the next one is requested.
+    """
+    if path.lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and is_record_file(info.filename):
+                    with archive.open(info) as member:
+                        yield f"{path}:{info.filename}", open_stream(
+                            info.filename, member
+                        )
+        return
+
+    with open_stream(path) as fileobj:
+        # streaming mode: members are read in order, without seeking back
+        with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+            for member in archive:
+                if member.isfile() and is_record_file(member.name):
+                    extracted = archive.extractfile(member)
+                    if extracted is not None:
+                        yield f"{path}:{member.name}", open_stream(
+                            member.name, extracted  # type: ignore
+                        )
+
+
+def iter_paths(inputs: Iterable[str]) -> Iterator[str]:
+    """
+    Expands directories (recursively) and glob patterns to a sorted list of record files and archives.
+    Plain file paths are passed through as they are.
+    """
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for file in sorted(files):
+                    path = os.path.join(root, file)
+                    if is_record_file(path):
+                        yield path
+        elif glob.has_magic(item):
+            yield from sorted(glob.glob(item, recursive=True))
+        else:
+            yield item
+
+
+def iter_streams(inputs: Iterable[str]) -> Iterator[Tuple[str, IO[bytes]]]:
+    """
+    Yields (name, stream) tuples for all records found in the given inputs, which can be
+    file paths, directories, glob patterns, (compressed) tar/zip archives or '-' for a single
+    record on stdin. Each stream must be consumed before the next one is requested.
+    """
+    for path in iter_paths(inputs):
+        if path == STDIN:
+            yield "<stdin>", sys.stdin.buffer
+        elif is_archive(path):
+            yield from iter_archive(path)
+        else:
+            with open_stream(path) as stream:
+                yield path, stream
+
+
+def iter_sources(inputs: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+    """
+    Like iter_streams(), but yields the content of each record as bytes. This is the form
+    that can be sent to worker processes.
+    """
+    for name, stream in iter_streams(inputs):
+        yield name, stream.read()
+
+
+def iter_parsers(
+    inputs: Iterable[str], format: Optional[str] = None
+) -> Iterator[Tuple[str, EDM_Parser]]:
+    """
+    Yields (name, EDM_Parser) tuples for all records found in the given inputs. The records are
+    streamed directly into the rdf parser. If no format is given, it is guessed from the names.
+    """
+    for name, stream in iter_streams(inputs):
+        head = stream.peek(4096) if hasattr(stream, "peek") else None  # type: ignore
+        fmt = format or guess_format(name, head)
+        if fmt == "json":
+            record = EDM_Record.model_validate_json(stream.read())
+            yield name, EDM_Parser(record.get_rdf_graph())
+        else:
+            yield name, EDM_Parser.from_stream(stream, format=fmt)
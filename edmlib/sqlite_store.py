@@ -0,0 +1,205 @@
+"""
+Persistent record store on top of the stdlib sqlite3 module.
+
+Records are stored in the compact binary form of edmlib.edm.codec together with their record
+fingerprint and indexed columns for the aggregation id, the providedCHO id, the data provider,
+the edm_type and the rights statement.
+
+```
+with SQLiteRecordStore("records.sqlite") as store:
+    written = store.upsert_many(records)  # unchanged records are skipped
+    record = store.get("http://example.org/agg/1")
+    for record in store.iter_records(data_provider="Albertina", edm_type="IMAGE"):
+        ...
+```
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from typing_extensions import Self
+
+from edmlib.edm import EDM_Record
+from edmlib.edm.codec import decode_record, encode_record
+from edmlib.edm.fingerprint import record_fingerprint
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id TEXT PRIMARY KEY,
+    cho_id TEXT NOT NULL,
+    data_provider TEXT,
+    edm_type TEXT,
+    rights TEXT,
+    fingerprint TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_cho_id ON records (cho_id);
+CREATE INDEX IF NOT EXISTS records_data_provider ON records (data_provider);
+CREATE INDEX IF NOT EXISTS records_edm_type ON records (edm_type);
+CREATE INDEX IF NOT EXISTS records_rights ON records (rights);
+"""
+
+UPSERT = """
+INSERT INTO records (id, cho_id, data_provider, edm_type, rights, fingerprint, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    cho_id = excluded.cho_id,
+    data_provider = excluded.data_provider,
+    edm_type = excluded.edm_type,
+    rights = excluded.rights,
+    fingerprint = excluded.fingerprint,
+    data = excluded.data
+WHERE records.fingerprint != excluded.fingerprint
+"""
+
+FILTER_COLUMNS = ("id", "cho_id", "data_provider", "edm_type", "rights")
+"""
+Columns that can be used as criteria in iter_records() and count().
+"""
+
+Row = Tuple[str, str, Optional[str], Optional[str], Optional[str], str, bytes]
+
+
+def to_row(record: EDM_Record) -> Row:
+    aggregation = record.aggregation
+    data_provider = aggregation.edm_dataProvider
+    return (
+        aggregation.id.value,
+        record.provided_cho.id.value,
+        data_provider.value if data_provider else None,
+        record.provided_cho.edm_type.value,
+        aggregation.edm_rights.value if aggregation.edm_rights else None,
+        record_fingerprint(record),
+        encode_record(record),
+    )
+
+
+class SQLiteRecordStore:
+    """
+    Stores records keyed by their aggregation id in a sqlite database file (or ":memory:").
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def __contains__(self, record_id: str) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM records WHERE id = ?", (record_id,)
+            ).fetchone()
+            is not None
+        )
+
+    def upsert(self, record: EDM_Record) -> bool:
+        """
+        Inserts or replaces a single record. Returns False if the stored record has the same fingerprint.
+        """
+        return self.upsert_many([record]) == 1
+
+    def upsert_many(self, records: Iterable[EDM_Record], batch_size: int = 1000) -> int:
+        """
+        Inserts or replaces records in transactions of batch_size records each.
+        Records whose fingerprint did not change are skipped. Returns the number of written records.
+        """
+        written = 0
+        batch: List[Row] = []
+        for record in records:
+            batch.append(to_row(record))
+            if len(batch) >= batch_size:
+                written += self._write_batch(batch)
+                batch = []
+        if batch:
+            written += self._write_batch(batch)
+        return written
+
+    def _write_batch(self, rows: List[Row]) -> int:
+        with self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(UPSERT, rows)
+            return self.connection.total_changes - before
+
+    def delete(self, record_id: str) -> bool:
+        with self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM records WHERE id = ?", (record_id,)
+            )
+        return cursor.rowcount > 0
+
+    def get(self, record_id: str) -> Optional[EDM_Record]:
+        row = self.connection.execute(
+            "SELECT data FROM records WHERE id = ?", (record_id,)
+        ).fetchone()
+        return decode_record(row[0]) if row else None
+
+    def get_by_cho(self, cho_id: str) -> Optional[EDM_Record]:
+        row = self.connection.execute(
+            "SELECT data FROM records WHERE cho_id = ?", (cho_id,)
+        ).fetchone()
+        return decode_record(row[0]) if row else None
+
+    def get_fingerprint(self, record_id: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT fingerprint FROM records WHERE id = ?", (record_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _where(self, criteria: dict) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for column, value in criteria.items():
+            if column not in FILTER_COLUMNS:
+                raise KeyError(
+                    f"Can't filter by {column}, use one of {FILTER_COLUMNS}."
+                )
+            clauses.append(f"{column} = ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def count(self, **criteria: str) -> int:
+        where, params = self._where(criteria)
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM records{where}", params
+        ).fetchone()[0]
+
+    def iter_ids(self, **criteria: str) -> Iterator[str]:
+        where, params = self._where(criteria)
+        for (record_id,) in self.connection.execute(
+            f"SELECT id FROM records{where} ORDER BY id", params
+        ):
+            yield record_id
+
+    def iter_records(
+        self, batch_size: int = 500, **criteria: str
+    ) -> Iterator[EDM_Record]:
+        """
+        Streams the matching records ordered by id. Rows are fetched in batches of batch_size and
+        only decoded when they are reached, so memory usage does not grow with the size of the store.
+        """
+        where, params = self._where(criteria)
+        cursor = self.connection.execute(
+            f"SELECT data FROM records{where} ORDER BY id", params
+        )
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for (data,) in rows:
+                    yield decode_record(data)
+        finally:
+            cursor.close()
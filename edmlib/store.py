@@ -0,0 +1,258 @@
+"""
+rdflib stores for the graphs of single records.
+
+EDMParserStore is a lean store for the graphs that are read by EDM_Parser.
+
+rdflib's default Memory store keeps three permutation indexes (spo, pos, osp) and the contexts of
+each triple. EDM_Parser only asks for all predicates and objects of a subject and for all subjects
+of an rdf:type, so EDMParserStore only keeps an index by subject and an index of the rdf:type
+statements. All other lookups scan the graph, which is still correct, but slow for large graphs.
+
+The store is registered as the rdflib store plugin "EDMParserStore", so any rdflib parser plugin
+can write into it:
+
+```
+parser = EDM_Parser.from_file("record.xml", store="EDMParserStore")
+graph = Graph(store="EDMParserStore").parse("record.ttl")
+```
+
+EDMRecordStore is a read-only view of an EDM_Record. Its triples are created on demand from the
+fields of the record, so a graph can be queried or serialized without copying every triple into a
+Memory store first, as EDM_Record.get_rdf_graph() does:
+
+```
+graph = Graph(store=EDMRecordStore(record))
+graph.query("SELECT ?title WHERE { ?cho dc:title ?title }")
+```
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+from rdflib import RDF, URIRef
+from rdflib.plugin import register
+from rdflib.store import Store
+from rdflib.term import Node
+
+from edmlib.edm import EDM_Namespace, EDM_Record
+from edmlib.edm.base import EDM_BaseClass
+
+_no_contexts: Tuple[()] = ()
+
+
+class NamespaceBindings:
+    """
+    Plain dict based namespace bindings for stores that are not derived from rdflib's Memory store.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._namespaces: Dict[str, URIRef] = {}
+        self._prefixes: Dict[URIRef, str] = {}
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        if not override and namespace in self._prefixes:
+            return
+        self._prefixes.pop(self._namespaces.pop(prefix, None), None)  # type: ignore
+        self._namespaces.pop(self._prefixes.pop(namespace, None), None)  # type: ignore
+        self._namespaces[prefix] = namespace
+        self._prefixes[namespace] = prefix
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        return self._prefixes.get(namespace)
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        yield from self._namespaces.items()
+
+
+class EDMParserStore(NamespaceBindings, Store):
+    """
+    Triples are kept as subject -> predicate -> objects, with dicts as insertion ordered sets,
+    plus rdf:type -> subjects. The store is not formula aware. It declares itself context aware,
+    so that the parsers of quad formats like TriG and JSON-LD accept it, but ignores the contexts:
+    the triples of all graphs are merged into one.
+    """
+
+    context_aware = True
+    formula_aware = False
+    graph_aware = False
+    transaction_aware = False
+
+    def __init__(
+        self, configuration: Optional[str] = None, identifier: Optional[Node] = None
+    ) -> None:
+        super().__init__(configuration=configuration, identifier=identifier)
+        self.subjects: Dict[Node, Dict[Node, Dict[Node, None]]] = {}
+        self.types: Dict[Node, Dict[Node, None]] = {}
+        self.length = 0
+
+    def add(self, triple: Any, context: Any = None, quoted: bool = False) -> None:
+        subject, predicate, obj = triple
+        objects = self.subjects.setdefault(subject, {}).setdefault(predicate, {})
+        if obj in objects:
+            return
+        objects[obj] = None
+        self.length += 1
+        if predicate == RDF.type:
+            self.types.setdefault(obj, {})[subject] = None
+
+    def remove(self, triple_pattern: Any, context: Any = None) -> None:
+        for (subject, predicate, obj), _ in list(self.triples(triple_pattern)):
+            predicates = self.subjects[subject]
+            del predicates[predicate][obj]
+            self.length -= 1
+            if not predicates[predicate]:
+                del predicates[predicate]
+            if not predicates:
+                del self.subjects[subject]
+            if predicate == RDF.type:
+                del self.types[obj][subject]
+                if not self.types[obj]:
+                    del self.types[obj]
+
+    def triples(self, triple_pattern: Any, context: Any = None) -> Iterator[Any]:
+        subject, predicate, obj = triple_pattern
+        if subject is not None:
+            yield from self._subject_triples(subject, predicate, obj)
+        elif predicate == RDF.type and obj is not None:
+            for subject in self.types.get(obj, ()):
+                yield (subject, predicate, obj), iter(_no_contexts)
+        else:
+            for subject in self.subjects:
+                yield from self._subject_triples(subject, predicate, obj)
+
+    def _subject_triples(
+        self, subject: Node, predicate: Optional[Node], obj: Optional[Node]
+    ) -> Iterator[Any]:
+        predicates = self.subjects.get(subject)
+        if not predicates:
+            return
+        if predicate is not None:
+            objects = predicates.get(predicate)
+            if not objects:
+                return
+            if obj is not None:
+                if obj in objects:
+                    yield (subject, predicate, obj), iter(_no_contexts)
+                return
+            for value in objects:
+                yield (subject, predicate, value), iter(_no_contexts)
+            return
+        for predicate, objects in predicates.items():
+            if obj is None:
+                for value in objects:
+                    yield (subject, predicate, value), iter(_no_contexts)
+            elif obj in objects:
+                yield (subject, predicate, obj), iter(_no_contexts)
+
+    def __len__(self, context: Any = None) -> int:
+        return self.length
+
+    def contexts(self, triple: Any = None) -> Iterator[Any]:
+        return iter(_no_contexts)
+
+
+register("EDMParserStore", Store, "edmlib.store", "EDMParserStore")
+
+_property_fields: Dict[type, Dict[URIRef, str]] = {}
+
+
+def get_property_fields(cls: Type[EDM_BaseClass]) -> Dict[URIRef, str]:
+    """
+    Maps the property IRIs of an edm-class to its field names.
+    """
+    if cls not in _property_fields:
+        _property_fields[cls] = {prop: name for name, prop in cls.get_rdf_terms()[1]}
+    return _property_fields[cls]
+
+
+class EDMRecordStore(NamespaceBindings, Store):
+    """
+    Read-only store that answers triple patterns from the fields of an EDM_Record. Nothing is
+    cached, so the store always reflects the current state of the record: a pattern with a
+    subject only looks at the instances with that id, a pattern with a predicate only at the
+    corresponding field.
+    """
+
+    context_aware = False
+    formula_aware = False
+    graph_aware = False
+    transaction_aware = False
+
+    def __init__(self, record: EDM_Record) -> None:
+        super().__init__()
+        self.record = record
+        for prefix, namespace in EDM_Namespace.get_namespace_tuples():
+            self.bind(prefix.lower(), URIRef(namespace))
+
+    def triples(self, triple_pattern: Any, context: Any = None) -> Iterator[Any]:
+        subject, predicate, obj = triple_pattern
+        for instances in self._group_instances(subject).values():
+            for triple in self._subject_triples(instances, predicate, obj):
+                yield triple, iter(_no_contexts)
+
+    def _group_instances(
+        self, subject: Optional[Node]
+    ) -> Dict[str, List[EDM_BaseClass]]:
+        """
+        Returns the instances of the record by id. Instances that share an id are one subject in
+        the graph.
+        """
+        groups: Dict[str, List[EDM_BaseClass]] = {}
+        for instance in self.record.iter_instances():
+            if subject is not None and (
+                not isinstance(subject, URIRef) or instance.id.value != str(subject)
+            ):
+                continue
+            groups.setdefault(instance.id.value, []).append(instance)
+        return groups
+
+    def _subject_triples(
+        self,
+        instances: List[EDM_BaseClass],
+        predicate: Optional[Node],
+        obj: Optional[Node],
+    ) -> Iterator[Tuple[Node, Node, Node]]:
+        subject = URIRef(instances[0].id.value)
+        if predicate is None or predicate == RDF.type:
+            class_refs = {instance.get_rdf_terms()[0]: None for instance in instances}
+            for class_ref in class_refs:
+                if obj is None or obj == class_ref:
+                    yield subject, RDF.type, class_ref
+            if predicate is not None:
+                return
+        properties: Dict[Node, List[Tuple[EDM_BaseClass, str]]] = {}
+        for instance in instances:
+            fields = get_property_fields(instance.__class__)
+            if predicate is None:
+                for prop, name in fields.items():
+                    properties.setdefault(prop, []).append((instance, name))
+            elif predicate in fields:
+                name = fields[predicate]  # type: ignore
+                properties.setdefault(predicate, []).append((instance, name))
+        for prop, names in properties.items():
+            # like in a graph, equal values of a property of a subject are only contained once
+            seen: Set[Node] = set()
+            for instance, name in names:
+                values = getattr(instance, name)
+                if not values:
+                    continue
+                for value in values if isinstance(values, list) else [values]:
+                    term = value.to_rdflib()
+                    if (obj is None or term == obj) and term not in seen:
+                        seen.add(term)
+                        yield subject, prop, term
+
+    def __len__(self, context: Any = None) -> int:
+        return sum(1 for _ in self.triples((None, None, None)))
+
+    def add(self, triple: Any, context: Any = None, quoted: bool = False) -> None:
+        raise TypeError("EDMRecordStore is read-only, change the EDM_Record instead.")
+
+    def remove(self, triple_pattern: Any, context: Any = None) -> None:
+        raise TypeError("EDMRecordStore is read-only, change the EDM_Record instead.")
+
+    def contexts(self, triple: Any = None) -> Iterator[Any]:
+        return iter(_no_contexts)
@@ -0,0 +1,51 @@
+import pytest
+from rdflib import Dataset, Graph, URIRef
+
+from edmlib import EDM_Parser
+from edmlib.edm import add_records_to_graph
+
+
+@pytest.fixture
+def records(xml_string):
+    content = xml_string.decode("utf-8")
+    return [
+        EDM_Parser.from_string(content.replace("000056bf", f"{i:08d}")).parse()
+        for i in range(3)
+    ]
+
+
+def test_instance_triples_match_get_triples(records):
+    for instance in records[0].iter_instances():
+        assert list(instance.iter_rdf_triples()) == instance.get_triples()
+
+
+def test_add_to_graph(records):
+    graph = Graph()
+    records[0].add_to_graph(graph)
+    records[0].add_to_graph(graph)
+    assert set(graph) == set(records[0].get_rdf_graph())
+    assert graph.store.prefix(URIRef("http://www.europeana.eu/schemas/edm/")) == "edm"
+
+
+def test_add_records_to_graph(records):
+    graph = Graph()
+    assert add_records_to_graph(records, graph) == len(records)
+
+    expected = Graph()
+    for record in records:
+        expected += record.get_rdf_graph()
+    assert set(graph) == set(expected)
+
+
+def test_add_records_to_named_graph(records):
+    dataset = Dataset()
+    name = URIRef("http://example.org/graph/batch-1")
+    add_records_to_graph(records, dataset, context=dataset.graph(name))
+    expected = Graph()
+    for record in records:
+        expected += record.get_rdf_graph()
+    assert set(dataset.graph(name)) == set(expected)
+    assert len(dataset.default_context) == 0
+
+    with pytest.raises(ValueError):
+        records[0].add_to_graph(Graph(), context=dataset.graph(name))
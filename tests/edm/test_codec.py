@@ -0,0 +1,41 @@
+import pytest
+
+from edmlib import EDM_Parser, Lit
+from edmlib.edm.codec import CodecError, decode_record, encode_record
+
+
+def test_codec_roundtrip(xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    record.provided_cho.dc_description = [
+        Lit(value="Beschreibung", lang="de"),
+        Lit(value="1900", datatype="http://www.w3.org/2001/XMLSchema#gYear"),
+        Lit(value="plain", normalize=None),
+    ]
+    data = encode_record(record)
+
+    assert data.startswith(b"EDMC")
+    assert len(data) < len(record.model_dump_json(exclude_none=True))
+    decoded = decode_record(data)
+    assert decoded == record
+    assert decoded.model_dump() == record.model_dump()
+    assert decoded.serialize() == record.serialize()
+
+
+def test_codec_rejects_invalid_data(xml_string):
+    data = encode_record(EDM_Parser.from_string(xml_string).parse())
+    with pytest.raises(CodecError):
+        decode_record(b"<rdf:RDF/>")
+    with pytest.raises(CodecError):
+        decode_record(data[: len(data) // 2])
+
+
+def test_codec_rejects_corrupted_data(xml_string):
+    data = encode_record(EDM_Parser.from_string(xml_string).parse())
+    # the string table is cut off within its first string
+    with pytest.raises(CodecError, match="Truncated string table"):
+        decode_record(data[:8])
+    with pytest.raises(CodecError, match="trailing bytes"):
+        decode_record(data + b"\x00")
+    for end in range(5, len(data)):
+        with pytest.raises(CodecError):
+            decode_record(data[:end])
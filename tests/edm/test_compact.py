@@ -0,0 +1,74 @@
+import pickle
+
+import pytest
+
+from edmlib import EDM_Agent, EDM_Parser, Lit, ORE_Aggregation, Ref
+from edmlib.edm.codec import decode_record, encode_record
+from edmlib.edm.compact import CompactLit, CompactRef, compact, compact_record
+from edmlib.edm.diff import diff_records
+from edmlib.edm.fingerprint import record_fingerprint
+
+
+def test_compact_roundtrip():
+    ref = Ref(value="http://example.org/agent/1")
+    lit = Lit(value="1900", datatype="http://www.w3.org/2001/XMLSchema#gYear")
+
+    assert compact(ref) == CompactRef("http://example.org/agent/1")
+    assert compact(ref).to_ref() == ref
+    assert compact(lit).to_lit() == lit
+    assert compact(lit).to_rdflib() == lit.to_rdflib()
+    assert pickle.loads(pickle.dumps(compact(lit))) == compact(lit)
+    assert len({compact(lit), CompactLit("1900", datatype=lit.datatype)}) == 1
+    with pytest.raises(AttributeError):
+        compact(ref).value = "http://example.org/other"
+
+
+def test_compact_values_are_kept_by_edm_classes():
+    agent = EDM_Agent(
+        id=CompactRef("http://example.org/agent/1"),
+        skos_prefLabel=[CompactLit("Jemand", lang="de")],
+        dc_date=[CompactRef("http://example.org/date"), CompactLit("1900")],
+    )
+    full = EDM_Agent(
+        id=Ref(value="http://example.org/agent/1"),
+        skos_prefLabel=[Lit(value="Jemand", lang="de")],
+        dc_date=[Ref(value="http://example.org/date"), Lit(value="1900")],
+    )
+    assert [type(value) for value in agent.dc_date] == [CompactRef, CompactLit]
+    assert agent.id == full.id
+    assert agent.skos_prefLabel == full.skos_prefLabel
+    assert agent.model_dump_json() == full.model_dump_json()
+    assert set(agent.get_triples()) == set(full.get_triples())
+
+
+def test_compact_rights_are_normalized():
+    aggregation = ORE_Aggregation(
+        id=CompactRef("http://example.org/aggregation/1"),
+        edm_aggregatedCHO=CompactRef("http://example.org/cho/1"),
+        edm_dataProvider=CompactLit("Provider"),
+        edm_provider=CompactLit("Provider"),
+        edm_isShownAt=CompactRef("http://example.org/page/1"),
+        edm_isShownBy=CompactRef("http://example.org/image/1"),
+        edm_rights=CompactRef("https://creativecommons.org/publicdomain/zero/1.0/"),
+    )
+    assert aggregation.edm_rights == CompactRef(
+        "http://creativecommons.org/publicdomain/zero/1.0/"
+    )
+
+
+def test_compact_record(xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    full = EDM_Parser.from_string(xml_string).parse()
+    compacted = compact_record(record)
+
+    assert compacted is record
+    assert isinstance(record.provided_cho.id, CompactRef)
+    assert all(
+        isinstance(value, (CompactRef, CompactLit))
+        for value in record.provided_cho.dc_title or []
+    )
+    assert record.model_dump_json() == full.model_dump_json()
+    assert record_fingerprint(record) == record_fingerprint(full)
+    assert diff_records(full, record).is_empty
+    assert decode_record(encode_record(record)) == full
+    assert pickle.loads(pickle.dumps(record)) == full
@@ -0,0 +1,69 @@
+from typing import Annotated, List, Optional
+
+import pytest
+from pydantic import BaseModel
+from rdflib import Graph
+
+from edmlib import EDM_Agent, EDM_Parser, Lit, MixedValuesList, Ref
+from edmlib.edm.diff import _is_many, diff_records
+
+
+def test_diff_and_apply(xml_string):
+    old = EDM_Parser.from_string(xml_string).parse()
+    new = EDM_Parser.from_string(xml_string).parse()
+    new.provided_cho.dc_title = [Lit(value="Neuer Titel", lang="de")]
+    new.skos_concept = None
+    new.edm_agent = (new.edm_agent or []) + [
+        EDM_Agent(
+            id=Ref(value="http://example.org/agent/1"),
+            skos_prefLabel=[Lit(value="Jemand", lang="de")],
+        )
+    ]
+
+    changeset = diff_records(old, new)
+    assert not changeset.is_empty
+    assert [e.cls for e in changeset.added_entities] == ["EDM_Agent"]
+    assert [e.cls for e in changeset.removed_entities] == ["SKOS_Concept"]
+
+    patched = changeset.apply(old)
+    assert patched.get_fingerprint() == new.get_fingerprint()
+    assert old.get_fingerprint() != new.get_fingerprint()
+    assert new.diff(patched).is_empty
+
+    added, removed = changeset.get_triples()
+    old_graph, new_graph = old.get_rdf_graph(), new.get_rdf_graph()
+    assert set(new_graph - old_graph) == set(added)
+    assert set(old_graph - new_graph) == set(removed)
+
+    update = changeset.to_sparql_update()
+    assert update.startswith("DELETE DATA {") and "INSERT DATA {" in update
+    added_nt, removed_nt = changeset.to_ntriples()
+    assert len(Graph().parse(data=added_nt, format="nt")) == len(added)
+
+
+class ListLike(BaseModel):
+    value: str = ""
+
+
+class Annotations(BaseModel):
+    builtin: list[Lit] | None = None
+    typing_list: Optional[List[Ref]] = None
+    annotated: Annotated[List[Lit], "note"] = []
+    mixed: MixedValuesList | None = None
+    single: Optional[Lit] = None
+    list_like: Optional[ListLike] = None
+
+
+@pytest.mark.parametrize(
+    "field_name,many",
+    [
+        ("builtin", True),
+        ("typing_list", True),
+        ("annotated", True),
+        ("mixed", True),
+        ("single", False),
+        ("list_like", False),
+    ],
+)
+def test_is_many(field_name, many):
+    assert _is_many(Annotations, field_name) is many
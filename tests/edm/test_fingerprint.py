@@ -0,0 +1,40 @@
+from edmlib import EDM_Parser, Lit
+from edmlib.edm.fingerprint import (
+    FingerprintManifest,
+    raw_fingerprint,
+    record_fingerprint,
+)
+
+
+def test_record_fingerprint_is_independent_of_serialization(xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    reparsed = EDM_Parser.from_string(
+        record.serialize(format="nt"), format="nt"
+    ).parse()
+
+    assert raw_fingerprint(xml_string) != raw_fingerprint(
+        record.serialize(format="nt").encode()
+    )
+    assert record_fingerprint(record) == record_fingerprint(reparsed)
+    assert record.get_fingerprint() == record_fingerprint(record)
+
+    reparsed.provided_cho.dc_title = [Lit(value="Changed", lang="de")]
+    assert record_fingerprint(record) != record_fingerprint(reparsed)
+
+
+def test_fingerprint_manifest_roundtrip(tmp_path):
+    path = tmp_path / "manifest.tsv"
+    manifest = FingerprintManifest(path)
+    manifest.update("http://example.org/agg/1", "fp-1", raw="raw-1")
+    manifest.update("http://example.org/agg/2", "fp-2")
+    manifest.save()
+
+    restored = FingerprintManifest(path)
+    assert len(restored) == 2
+    assert restored.has_raw("raw-1")
+    assert restored.is_unchanged("http://example.org/agg/1", "fp-1")
+    assert not restored.is_unchanged("http://example.org/agg/2", "fp-3")
+
+    restored.update("http://example.org/agg/1", "fp-4", raw="raw-4")
+    assert not restored.has_raw("raw-1")
+    assert restored.get("http://example.org/agg/1") == ("raw-4", "fp-4")
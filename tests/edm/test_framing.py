@@ -0,0 +1,81 @@
+import json
+
+import pytest
+from pyld import jsonld
+from pyld.jsonld import JsonLdProcessor
+
+from edmlib import EDM_Parser
+from edmlib.edm import framing
+from edmlib.edm.framing import get_framer
+
+FRAME = {
+    "@context": {
+        "edm": "http://www.europeana.eu/schemas/edm/",
+        "ore": "http://www.openarchives.org/ore/terms/",
+        "Aggregation": "ore:Aggregation",
+        "WebResource": "edm:WebResource",
+        "isShownBy": {"@id": "edm:isShownBy", "@type": "@id"},
+        "hasView": {"@id": "edm:hasView", "@type": "@id"},
+    },
+    "@type": "Aggregation",
+    "isShownBy": {"@type": {"@default": "WebResource"}},
+}
+
+
+@pytest.fixture
+def documents(xml_string):
+    graph = EDM_Parser.from_string(xml_string).parse().get_rdf_graph()
+    return (
+        json.loads(graph.serialize(format="json-ld")),
+        json.loads(graph.serialize(format="json-ld", auto_compact=True)),
+    )
+
+
+@pytest.mark.parametrize("options", [None, {"embed": "@always", "base": ""}])
+def test_framer_matches_pyld(documents, options):
+    framer = get_framer(FRAME, options)
+    for document in documents:
+        assert framer.frame(document) == jsonld.frame(document, FRAME, options)
+
+
+def test_framer_falls_back_without_pyld_internals(documents, monkeypatch):
+    monkeypatch.setattr(framing, "HAS_PYLD_INTERNALS", False)
+    monkeypatch.setattr(
+        framing.JsonLdFramer,
+        "prepare",
+        lambda self: pytest.fail("the frame was preprocessed"),
+    )
+    framer = get_framer(FRAME, {"embed": "@always"})
+    assert framer.frame(documents[0]) == jsonld.frame(
+        documents[0], FRAME, {"embed": "@always"}
+    )
+
+
+def test_context_is_processed_once(documents, monkeypatch):
+    calls = []
+    process_context = JsonLdProcessor.process_context
+
+    def counting(self, active_ctx, local_ctx, options, **kwargs):
+        calls.append(local_ctx)
+        return process_context(self, active_ctx, local_ctx, options, **kwargs)
+
+    monkeypatch.setattr(JsonLdProcessor, "process_context", counting)
+    framer = get_framer(FRAME, {"embed": "@never"})
+    framer.frame(documents[0])
+    first = len(calls)
+    framer.frame(documents[0])
+    framer.frame(documents[0])
+    assert first > 0
+    assert len(calls) == first
+
+
+def test_framer_cache_key():
+    reordered = dict(reversed(list(FRAME.items())))
+    assert get_framer(reordered, {"embed": "@once"}) is get_framer(
+        FRAME, {"embed": "@once"}
+    )
+    assert get_framer(FRAME, {"embed": "@once"}) is not get_framer(
+        FRAME, {"embed": "@last"}
+    )
+    changed = {**FRAME, "@type": "WebResource"}
+    assert get_framer(changed) is not get_framer(FRAME)
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+
+from edmlib import (
+    EDM_Parser,
+    EDM_Record,
+    EDM_ProvidedCHO,
+    ORE_Aggregation,
+    EDM_Agent,
+    EDM_Place,
+    Ref,
+    Lit,
+)
+from edmlib.edm.validation.integrity import check_referential_integrity
+
+examples = Path(__file__).parents[2] / "examples"
+
+
+def _record(**kwargs) -> EDM_Record:
+    return EDM_Record(
+        provided_cho=EDM_ProvidedCHO(
+            id=Ref(value="http://uri.test/edm123#CHO"),
+            dc_type=[Lit(value="Text", lang="en")],
+            dc_title=[Lit(value="Titel", lang="de")],
+            dc_identifier=[Lit(value="123")],
+            dc_creator=[Ref(value="http://uri.test/agent/1"), Lit(value="Anonymous")],
+            dcterms_spatial=[Ref(value="http://uri.test/place/missing")],
+            edm_type=Lit(value="IMAGE"),
+        ),
+        aggregation=ORE_Aggregation(
+            id=Ref(value="http://uri.test/edm123#Aggregation"),
+            edm_aggregatedCHO=Ref(value="http://uri.test/edm123#CHO"),
+            edm_dataProvider=Lit(value="Test"),
+            edm_isShownAt=Ref(value="http://uri.test/edm123.jpg"),
+            edm_isShownBy=Ref(value="http://uri.test/edm123.jpg"),
+            edm_provider=Lit(value="Kulturpool"),
+            edm_rights=Ref(value="http://creativecommons.org/licenses/by-nc-sa/4.0/"),
+        ),
+        **kwargs,
+    )
+
+
+def test_referential_integrity_reports_dangling_and_unused():
+    record = _record(
+        edm_agent=[EDM_Agent(id=Ref(value="http://uri.test/agent/1"))],
+        edm_place=[EDM_Place(id=Ref(value="http://uri.test/place/unused"))],
+    )
+    report = check_referential_integrity(
+        record, {"dc_creator": ("EDM_Agent",), "dcterms_spatial": ("EDM_Place",)}
+    )
+
+    assert not report.is_valid
+    assert [(el.property, el.value) for el in report.dangling] == [
+        ("dcterms_spatial", "http://uri.test/place/missing")
+    ]
+    assert [el.id for el in report.unused] == ["http://uri.test/place/unused"]
+
+
+def test_referential_integrity_expected_class_mismatch():
+    record = _record(
+        edm_place=[EDM_Place(id=Ref(value="http://uri.test/agent/1"))],
+    )
+    report = record.check_referential_integrity()
+    dangling = {(el.property, el.value) for el in report.dangling}
+    assert ("dc_creator", "http://uri.test/agent/1") in dangling
+    # external rights statements and vocabularies are not expected within the record
+    assert ("edm_rights", "http://creativecommons.org/licenses/by-nc-sa/4.0/") not in (
+        dangling
+    )
+    assert ("dcterms_spatial", "http://uri.test/place/missing") in dangling
+    assert not report.unused
+
+
+def test_referential_integrity_ignores_external_references(xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    assert not record.check_referential_integrity().dangling
+
+    record.provided_cho.dc_subject = [Ref(value="http://vocab.getty.edu/aat/missing")]
+    assert not record.check_referential_integrity().dangling
+    record.provided_cho.dc_subject = [Ref(value=record.aggregation.id.value + "/x")]
+    assert [el.property for el in record.check_referential_integrity().dangling] == [
+        "dc_subject"
+    ]
+
+
+@pytest.mark.parametrize("name", ["minimal.xml", "full.xml"])
+def test_referential_integrity_of_examples(name):
+    record = EDM_Parser.from_file(str(examples / name)).parse()
+    report = record.check_referential_integrity()
+    assert report.dangling == []
+    assert report.unused == []
+
+
+def test_referential_integrity_reports_links_to_other_classes():
+    record = _record(
+        edm_place=[EDM_Place(id=Ref(value="http://uri.test/edm123.jpg"))],
+    )
+    dangling = {
+        (el.property, el.value) for el in record.check_referential_integrity().dangling
+    }
+    assert ("edm_isShownBy", "http://uri.test/edm123.jpg") in dangling
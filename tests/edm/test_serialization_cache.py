@@ -0,0 +1,65 @@
+import gc
+
+import pytest
+
+from edmlib import EDM_Parser
+from edmlib.edm import Lit
+from edmlib.edm.serialization_cache import _caches, get_cache
+
+
+@pytest.fixture
+def record(xml_string):
+    return EDM_Parser.from_string(xml_string).parse()
+
+
+def test_cache_is_disabled_by_default(record):
+    assert get_cache(record) is None
+    assert record.get_rdf_graph() is not record.get_rdf_graph()
+    assert record.serialize() == record.serialize()
+
+
+def test_outputs_are_cached_per_key(record):
+    record.enable_serialization_cache()
+    cache = get_cache(record)
+    xml = record.serialize()
+    assert record.serialize() is xml
+    turtle = record.serialize(format="turtle")
+    assert turtle != xml
+    assert record.serialize(format="turtle") is turtle
+    assert record.get_rdf_graph() is record.get_rdf_graph()
+    assert record.get_rdf_graph(relative=True) is not record.get_rdf_graph()
+    assert cache.hits > 0
+
+    record.disable_serialization_cache()
+    assert get_cache(record) is None
+    assert record.serialize() == xml
+    assert record.serialize() is not xml
+
+
+def test_nested_changes_invalidate_the_cache(record):
+    record.enable_serialization_cache()
+    xml = record.serialize()
+
+    record.provided_cho.dc_title = [Lit(value="Neuer Titel", lang="de")]
+    assert "Neuer Titel" in record.serialize()
+
+    record.provided_cho.dc_title.append(Lit(value="Zweiter Titel", lang="de"))
+    assert "Zweiter Titel" in record.serialize()
+
+    record.aggregation.edm_dataProvider.value = "Anderer Datengeber"
+    assert "Anderer Datengeber" in record.serialize()
+
+    assert record.serialize() != xml
+    assert record.serialize() == record.model_copy(deep=True).serialize()
+
+
+def test_cache_is_not_part_of_the_record(xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    record.enable_serialization_cache().serialize()
+    assert record == EDM_Parser.from_string(xml_string).parse()
+    assert get_cache(record.model_copy()) is None
+
+    count = len(_caches)
+    del record
+    gc.collect()
+    assert len(_caches) == count - 1
@@ -60,3 +60,8 @@ def get_record_with_https_edm_rights(parser_files) -> bytes:
 @fixture(scope="session")
 def get_record_with_http_edm_rights(parser_files) -> bytes:
     return _get_bytes(parser_files / "record-with-http-edm-rights.xml")
+
+
+@fixture(scope="session")
+def record_with_multiple_errors(parser_files) -> bytes:
+    return _get_bytes(parser_files / "record-with-multiple-errors.xml")
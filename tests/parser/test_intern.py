@@ -0,0 +1,28 @@
+from edmlib import EDM_Parser
+from edmlib.edm.intern import InternTable
+
+
+def test_parsers_share_intern_table(xml_string):
+    table = InternTable()
+    first = EDM_Parser.from_string(xml_string, intern_table=table).parse()
+    second = EDM_Parser.from_string(xml_string, intern_table=table).parse()
+
+    assert first == EDM_Parser.from_string(xml_string).parse()
+    assert (
+        first.aggregation.edm_dataProvider.value
+        is second.aggregation.edm_dataProvider.value
+    )
+    assert first.provided_cho.dc_title[0].lang is second.provided_cho.dc_title[0].lang
+    assert first.provided_cho.id.value is not second.provided_cho.id.value
+
+    stats = table.stats()
+    assert stats.hits > 0 and stats.saved_bytes > 0
+    assert stats.size == stats.misses
+
+
+def test_intern_table_is_bounded():
+    table = InternTable(max_size=2)
+    for value in ["a", "b", "c", "a"]:
+        table.intern(value)
+    assert len(table) == 2
+    assert table.stats().evictions == 2
@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from edmlib import EDM_JSONLD_Parser, EDM_Parser, Lit, Ref
+from edmlib.jsonld_parser import UnknownShape
+
+EXAMPLES = Path(__file__).parents[2] / "examples"
+
+
+def test_parse_compacted_minimal_record():
+    record = EDM_JSONLD_Parser.from_file(EXAMPLES / "minimal.json").parse_direct()
+
+    assert record.provided_cho.id == Ref(value="http://uri.test/edm123#CHO")
+    assert record.provided_cho.dc_title == [Lit(value="Titel")]
+    assert record.provided_cho.edm_type == Lit(value="TEXT")
+    assert record.aggregation.edm_isShownAt == Ref(value="http://uri.test/edm123.jpg")
+    assert record.aggregation.edm_rights == Ref(
+        value="http://creativecommons.org/licenses/by-nc-sa/4.0/"
+    )
+    assert record.aggregation.edm_provider == Lit(value="Kulturpool", lang="de")
+    assert [wr.id.value for wr in record.web_resource] == ["http://uri.test/edm123.jpg"]
+
+
+def test_parse_compacted_full_record():
+    record = EDM_JSONLD_Parser.from_file(EXAMPLES / "full.json").parse_direct()
+
+    assert record.aggregation.edm_aggregatedCHO == record.provided_cho.id
+    assert record.provided_cho.dc_creator[0] == Ref(
+        value="http://uri.test/agents#creator"
+    )
+    assert record.edm_agent and record.edm_place and record.edm_time_span
+    assert record.skos_concept and record.cc_license and record.svcs_service
+    assert len(record.web_resource) == 3
+
+
+def test_unknown_shape_falls_back_to_rdflib():
+    # expanded json-ld without the kulturpool context
+    record = EDM_Parser.from_file(EXAMPLES / "minimal.xml", format="xml").parse()
+    data = json.loads(record.get_rdf_graph().serialize(format="json-ld"))
+    assert "@context" not in data
+
+    parser = EDM_JSONLD_Parser(data)
+    assert not parser.is_known_context()
+    assert parser.parse() == record
+
+
+def test_unknown_key_is_not_mapped_directly():
+    data = json.loads((EXAMPLES / "minimal.json").read_text())
+    data["aggregatedCHO"]["unknownKey"] = "value"
+
+    with pytest.raises(UnknownShape):
+        EDM_JSONLD_Parser(data).parse_direct()
@@ -0,0 +1,25 @@
+from edmlib import EDM_Parser
+
+
+def test_parse_include(xml_string):
+    parser = EDM_Parser.from_string(xml_string)
+    full = parser.parse()
+    partial = parser.parse(include=["web_resource"])
+
+    assert partial.provided_cho == full.provided_cho
+    assert partial.web_resource == full.web_resource
+    assert partial.edm_agent is None and partial.svcs_service is None
+
+
+def test_lazy_record_extracts_sections_on_access(xml_string):
+    parser = EDM_Parser.from_string(xml_string)
+    view = parser.lazy()
+    assert view.parsed_sections == []
+
+    assert view.provided_cho.dc_title[0].value == "Die Erweckung des Lazarus"
+    assert view.aggregation.edm_dataProvider.value == "Albertina"
+    assert view.parsed_sections == ["provided_cho", "aggregation"]
+    assert view.provided_cho is view.provided_cho
+
+    assert view.to_record() == parser.parse()
+    assert len(view.parsed_sections) == 9
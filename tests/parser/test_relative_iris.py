@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from rdflib import URIRef
+
+from edmlib import EDM_JSONLD_Parser, EDM_Parser
+from edmlib.bulk import dump_record
+from edmlib.edm.relative import RELATIVE_BASE, relativize, resolve
+
+KULTURPOOL_ID = "https://id.kulturpool.at/000056bf-fe34-4e7f-ad3c-eb7bfff37c70"
+
+
+@pytest.fixture
+def relative_xml(xml_string) -> str:
+    return (
+        xml_string.decode("utf-8")
+        .replace(f"{KULTURPOOL_ID}/cho", "#CHO")
+        .replace(f"{KULTURPOOL_ID}/aggregation", "#Aggregation")
+        .replace("http://vocab.getty.edu/aat/300041273", "aat/300041273")
+    )
+
+
+@pytest.mark.parametrize(
+    "reference", ["#CHO", "cho1", "/relative/path", "?query", "http://uri.test/cho"]
+)
+def test_resolve_and_relativize(reference):
+    assert relativize(URIRef(resolve(reference))) == URIRef(reference)
+
+
+def test_parse_resolves_against_base(relative_xml):
+    record = EDM_Parser.from_string(relative_xml).parse()
+    assert record.provided_cho.id.value == RELATIVE_BASE + "#CHO"
+    assert record.aggregation.edm_aggregatedCHO.value == RELATIVE_BASE + "#CHO"
+    assert record.get_rdf_graph().value(
+        URIRef(RELATIVE_BASE + "#Aggregation"),
+        URIRef("http://www.europeana.eu/schemas/edm/aggregatedCHO"),
+    ) == URIRef(RELATIVE_BASE + "#CHO")
+
+
+def test_xml_keeps_relative_identifiers(relative_xml):
+    record = EDM_Parser.from_string(relative_xml).parse()
+    xml = record.serialize()
+    assert 'rdf:about="#CHO"' in xml
+    assert 'rdf:resource="#CHO"' in xml
+    assert 'rdf:about="aat/300041273"' in xml
+    assert "relative.invalid" not in xml
+    assert EDM_Parser.from_string(xml).parse() == record
+
+
+def test_json_ld_keeps_relative_identifiers(relative_xml):
+    record = EDM_Parser.from_string(relative_xml).parse()
+    content = dump_record(record, format="json-ld")
+    ids = {node["@id"] for node in json.loads(content)["@graph"]}
+    assert {"#CHO", "#Aggregation", "aat/300041273"} <= ids
+    assert "relative.invalid" not in content
+    assert EDM_JSONLD_Parser.from_string(content).parse() == record
+
+
+def test_literals_are_not_relativized(relative_xml):
+    value = f"see file:///tmp/{RELATIVE_BASE}#CHO"
+    record = EDM_Parser.from_string(
+        relative_xml.replace(
+            "<dc:title", f"<dc:description>{value}</dc:description><dc:title", 1
+        )
+    ).parse()
+    assert value in record.serialize()
@@ -0,0 +1,58 @@
+import pytest
+from rdflib import RDF, Dataset, Graph, URIRef
+
+from edmlib import EDM_Parser, ORE_Aggregation
+from edmlib.edm.fingerprint import record_fingerprint
+from edmlib.store import EDMParserStore
+
+
+def test_parse_with_store(xml_string):
+    parser = EDM_Parser.from_string(xml_string, store="EDMParserStore")
+    assert isinstance(parser.graph.store, EDMParserStore)
+    assert parser.parse() == EDM_Parser.from_string(xml_string).parse()
+
+
+def test_store_matches_memory_store(xml_string):
+    memory = Graph().parse(data=xml_string, format="xml")
+    graph = Graph(store="EDMParserStore").parse(
+        data=memory.serialize(format="nt"), format="nt"
+    )
+    assert len(graph) == len(memory)
+    assert set(graph) == set(memory)
+
+    aggregation = next(memory.subjects(RDF.type, ORE_Aggregation.get_class_ref()))
+    patterns = [
+        (aggregation, None, None),
+        (aggregation, RDF.type, None),
+        (None, RDF.type, ORE_Aggregation.get_class_ref()),
+        (None, RDF.type, None),
+        (None, None, aggregation),
+    ]
+    for pattern in patterns:
+        assert set(graph.triples(pattern)) == set(memory.triples(pattern))
+
+    graph.remove((aggregation, None, None))
+    memory.remove((aggregation, None, None))
+    assert set(graph) == set(memory)
+    assert list(graph.subjects(RDF.type, ORE_Aggregation.get_class_ref())) == []
+    assert graph.serialize(format="turtle")
+    assert (aggregation, None, None) not in graph
+    assert len(graph.store.subjects) == len(set(memory.subjects()))
+
+
+@pytest.mark.parametrize("format", ["json-ld", "trig"])
+def test_store_merges_named_graphs(xml_string, format):
+    memory = Graph().parse(data=xml_string, format="xml")
+    dataset = Dataset()
+    named = dataset.graph(URIRef("http://example.org/graph"))
+    for triple in memory:
+        named.add(triple)
+    data = dataset.serialize(format=format)
+
+    graph = Graph(store="EDMParserStore").parse(data=data, format=format)
+    assert set(graph) == set(memory)
+    # the order of the values depends on the serialization, so the records are compared unordered
+    parser = EDM_Parser.from_string(data, format=format, store="EDMParserStore")
+    assert record_fingerprint(parser.parse()) == record_fingerprint(
+        EDM_Parser.from_string(xml_string).parse()
+    )
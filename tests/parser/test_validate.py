@@ -0,0 +1,66 @@
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from edmlib import EDM_Parser, ORE_Aggregation
+from edmlib.edm.validation.issues import ISSUE_KIND, write_jsonl
+
+
+def test_validate_valid_record_has_no_issues(xml_string):
+    assert EDM_Parser.from_string(xml_string).validate() == []
+
+
+def test_validate_collects_all_issues(record_with_multiple_errors):
+    parser = EDM_Parser.from_string(record_with_multiple_errors)
+    with pytest.raises((ValidationError, AssertionError)):
+        parser.parse()
+
+    issues = parser.validate()
+    codes = {issue.code() for issue in issues}
+    assert codes == {
+        "cardinality:ORE_Aggregation.edm_isShownAt",
+        "conditional:ORE_Aggregation.*",
+        "rights:ORE_Aggregation.edm_rights",
+        "uri:EDM_ProvidedCHO.dc_relation",
+        "conditional:EDM_ProvidedCHO.*",
+        "language:EDM_ProvidedCHO.edm_type",
+        "language:SKOS_Concept.skos_prefLabel",
+    }
+    assert all(issue.record == "http://example.org/agg/errors" for issue in issues)
+
+
+def test_validate_structure_issue():
+    parser = EDM_Parser.from_string(
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/>'
+    )
+    issues = parser.validate()
+    assert [issue.kind for issue in issues] == [ISSUE_KIND.STRUCTURE] * 2
+    assert all(issue.record is None for issue in issues)
+
+
+def test_validation_issues_as_jsonl(record_with_multiple_errors):
+    issues = EDM_Parser.from_string(record_with_multiple_errors).validate()
+    fp = io.StringIO()
+    assert write_jsonl(issues, fp) == len(issues)
+    lines = fp.getvalue().splitlines()
+    assert len(lines) == len(issues)
+    assert json.loads(lines[0])["record"] == "http://example.org/agg/errors"
+
+
+def test_validate_reports_unexpected_validator_errors(
+    record_with_multiple_errors, monkeypatch
+):
+    decorator = ORE_Aggregation.__pydantic_decorators__.model_validators[
+        "validate_edm_rights"
+    ]
+
+    def broken(self):
+        raise TypeError("broken validator")
+
+    monkeypatch.setattr(decorator, "func", broken)
+    issues = EDM_Parser.from_string(record_with_multiple_errors).validate()
+    assert ("ORE_Aggregation", "TypeError: broken validator") in [
+        (issue.cls, issue.message) for issue in issues
+    ]
@@ -0,0 +1,197 @@
+import io
+import json
+import os
+from pathlib import Path
+
+from cachetools import LRUCache
+from pyld import jsonld
+
+from edmlib import EDM_Parser, EDM_Record
+from edmlib.bulk import (
+    export_records,
+    imap_bounded,
+    iter_changed,
+    load_record,
+    validate_feed,
+)
+from edmlib.edm import framing
+from edmlib.edm.fingerprint import FingerprintManifest, raw_fingerprint
+from edmlib.edm.record import edm_jsonld_frame
+
+parser_files = Path(__file__).parent / "parser" / "conftest-files"
+
+
+def test_validate_feed_streams_one_line_per_record(xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    sources = [
+        ("valid.xml", xml_string),
+        parser_files / "record-with-multiple-errors.xml",
+        record,
+        b"<not-xml",
+    ]
+    output = io.StringIO()
+    summary = validate_feed(sources, output)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["status"] for line in lines] == ["valid", "invalid", "valid", "failed"]
+    assert lines[0]["source"] == "valid.xml"
+    assert lines[1]["id"] == "http://example.org/agg/errors"
+    assert lines[2]["id"] == record.aggregation.id.value
+    assert lines[3]["errors"][0].startswith("failed:")
+
+    assert (summary.total, summary.valid, summary.invalid, summary.failed) == (
+        4,
+        2,
+        1,
+        1,
+    )
+    assert summary.error_counts["rights:ORE_Aggregation.edm_rights"] == 1
+    assert sum(summary.error_counts.values()) == len(lines[1]["errors"]) + 1
+
+
+def test_validate_feed_to_path(tmp_path, xml_string):
+    path = tmp_path / "report.jsonl"
+    summary = validate_feed(iter([xml_string] * 3), path)
+    assert summary.valid == 3
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_iter_changed_skips_unchanged_records(xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    reserialized = record.serialize(format="nt").encode()
+    manifest = FingerprintManifest()
+
+    changed = list(iter_changed([xml_string], manifest))
+    assert len(changed) == 1
+    manifest.update(
+        record.aggregation.id.value, changed[0].fingerprint, raw=changed[0].raw
+    )
+
+    # byte-identical: skipped before parsing, semantically identical: skipped after parsing
+    assert list(iter_changed([xml_string, ("rec.nt", reserialized)], manifest)) == []
+    assert manifest.has_raw(raw_fingerprint(reserialized))
+
+
+class WorkerCrash:
+    # kills the worker process that unpickles it
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def make_records(xml_string, count):
+    content = xml_string.decode("utf-8")
+    return [
+        EDM_Parser.from_string(content.replace("000056bf", f"{i:08d}")).parse()
+        for i in range(count)
+    ]
+
+
+def test_export_records_to_ndjson(tmp_path, xml_string):
+    records = make_records(xml_string, 5)
+    summary = export_records(
+        iter(records), tmp_path, format="json-ld", workers=2, max_in_flight=2
+    )
+    assert (summary.total, summary.exported, summary.failed) == (5, 5, 0)
+
+    lines = (tmp_path / "part-00000.jsonld").read_text().splitlines()
+    assert [load_record(line, format="json-ld") for line in lines] == records
+
+
+def test_export_records_reports_failures(tmp_path, xml_string):
+    records = make_records(xml_string, 3)
+    broken = records[1].model_copy(update={"web_resource": ["not a web resource"]})
+    errors = io.StringIO()
+    summary = export_records(
+        [records[0], broken, records[2]], tmp_path, format="xml", errors=errors
+    )
+    assert (summary.total, summary.exported, summary.failed) == (3, 2, 1)
+    assert summary.error_counts == {"AttributeError": 1}
+
+    failure = json.loads(errors.getvalue())
+    assert failure["index"] == 1
+    assert failure["id"] == records[1].aggregation.id.value
+    files = sorted(tmp_path.glob("record-*.xml"))
+    assert [EDM_Parser.from_file(str(path)).parse() for path in files] == [
+        records[0],
+        records[2],
+    ]
+
+
+def test_export_records_reports_failures_in_workers(tmp_path, xml_string):
+    class LocalRecord(EDM_Record):
+        pass
+
+    records = make_records(xml_string, 4)
+    unpicklable = LocalRecord.model_construct(**dict(records[1]))
+    broken = records[2].model_copy(update={"web_resource": ["not a web resource"]})
+    errors = io.StringIO()
+    summary = export_records(
+        [records[0], unpicklable, broken, records[3]],
+        tmp_path,
+        format="json-ld",
+        workers=2,
+        errors=errors,
+    )
+    assert (summary.total, summary.exported, summary.failed) == (4, 2, 2)
+    failures = [json.loads(line) for line in errors.getvalue().splitlines()]
+    assert [failure["index"] for failure in failures] == [1, 2]
+    assert failures[0]["id"] == records[1].aggregation.id.value
+    assert failures[1]["error"] == "AttributeError"
+
+    lines = (tmp_path / "part-00000.jsonld").read_text().splitlines()
+    assert [load_record(line, format="json-ld") for line in lines] == [
+        records[0],
+        records[3],
+    ]
+
+
+def test_imap_bounded_replaces_a_broken_pool():
+    results = imap_bounded(
+        abs,
+        [1, WorkerCrash(), -3, -4],
+        workers=2,
+        max_in_flight=1,
+        on_error=lambda item, e: e.__class__.__name__,
+    )
+    assert list(results) == [1, "BrokenProcessPool", 3, 4]
+
+
+def test_export_framed_json_ld(tmp_path, xml_string, monkeypatch):
+    context = {
+        "edm": "http://www.europeana.eu/schemas/edm/",
+        "ore": "http://www.openarchives.org/ore/terms/",
+        "Aggregation": "ore:Aggregation",
+        "WebResource": "edm:WebResource",
+        "isShownAt": {"@id": "edm:isShownAt", "@type": "@id"},
+        "isShownBy": {"@id": "edm:isShownBy", "@type": "@id"},
+        "hasView": {"@id": "edm:hasView", "@type": "@id"},
+        "isNextInSequence": {"@id": "edm:isNextInSequence", "@type": "@id"},
+    }
+
+    def load_document(url, options={}):
+        assert url == edm_jsonld_frame["@context"]
+        return {
+            "contextUrl": None,
+            "documentUrl": url,
+            "document": {"@context": context},
+        }
+
+    # the remote context and the framers are process-wide, keep them out of the other tests
+    monkeypatch.setattr(jsonld, "_default_document_loader", load_document)
+    monkeypatch.setattr(jsonld, "_resolved_context_cache", LRUCache(maxsize=10))
+    monkeypatch.setattr(framing, "_resolved_context_cache", LRUCache(maxsize=10))
+    monkeypatch.setattr(framing, "_framers", {})
+
+    records = make_records(xml_string, 2)
+    summary = export_records(records, tmp_path, format="framed-json-ld")
+    assert (summary.total, summary.exported, summary.failed) == (2, 2, 0)
+
+    lines = [
+        json.loads(line)
+        for line in (tmp_path / "part-00000.jsonld").read_text().splitlines()
+    ]
+    assert [line["@context"] for line in lines] == [edm_jsonld_frame["@context"]] * 2
+    assert [line["@type"] for line in lines] == ["Aggregation"] * 2
+    assert [line["@id"] for line in lines] == [
+        record.aggregation.id.value for record in records
+    ]
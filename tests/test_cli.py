@@ -0,0 +1,96 @@
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from edmlib import EDM_Parser
+from edmlib.bulk import load_record
+from edmlib.cli import main
+from edmlib.edm.fingerprint import record_fingerprint
+from edmlib.sources import iter_sources
+
+records = Path(__file__).parent / "parser" / "functional" / "xml"
+
+
+def test_iter_sources_directory_glob_and_zip(tmp_path):
+    archive = tmp_path / "records.zip"
+    with zipfile.ZipFile(archive, "w") as file:
+        for path in sorted(records.glob("rec_*.xml"))[:3]:
+            file.write(path, path.name)
+
+    names = [name for name, _ in iter_sources([str(records), str(archive)])]
+    assert len(names) == 11 + 3
+    assert names[-1] == f"{archive}:rec_10.xml"
+
+    names = [name for name, _ in iter_sources([str(records / "rec_1*.xml")])]
+    assert len(names) == 2
+
+
+def test_cli_validate(tmp_path, capsys):
+    report = tmp_path / "report.jsonl"
+    assert main(["validate", str(records), "--workers", "2", "-o", str(report)]) == 0
+    lines = [json.loads(line) for line in report.read_text().splitlines()]
+    assert len(lines) == 11
+    assert {line["status"] for line in lines} == {"valid"}
+    assert '"valid": 11' in capsys.readouterr().err
+
+
+def test_cli_convert_roundtrip(tmp_path):
+    json_dir = tmp_path / "json"
+    assert (
+        main(
+            [
+                "convert",
+                str(records),
+                "--to",
+                "json",
+                "-o",
+                str(json_dir),
+                "--shard-size",
+                "5",
+                "--quiet",
+            ]
+        )
+        == 0
+    )
+    shards = sorted(json_dir.iterdir())
+    assert [len(shard.read_text().splitlines()) for shard in shards] == [5, 5, 1]
+
+    xml_dir = tmp_path / "xml"
+    assert (
+        main(["convert", str(json_dir), "--to", "xml", "-o", str(xml_dir), "--quiet"])
+        == 0
+    )
+    assert len(list(xml_dir.glob("record-*.xml"))) == 11
+
+
+@pytest.mark.parametrize("to", ["json", "jsonld", "ntriples", "turtle"])
+def test_cli_convert_reads_shards(tmp_path, to):
+    shard_dir = tmp_path / to
+    args = ["convert", str(records), "--to", to, "-o", str(shard_dir), "--quiet"]
+    assert main(args) == 0
+    shards = list(shard_dir.iterdir())
+    assert len(shards) == 1
+
+    json_dir = tmp_path / "json"
+    args = ["convert", str(shards[0]), "--to", "json", "-o", str(json_dir), "--quiet"]
+    assert main(args) == 0
+    converted = [
+        load_record(line.encode(), format="json")
+        for line in (json_dir / "part-00000.jsonl").read_text().splitlines()
+    ]
+    expected = [
+        EDM_Parser.from_file(str(path)).parse()
+        for path in sorted(records.glob("rec_*.xml"))
+    ]
+    assert sorted(map(record_fingerprint, converted)) == sorted(
+        map(record_fingerprint, expected)
+    )
+
+
+def test_cli_stats(capsys):
+    assert main(["stats", str(records / "rec_1.xml"), "--quiet"]) == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["records"] == 1
+    assert stats["classes"]["ORE_Aggregation"] == 1
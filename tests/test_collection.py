@@ -0,0 +1,43 @@
+from edmlib import EDM_Parser, Lit, Ref
+from edmlib.collection import RecordCollection
+
+
+def make_record(xml_string, number, edm_type, rights, year):
+    record = EDM_Parser.from_string(xml_string).parse()
+    record.aggregation.id = Ref(value=f"http://example.org/agg/{number}")
+    record.provided_cho.edm_type = Lit(value=edm_type)
+    record.provided_cho.dcterms_created = [Lit(value=f"um {year}")]
+    record.aggregation.edm_rights = Ref(value=rights)
+    return record
+
+
+def test_record_collection_indexes(xml_string):
+    pdm = "http://creativecommons.org/publicdomain/mark/1.0/"
+    inc = "http://rightsstatements.org/vocab/InC/1.0/"
+    collection = RecordCollection(
+        [
+            make_record(xml_string, 1, "IMAGE", pdm, 1506),
+            make_record(xml_string, 2, "IMAGE", inc, 1920),
+            make_record(xml_string, 3, "TEXT", inc, 1920),
+        ]
+    )
+
+    assert len(collection) == 3
+    assert collection.count(data_provider="Albertina") == 3
+    assert collection.count(edm_type="IMAGE", rights=inc) == 1
+    assert collection.count(edm_type="VIDEO") == 0
+    assert [r.aggregation.id.value for r in collection.filter(year=1920)] == [
+        "http://example.org/agg/2",
+        "http://example.org/agg/3",
+    ]
+    assert collection.count(edm_type=["IMAGE", "TEXT"], language="de") == 3
+    assert collection.facets("edm_type", rights=inc) == {"IMAGE": 1, "TEXT": 1}
+
+    collection.remove("http://example.org/agg/2")
+    assert collection.facets("rights") == {pdm: 1, inc: 1}
+    assert "1920" in collection.indexes["year"]
+
+    collection.add(make_record(xml_string, 3, "SOUND", pdm, 1999))
+    assert len(collection) == 2
+    assert collection.facets("edm_type") == {"IMAGE": 1, "SOUND": 1}
+    assert "1920" not in collection.indexes["year"]
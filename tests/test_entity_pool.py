@@ -0,0 +1,81 @@
+import io
+import pickle
+
+import pytest
+from pydantic import ValidationError
+from rdflib import Graph
+
+from edmlib import EDM_Agent, EDM_Parser, EDM_Record, Lit, Ref
+from edmlib.entity_pool import EntityPool
+
+
+def make_record(xml_string, number):
+    record = EDM_Parser.from_string(xml_string).parse()
+    record.aggregation.id = Ref(value=f"http://example.org/agg/{number}")
+    return record
+
+
+def test_entity_pool_shares_entities(xml_string):
+    pool = EntityPool()
+    records = [pool.share(make_record(xml_string, number)) for number in range(3)]
+
+    assert records[0].edm_agent[0] is records[2].edm_agent[0]
+    assert records[0].edm_agent[0].label == "EDM_Agent"
+    assert isinstance(records[0].edm_agent[0], EDM_Agent)
+    with pytest.raises(ValidationError):
+        records[0].edm_agent[0].skos_prefLabel = [Lit(value="Other")]
+    EDM_Record.model_validate(records[0])
+
+    stats = pool.stats()
+    assert stats.hits == 2 * stats.misses
+    assert not pool.conflicts()
+    assert len(list(pool.shared_entities(min_usage=3))) == len(pool)
+
+    other = make_record(xml_string, 4)
+    other.edm_agent[0] = other.edm_agent[0].model_copy(
+        update={"skos_prefLabel": [Lit(value="Urs Graf")]}
+    )
+    pool.share(other)
+    assert pool.conflicts() == [("EDM_Agent", "http://d-nb.info/gnd/11869703X")]
+    assert len(pool.get("http://d-nb.info/gnd/11869703X")) == 2
+
+
+def test_entity_pool_writes_shared_entities_once(xml_string):
+    pool = EntityPool()
+    records = [pool.share(make_record(xml_string, number)) for number in range(3)]
+    output = io.StringIO()
+    written = pool.write_ntriples(records, output)
+
+    graph = Graph().parse(data=output.getvalue(), format="nt")
+    expected = Graph()
+    for record in records:
+        expected += record.get_rdf_graph()
+    assert set(graph) == set(expected)
+    shared = sum(len(entity.get_triples()) for entity in pool.shared_entities())
+    total = sum(len(record.get_rdf_graph()) for record in records)
+    assert written == total - 2 * shared
+
+
+def test_shared_entities_are_isolated_and_picklable(xml_string):
+    pool = EntityPool()
+    original = make_record(xml_string, 0)
+    agent = original.edm_agent[0]
+    record = pool.share(original.model_copy(deep=True))
+    shared = record.edm_agent[0]
+
+    agent.skos_prefLabel[0].value = "Anderer Name"
+    agent.skos_prefLabel.append(Lit(value="Noch ein Name"))
+    assert (
+        shared.skos_prefLabel == make_record(xml_string, 0).edm_agent[0].skos_prefLabel
+    )
+    with pytest.raises(TypeError):
+        shared.skos_prefLabel.append(Lit(value="Noch ein Name"))
+    with pytest.raises(AttributeError):
+        shared.skos_prefLabel[0].value = "Anderer Name"
+    with pytest.raises(AttributeError):
+        shared.id.value = "http://example.org/other"
+
+    restored = pickle.loads(pickle.dumps(record))
+    assert restored == record
+    assert type(restored.edm_agent[0]) is type(shared)
+    assert restored.model_copy(deep=True) == record
@@ -0,0 +1,78 @@
+import gzip
+import io
+import random
+
+import pytest
+
+from edmlib import EDM_Parser
+from edmlib.edm.fingerprint import record_fingerprint
+from edmlib.ntriples import NTriplesRecordReader
+
+
+@pytest.fixture
+def records(xml_string):
+    content = xml_string.decode("utf-8")
+    records = []
+    for i in range(10):
+        # distinct aggregations and providedCHOs, but shared agents, concepts and web resources
+        variant = content.replace("000056bf", f"{i:08d}")
+        records.append(EDM_Parser.from_string(variant).parse())
+    return records
+
+
+def get_lines(records):
+    return [
+        line
+        for record in records
+        for line in record.serialize(format="nt").splitlines()
+        if line.strip()
+    ]
+
+
+def read(lines, **kwargs):
+    stream = io.BytesIO(("\n".join(lines) + "\n").encode("utf-8"))
+    reader = NTriplesRecordReader(stream, **kwargs)
+    return reader, list(reader)
+
+
+def fingerprints(records):
+    return sorted(record_fingerprint(record) for record in records)
+
+
+def test_sorted_input(records):
+    reader, parsed = read(sorted(set(get_lines(records))), sorted=True, max_subjects=8)
+    assert fingerprints(parsed) == fingerprints(records)
+    assert reader.stats.records == len(records)
+
+
+def test_unsorted_input_is_rejected_in_sorted_mode(records):
+    lines = get_lines(records)
+    random.Random(1).shuffle(lines)
+    stream = io.BytesIO("\n".join(lines).encode("utf-8"))
+    with pytest.raises(ValueError):
+        list(NTriplesRecordReader(stream, sorted=True).iter_graphs())
+
+
+def test_unsorted_input(records):
+    lines = get_lines(records)
+    random.Random(1).shuffle(lines)
+    _, parsed = read(lines)
+    assert fingerprints(parsed) == fingerprints(records)
+
+
+def test_bounded_buffer(records):
+    # records are written one after another, each spans fewer than max_subjects / 2 subjects
+    reader, parsed = read(get_lines(records), max_subjects=20)
+    assert fingerprints(parsed) == fingerprints(records)
+    assert len(reader.subjects) <= 20
+
+
+def test_from_file(tmp_path, records):
+    path = tmp_path / "dump.nt.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.write("\n".join(sorted(set(get_lines(records)))))
+    with NTriplesRecordReader.from_file(path, sorted=True) as reader:
+        graphs = list(reader.iter_graphs())
+    assert sorted(str(aggregation) for aggregation, _ in graphs) == sorted(
+        record.aggregation.id.value for record in records
+    )
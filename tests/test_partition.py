@@ -0,0 +1,75 @@
+import pytest
+from rdflib import Graph, Literal, URIRef
+
+from edmlib import EDM_Parser
+from edmlib.edm.fingerprint import record_fingerprint
+from edmlib.partition import GraphPartitioner
+
+AGENT = URIRef("http://d-nb.info/gnd/11869703X")
+
+
+@pytest.fixture
+def records(xml_string):
+    content = xml_string.decode("utf-8")
+    return [
+        EDM_Parser.from_string(content.replace("000056bf", f"{i:08d}")).parse()
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def graph(records):
+    graph = Graph()
+    for record in records:
+        graph += record.get_rdf_graph()
+    return graph
+
+
+def test_partition_graph(graph, records):
+    partitioner = GraphPartitioner(graph)
+    assert len(partitioner) == len(records)
+
+    parsed = list(partitioner.iter_records())
+    assert sorted(map(record_fingerprint, parsed)) == sorted(
+        map(record_fingerprint, records)
+    )
+    assert partitioner.usage()[AGENT] == len(records)
+
+
+def test_view_is_read_only(graph, records):
+    partitioner = GraphPartitioner(graph)
+    view = partitioner.get_graph(partitioner.aggregations[0])
+    assert len(view) == len(records[0].get_rdf_graph())
+    assert view.serialize(format="turtle")
+
+    with pytest.raises(TypeError):
+        view.add((AGENT, AGENT, Literal("x")))
+
+
+def test_cyclic_context_entities(graph, records):
+    # two places that are part of each other, only one is referenced by the agent
+    place = URIRef("http://example.org/place/1")
+    other = URIRef("http://example.org/place/2")
+    part_of = URIRef("http://purl.org/dc/terms/isPartOf")
+    graph.add((AGENT, URIRef("http://rdvocab.info/ElementsGr2/placeOfBirth"), place))
+    graph.add((place, part_of, other))
+    graph.add((other, part_of, place))
+
+    partitioner = GraphPartitioner(graph)
+    subjects = partitioner.get_subjects(partitioner.aggregations[0])
+    assert {AGENT, place, other} <= subjects
+    assert partitioner.component[place] == partitioner.component[other]
+
+
+def test_long_chain_of_context_entities(graph):
+    # a chain of concepts, each a component of its own; the last one has no triples of its own
+    broader = URIRef("http://www.w3.org/2004/02/skos/core#broader")
+    concepts = [URIRef(f"http://example.org/concept/{i}") for i in range(5000)]
+    graph.add((AGENT, broader, concepts[0]))
+    for concept, other in zip(concepts, concepts[1:]):
+        graph.add((concept, broader, other))
+
+    partitioner = GraphPartitioner(graph)
+    assert len(partitioner.members) >= len(concepts) - 1
+    for aggregation in partitioner.aggregations:
+        assert set(concepts[:-1]) <= partitioner.get_subjects(aggregation)
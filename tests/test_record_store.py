@@ -0,0 +1,70 @@
+import pytest
+from rdflib import RDF, Graph, Literal, URIRef
+
+from edmlib import EDM_Parser, Lit
+from edmlib.store import EDMRecordStore
+
+DC_TITLE = URIRef("http://purl.org/dc/elements/1.1/title")
+
+
+@pytest.fixture
+def record(xml_string):
+    return EDM_Parser.from_string(xml_string).parse()
+
+
+def test_record_store_matches_rdf_graph(record):
+    graph = Graph(store=EDMRecordStore(record))
+    materialized = record.get_rdf_graph()
+    assert len(graph) == len(materialized)
+    assert set(graph) == set(materialized)
+
+    cho = URIRef(record.provided_cho.id.value)
+    for pattern in [
+        (cho, None, None),
+        (cho, DC_TITLE, None),
+        (None, DC_TITLE, None),
+        (None, RDF.type, record.provided_cho.get_class_ref()),
+        (None, None, URIRef(record.aggregation.edm_rights.value)),
+    ]:
+        assert set(graph.triples(pattern)) == set(materialized.triples(pattern))
+
+
+def test_record_store_query_and_serialize(record):
+    graph = Graph(store=EDMRecordStore(record))
+    titles = graph.query(
+        "SELECT ?title WHERE { ?cho a edm:ProvidedCHO ; dc:title ?title }"
+    )
+    assert [row[0] for row in titles] == [
+        lit.to_rdflib() for lit in record.provided_cho.dc_title
+    ]
+    assert (
+        Graph()
+        .parse(data=graph.serialize(format="nt"), format="nt")
+        .isomorphic(record.get_rdf_graph())
+    )
+
+
+def test_record_store_reflects_changes(record):
+    graph = Graph(store=EDMRecordStore(record))
+    record.provided_cho.dc_title = [Lit(value="Neu", lang="de")]
+    assert list(graph.objects(URIRef(record.provided_cho.id.value), DC_TITLE)) == [
+        Literal("Neu", lang="de")
+    ]
+    with pytest.raises(TypeError):
+        graph.add((URIRef(record.provided_cho.id.value), DC_TITLE, Literal("x")))
+
+
+def test_record_store_merges_instances_with_the_same_id(record):
+    agent = record.edm_agent[0]
+    record.edm_agent.append(
+        agent.model_copy(
+            update={
+                "skos_prefLabel": agent.skos_prefLabel + [Lit(value="Anderer Name")]
+            }
+        )
+    )
+    graph = Graph(store=EDMRecordStore(record))
+    materialized = record.get_rdf_graph()
+    assert len(graph) == len(materialized)
+    assert set(graph) == set(materialized)
+    assert len(list(graph.triples((URIRef(agent.id.value), RDF.type, None)))) == 1
@@ -0,0 +1,36 @@
+from edmlib import EDM_Parser, Ref
+from edmlib.sameas import SameAsIndex
+
+
+def test_sameas_index(tmp_path, xml_string):
+    record = EDM_Parser.from_string(xml_string).parse()
+    other = EDM_Parser.from_string(xml_string).parse()
+    other.edm_agent[0].id = Ref(value="http://www.wikidata.org/entity/Q123")
+    other.edm_agent[0].owl_sameAs = [
+        Ref(value="http://de.wikipedia.org/wiki/Urs_Graf_der_%C3%84ltere")
+    ]
+
+    index = SameAsIndex()
+    index.add_records([record, other])
+    gnd = "http://d-nb.info/gnd/11869703X"
+    wikidata = "http://www.wikidata.org/entity/Q123"
+
+    assert index.canonical(wikidata) == gnd
+    assert sorted(index.aliases(gnd)) == sorted(
+        [gnd, wikidata, "http://de.wikipedia.org/wiki/Urs_Graf_der_%C3%84ltere"]
+    )
+    assert index.is_same(gnd, wikidata)
+    assert index.canonical("http://example.org/unknown") == "http://example.org/unknown"
+
+    index.save(tmp_path / "sameas.tsv")
+    restored = SameAsIndex.load(tmp_path / "sameas.tsv")
+    assert list(restored.groups()) == list(index.groups())
+    assert restored.canonical(wikidata) == gnd
+
+
+def test_sameas_union_keeps_smallest_id_canonical():
+    index = SameAsIndex()
+    for number in range(100, 0, -1):
+        index.union(f"id:{number:03d}", f"id:{number - 1:03d}")
+    assert index.canonical("id:100") == "id:000"
+    assert len(index.aliases("id:050")) == 101
@@ -0,0 +1,74 @@
+import bz2
+import gzip
+import io
+import lzma
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from edmlib import EDM_Parser
+from edmlib import bulk
+from edmlib.bulk import validate_source
+from edmlib.sources import guess_format, iter_parsers, iter_sources
+
+
+@pytest.mark.parametrize(
+    "extension,compress",
+    [(".gz", gzip.compress), (".bz2", bz2.compress), (".xz", lzma.compress)],
+)
+def test_parse_compressed_file(tmp_path, xml_string, extension, compress):
+    path = tmp_path / f"record.xml{extension}"
+    path.write_bytes(compress(xml_string))
+
+    record = EDM_Parser.from_file(str(path)).parse()
+    assert record.provided_cho.id
+    assert validate_source(path)["status"] == "valid"
+
+
+def test_validate_source_streams_compressed_file(tmp_path, xml_string, monkeypatch):
+    path = tmp_path / "record.xml.gz"
+    path.write_bytes(gzip.compress(xml_string))
+
+    def read_source(source):
+        raise AssertionError("path sources are parsed from a stream")
+
+    monkeypatch.setattr(bulk, "read_source", read_source)
+    assert validate_source(path)["status"] == "valid"
+    assert validate_source(str(path), format="xml")["status"] == "valid"
+
+
+@pytest.mark.parametrize("mode", ["w", "w:gz", "w:xz"])
+def test_iter_parsers_tar(tmp_path, xml_string, mode):
+    path = tmp_path / f"records.tar{'.' + mode[2:] if ':' in mode else ''}"
+    with tarfile.open(path, mode) as archive:
+        for i in range(3):
+            info = tarfile.TarInfo(f"records/rec_{i}.xml.gz")
+            content = gzip.compress(xml_string)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+
+    names = []
+    for name, parser in iter_parsers([str(path)]):
+        names.append(name)
+        assert parser.parse().aggregation.id
+    assert names == [f"{path}:records/rec_{i}.xml.gz" for i in range(3)]
+
+
+def test_iter_sources_zip(tmp_path, xml_string):
+    path = tmp_path / "records.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("rec.xml", xml_string)
+        archive.writestr("rec.xml.bz2", bz2.compress(xml_string))
+        archive.writestr("readme.txt", b"not a record")
+
+    contents = [content for _, content in iter_sources([str(path)])]
+    assert contents == [xml_string, xml_string]
+
+
+def test_guess_format():
+    assert guess_format("records/rec_1.nt.gz") == "nt"
+    assert guess_format("rec.json", b'{"@context": "x"}') == "json-ld"
+    assert guess_format("rec.json", b'{"provided_cho": {}}') == "json"
+    assert guess_format(str(Path("rec.jsonld.zst"))) == "json-ld"
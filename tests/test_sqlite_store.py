@@ -0,0 +1,42 @@
+import pytest
+
+from edmlib import EDM_Parser, Lit, Ref
+from edmlib.sqlite_store import SQLiteRecordStore
+
+
+def make_record(xml_string, number, edm_type="IMAGE"):
+    record = EDM_Parser.from_string(xml_string).parse()
+    record.aggregation.id = Ref(value=f"http://example.org/agg/{number}")
+    record.provided_cho.edm_type = Lit(value=edm_type)
+    return record
+
+
+def test_sqlite_store(tmp_path, xml_string):
+    path = tmp_path / "records.sqlite"
+    records = [make_record(xml_string, number) for number in range(5)]
+    with SQLiteRecordStore(path) as store:
+        assert store.upsert_many(records, batch_size=2) == 5
+        # unchanged records are skipped, changed ones are replaced
+        assert store.upsert_many(records) == 0
+        assert store.upsert(make_record(xml_string, 1, edm_type="TEXT"))
+
+    with SQLiteRecordStore(path) as store:
+        assert len(store) == 5
+        assert "http://example.org/agg/1" in store
+        assert store.get("http://example.org/agg/0") == records[0]
+        assert store.get("http://example.org/agg/9") is None
+        assert store.get_fingerprint("http://example.org/agg/2") == (
+            records[2].get_fingerprint()
+        )
+        assert store.count(edm_type="IMAGE", data_provider="Albertina") == 4
+        assert [
+            record.provided_cho.edm_type.value
+            for record in store.iter_records(batch_size=2, edm_type="TEXT")
+        ] == ["TEXT"]
+        assert len(list(store.iter_records(batch_size=2))) == 5
+
+        assert store.delete("http://example.org/agg/0")
+        assert not store.delete("http://example.org/agg/0")
+        assert list(store.iter_ids())[0] == "http://example.org/agg/1"
+        with pytest.raises(KeyError):
+            store.count(title="x")